@@ -0,0 +1,589 @@
+# Copyright 2021, Digi International Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import asyncio
+import functools
+
+from digi.xbee.exception import XBeeException, TimeoutException, \
+    ATCommandException, OperationNotSupportedException, TransmitException
+from digi.xbee.models.address import XBee64BitAddress, XBee16BitAddress
+from digi.xbee.models.atcomm import ATCommand, ATCommandResponse, ATStringCommand
+from digi.xbee.models.options import TransmitOptions
+from digi.xbee.models.protocol import XBeeProtocol
+from digi.xbee.models.status import TransmitStatus
+from digi.xbee.packets.common import ATCommResponsePacket, \
+    RemoteATCommandResponsePacket, TransmitPacket
+from digi.xbee.packets.raw import TX64Packet, TX16Packet
+from digi.xbee.reader import CallbackDispatcher
+from digi.xbee.sender import FutureRequestSender
+
+
+def _get_running_loop():
+    """
+    Returns the event loop running the current coroutine.
+
+    Returns:
+        :class:`asyncio.AbstractEventLoop`: The running event loop.
+    """
+    # 'asyncio.get_running_loop()' is not available before Python 3.7
+    get_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+    return get_loop()
+
+
+class AsyncioDispatcher(CallbackDispatcher):
+    """
+    This dispatcher executes callbacks in an asyncio event loop, in the same
+    order they are dispatched. Coroutine functions are scheduled as tasks of
+    the loop.
+
+    .. seealso::
+       | :attr:`.XBeeDevice.callback_dispatcher`
+    """
+
+    def __init__(self, loop):
+        """
+        Class constructor. Instantiates a new :class:`.AsyncioDispatcher` with
+        the provided parameters.
+
+        Args:
+            loop (:class:`asyncio.AbstractEventLoop`): The event loop to
+                execute the callbacks.
+        """
+        self.__loop = loop
+
+    def dispatch(self, func, *args, **kwargs):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`.CallbackDispatcher.dispatch`
+        """
+        if self.__loop.is_closed():
+            return False
+
+        if asyncio.iscoroutinefunction(func):
+            future = asyncio.run_coroutine_threadsafe(
+                func(*args, **kwargs), self.__loop)
+            future.add_done_callback(
+                lambda fut: self.__execution_finished(func, fut))
+        else:
+            self.__loop.call_soon_threadsafe(
+                self.__execute, func, functools.partial(func, *args, **kwargs))
+
+        return True
+
+    def __execute(self, func, call):
+        """
+        Executes the callback in the event loop.
+
+        Args:
+            func (Function): The callback.
+            call (Function): The callback bound to its arguments.
+        """
+        try:
+            call()
+        except Exception as exc:
+            self._execution_failed(func, exc)
+
+    def __execution_finished(self, func, future):
+        """
+        Called when the coroutine of a callback has finished.
+
+        Args:
+            func (Function): The callback.
+            future (:class:`concurrent.futures.Future`): Future of the coroutine.
+        """
+        if not future.cancelled() and future.exception():
+            self._execution_failed(func, future.exception())
+
+
+class AsyncXBeeDevice:
+    """
+    This class provides an asyncio interface to a local :class:`.XBeeDevice`.
+
+    Requests that wait for a response (AT commands, data transmissions, ...)
+    do not block any thread: the packet listener of the XBee completes the
+    awaited response as soon as it is received. Blocking operations without
+    an asynchronous counterpart, such as opening the XBee, are run in an
+    executor.
+
+    The wrapped XBee can still be used through the blocking API.
+    """
+
+    def __init__(self, xbee, executor=None):
+        """
+        Class constructor. Instantiates a new :class:`.AsyncXBeeDevice` with
+        the provided parameters.
+
+        Args:
+            xbee (:class:`.XBeeDevice`): The local XBee to wrap.
+            executor (:class:`concurrent.futures.Executor`, optional,
+                default=`None`): Executor to run blocking operations. `None`
+                to use the default executor of the event loop.
+
+        Raises:
+            ValueError: If `xbee` is `None` or a remote XBee.
+
+        .. seealso::
+           | :class:`.XBeeDevice`
+        """
+        if xbee is None:
+            raise ValueError("XBee cannot be None")
+        if xbee.is_remote():
+            raise ValueError("XBee must be a local XBee")
+
+        self.__xbee = xbee
+        self.__executor = executor
+
+    def __str__(self):
+        return str(self.__xbee)
+
+    @property
+    def xbee(self):
+        """
+        Returns the wrapped local XBee.
+
+        Returns:
+            :class:`.XBeeDevice`: The local XBee.
+        """
+        return self.__xbee
+
+    async def run_in_executor(self, func, *args, **kwargs):
+        """
+        Runs the given blocking function in the executor of this object and
+        returns its result.
+
+        Args:
+            func (Function): The blocking function to run.
+            *args: Positional arguments of the function.
+            **kwargs: Keyword arguments of the function.
+
+        Returns:
+            The value returned by the function.
+        """
+        loop = _get_running_loop()
+        return await loop.run_in_executor(
+            self.__executor, functools.partial(func, *args, **kwargs))
+
+    async def open(self, force_settings=False):
+        """
+        Opens the communication with the XBee and loads its information.
+
+        Args:
+            force_settings (Boolean, optional, default=`False`): `True` to open
+                the device ensuring/forcing that the specified serial settings
+                are applied even if the current configuration is different,
+                `False` to open the device with the current configuration.
+
+        Raises:
+            TimeoutException: If there is any problem with the communication.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API.
+            XBeeException: If the XBee is already open.
+
+        .. seealso::
+           | :meth:`.XBeeDevice.open`
+        """
+        await self.run_in_executor(self.__xbee.open, force_settings=force_settings)
+
+    async def close(self):
+        """
+        Closes the communication with the XBee.
+
+        .. seealso::
+           | :meth:`.XBeeDevice.close`
+        """
+        await self.run_in_executor(self.__xbee.close)
+
+    def is_open(self):
+        """
+        Returns whether this XBee is open.
+
+        Returns:
+            Boolean: `True` if this XBee is open, `False` otherwise.
+        """
+        return self.__xbee.is_open()
+
+    async def send_packet_and_get_response(self, packet, timeout=None):
+        """
+        Sends the packet and waits for its corresponding response.
+
+        Args:
+            packet (:class:`.XBeeAPIPacket`): The packet to send. It must
+                require a frame ID.
+            timeout (Float, optional, default=`None`): Number of seconds to
+                wait. `None` to use the synchronous operations timeout of the
+                XBee.
+
+        Returns:
+            :class:`.XBeeAPIPacket`: Received response packet.
+
+        Raises:
+            ValueError: If the packet does not require a frame ID.
+            TimeoutException: If the response is not received in the configured
+                timeout.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API. This method only checks the cached value of
+                the operating mode.
+            XBeeException: If the XBee's communication interface is closed.
+        """
+        if not self.__xbee.is_open():
+            raise XBeeException("XBee device's communication interface closed.")
+
+        if timeout is None:
+            timeout = self.__xbee.get_sync_ops_timeout()
+
+        sender = FutureRequestSender(self.__xbee, packet, timeout)
+        try:
+            # Writing to the serial port blocks, do not block the event loop
+            future = asyncio.wrap_future(await self.run_in_executor(sender.send))
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(
+                message="Response not received in the configured timeout.")
+        finally:
+            sender.expire()
+
+    async def get_parameter(self, parameter, parameter_value=None, apply=None,
+                            remote=None):
+        """
+        Returns the value of the provided parameter via an AT Command.
+
+        Args:
+            parameter (String or :class: `.ATStringCommand`): Parameter to get.
+            parameter_value (Bytearray, optional, default=`None`): Value of the
+                parameter to execute (if any).
+            apply (Boolean, optional, default=`None`): `True` to apply changes
+                in XBee configuration, `False` not to apply them, `None` to use
+                `is_apply_changes_enabled()` returned value.
+            remote (:class:`.RemoteXBeeDevice`, optional, default=`None`):
+                Remote XBee to get the parameter from. `None` to use the local
+                XBee.
+
+        Returns:
+            Bytearray: Parameter value.
+
+        Raises:
+            ValueError: If `parameter` is not valid.
+            TimeoutException: If response is not received before the read
+                timeout expires.
+            XBeeException: If the XBee's communication interface is closed.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API. This method only checks the cached value of
+                the operating mode.
+            ATCommandException: If response is not as expected.
+            OperationNotSupportedException: If the parameter has no value.
+
+        .. seealso::
+           | :meth:`.AbstractXBeeDevice.get_parameter`
+        """
+        value = await self.__send_parameter(
+            parameter, parameter_value=parameter_value, apply=apply,
+            remote=remote)
+
+        # Maybe a write-only parameter
+        if value is None:
+            if isinstance(parameter, ATStringCommand):
+                parameter = parameter.command
+            raise OperationNotSupportedException(
+                message="Could not get the %s value." % parameter)
+
+        return value
+
+    async def set_parameter(self, parameter, value, apply=None, remote=None):
+        """
+        Sets the value of a parameter via an AT Command.
+
+        Args:
+            parameter (String or :class: `.ATStringCommand`): Parameter to set.
+            value (Bytearray): Value of the parameter.
+            apply (Boolean, optional, default=`None`): `True` to apply changes,
+                `False` otherwise, `None` to use `is_apply_changes_enabled()`
+                returned value.
+            remote (:class:`.RemoteXBeeDevice`, optional, default=`None`):
+                Remote XBee to set the parameter to. `None` to use the local
+                XBee.
+
+        Raises:
+            ValueError: If `parameter` is not valid or `value` is `None`.
+            TimeoutException: If response is not received before the read
+                timeout expires.
+            XBeeException: If the XBee's communication interface is closed.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API. This method only checks the cached value of
+                the operating mode.
+            ATCommandException: If response is not as expected.
+
+        .. seealso::
+           | :meth:`.AbstractXBeeDevice.set_parameter`
+        """
+        if value is None:
+            raise ValueError("Value of the parameter cannot be None.")
+
+        await self.__send_parameter(parameter, parameter_value=value,
+                                    apply=apply, remote=remote)
+
+    async def execute_command(self, parameter, value=None, apply=None,
+                              remote=None):
+        """
+        Executes the provided command.
+
+        Args:
+            parameter (String or :class: `.ATStringCommand`): AT command to execute.
+            value (bytearray, optional, default=`None`): Command value (if any).
+            apply (Boolean, optional, default=`None`): `True` to apply changes
+                in XBee configuration, `False` not to apply them, `None` to use
+                `is_apply_changes_enabled()` returned value.
+            remote (:class:`.RemoteXBeeDevice`, optional, default=`None`):
+                Remote XBee to execute the command in. `None` to use the local
+                XBee.
+
+        Raises:
+            ValueError: If `parameter` is not valid.
+            TimeoutException: If response is not received before the read
+                timeout expires.
+            XBeeException: If the XBee's communication interface is closed.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API. This method only checks the cached value of
+                the operating mode.
+            ATCommandException: If response is not as expected.
+
+        .. seealso::
+           | :meth:`.AbstractXBeeDevice.execute_command`
+        """
+        await self.__send_parameter(parameter, parameter_value=value,
+                                    apply=apply, remote=remote)
+
+    async def send_data(self, remote_xbee, data,
+                        transmit_options=TransmitOptions.NONE.value):
+        """
+        Sends data to a remote XBee and waits for its transmit status.
+
+        Args:
+            remote_xbee (:class:`.RemoteXBeeDevice`): Remote XBee to send data to.
+            data (String or Bytearray): Raw data to send.
+            transmit_options (Integer, optional): Transmit options, bitfield of
+                :class:`.TransmitOptions`. Default to `TransmitOptions.NONE.value`.
+
+        Returns:
+            :class:`.XBeePacket`: The response.
+
+        Raises:
+            ValueError: If `remote_xbee` or `data` is `None`.
+            TimeoutException: If response is not received before the read
+                timeout expires.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API. This method only checks the cached value of
+                the operating mode.
+            TransmitException: If the status of the response received is not OK.
+            XBeeException: If the XBee's communication interface is closed.
+
+        .. seealso::
+           | :meth:`.XBeeDevice.send_data`
+        """
+        if remote_xbee is None:
+            raise ValueError("Remote XBee device cannot be None")
+        if data is None:
+            raise ValueError("Data cannot be None")
+
+        response = await self.send_packet_and_get_response(
+            self.__create_data_packet(remote_xbee.get_64bit_addr(),
+                                      remote_xbee.get_16bit_addr(), data,
+                                      transmit_options))
+        self.__check_transmit_status(response)
+
+        return response
+
+    async def send_data_broadcast(self, data,
+                                  transmit_options=TransmitOptions.NONE.value):
+        """
+        Sends the provided data to all the XBee nodes of the network
+        (broadcast) and waits for its transmit status.
+
+        Args:
+            data (String or Bytearray): Data to send.
+            transmit_options (Integer, optional): Transmit options, bitfield of
+                :class:`.TransmitOptions`. Default to `TransmitOptions.NONE.value`.
+
+        Returns:
+            :class:`.XBeePacket`: The response.
+
+        Raises:
+            ValueError: If `data` is `None`.
+            TimeoutException: If response is not received before the read
+                timeout expires.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API. This method only checks the cached value of
+                the operating mode.
+            TransmitException: If the status of the response received is not OK.
+            XBeeException: If the XBee's communication interface is closed.
+
+        .. seealso::
+           | :meth:`.XBeeDevice.send_data_broadcast`
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+
+        response = await self.send_packet_and_get_response(
+            self.__create_data_packet(XBee64BitAddress.BROADCAST_ADDRESS, None,
+                                      data, transmit_options))
+        self.__check_transmit_status(response)
+
+        return response
+
+    async def messages(self):
+        """
+        Asynchronous iterator over the data messages received by the XBee.
+
+        Only messages received while iterating are returned::
+
+            async for message in async_xbee.messages():
+                print(message.data)
+
+        Returns:
+            Asynchronous generator of :class:`.XBeeMessage`.
+
+        .. seealso::
+           | :class:`.XBeeMessage`
+           | :meth:`.XBeeDevice.add_data_received_callback`
+        """
+        loop = _get_running_loop()
+        queue = asyncio.Queue()
+
+        def data_received_cb(message):
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+
+        self.__xbee.add_data_received_callback(data_received_cb)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.__xbee.del_data_received_callback(data_received_cb)
+
+    async def __send_parameter(self, parameter, parameter_value=None,
+                               apply=None, remote=None):
+        """
+        Sends the given AT parameter to the local or the remote XBee and
+        returns the response (likely the value) of that parameter.
+
+        Args:
+            parameter (String or :class: `.ATStringCommand`): AT command/parameter to execute.
+            parameter_value (bytearray, optional, default=`None`): Value of the
+                AT command/parameter (if any).
+            apply (Boolean, optional, default=`None`): `True` to enable the
+                apply changes flag, `False` to disable it, `None` to use
+                `is_apply_changes_enabled()` returned value.
+            remote (:class:`.RemoteXBeeDevice`, optional, default=`None`):
+                Remote XBee to send the command to. `None` to use the local XBee.
+
+        Returns:
+            Bytearray: A byte array containing the value of the parameter.
+
+        Raises:
+            ValueError: if `parameter` is `None` or if `len(parameter) != 2`.
+            TimeoutException: If response is not received before the read
+                timeout expires.
+            XBeeException: If the XBee's communication interface is closed.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API. This method only checks the cached value of
+                the operating mode.
+            ATCommandException: If response is not as expected.
+        """
+        if parameter is None:
+            raise ValueError("Parameter cannot be None.")
+        if isinstance(parameter, ATStringCommand):
+            parameter = parameter.command
+        if len(parameter) != 2:
+            raise ValueError("Parameter must contain exactly 2 characters.")
+
+        xbee = remote if remote is not None else self.__xbee
+        # The packet sender discards non API operating modes
+        if (not xbee.is_remote() and parameter_value
+                and parameter.upper() == ATStringCommand.AP.command
+                and not xbee._packet_sender.is_op_mode_valid(parameter_value)):
+            raise ATCommandException()
+
+        command = ATCommand(parameter, parameter=parameter_value)
+
+        answer = await self.send_packet_and_get_response(
+            xbee._create_at_packet(command, apply=apply),
+            timeout=xbee.get_sync_ops_timeout())
+
+        response = None
+        if isinstance(answer, (ATCommResponsePacket, RemoteATCommandResponsePacket)):
+            response = ATCommandResponse(command, response=answer.command_value,
+                                         status=answer.status)
+        xbee._check_at_cmd_response_is_valid(response)
+
+        return response.response
+
+    def __create_data_packet(self, x64addr, x16addr, data, transmit_options):
+        """
+        Creates the packet to transmit the given data, as the data sending
+        methods of :class:`.XBeeDevice` do depending on the protocol.
+
+        Args:
+            x64addr (:class:`.XBee64BitAddress`): 64-bit address of the
+                destination XBee, `None` if unknown.
+            x16addr (:class:`.XBee16BitAddress`): 16-bit address of the
+                destination XBee, `None` if unknown.
+            data (String or Bytearray): Raw data to send.
+            transmit_options (Integer): Transmit options, bitfield of
+                :class:`.TransmitOptions`.
+
+        Returns:
+            :class:`.XBeeAPIPacket`: The packet to send.
+
+        Raises:
+            OperationNotSupportedException: If the protocol of the XBee does
+                not support data transmissions with these packets.
+        """
+        protocol = self.__xbee.get_protocol()
+        if protocol not in (XBeeProtocol.ZIGBEE, XBeeProtocol.DIGI_POINT,
+                            XBeeProtocol.DIGI_MESH, XBeeProtocol.RAW_802_15_4):
+            raise OperationNotSupportedException(
+                message="Operation not supported in this XBee protocol")
+
+        if isinstance(data, str):
+            data = data.encode("utf8")
+
+        frame_id = self.__xbee.get_next_frame_id()
+
+        if protocol == XBeeProtocol.RAW_802_15_4:
+            if x64addr is not None:
+                return TX64Packet(frame_id, x64addr, transmit_options, rf_data=data)
+            return TX16Packet(frame_id, x16addr, transmit_options, rf_data=data)
+
+        if x16addr is None or protocol == XBeeProtocol.DIGI_MESH:
+            x16addr = XBee16BitAddress.UNKNOWN_ADDRESS
+        if x64addr is None:
+            x64addr = XBee64BitAddress.UNKNOWN_ADDRESS
+
+        return TransmitPacket(frame_id, x64addr, x16addr, 0, transmit_options,
+                              rf_data=data)
+
+    @staticmethod
+    def __check_transmit_status(response):
+        """
+        Checks the transmit status of the given response.
+
+        Args:
+            response (:class:`.XBeeAPIPacket`): Transmit status packet.
+
+        Raises:
+            TransmitException: If the transmit status is not success.
+        """
+        if response.transmit_status not in (TransmitStatus.SUCCESS,
+                                            TransmitStatus.SELF_ADDRESSED):
+            raise TransmitException(transmit_status=response.transmit_status)
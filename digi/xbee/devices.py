@@ -12,11 +12,14 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
+import heapq
 import logging
 import threading
 import time
 
 from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import wait, FIRST_COMPLETED
 from enum import Enum, unique
 from functools import wraps
 from ipaddress import IPv4Address
@@ -50,7 +53,7 @@ from digi.xbee.packets.raw import TX64Packet, TX16Packet
 from digi.xbee.packets.relay import UserDataRelayPacket
 from digi.xbee.packets.zigbee import RegisterJoiningDevicePacket, \
     RegisterDeviceStatusPacket, CreateSourceRoutePacket
-from digi.xbee.sender import PacketSender, SyncRequestSender
+from digi.xbee.sender import PacketSender, SyncRequestSender, FutureRequestSender
 from digi.xbee.util import utils
 from digi.xbee.exception import XBeeException, TimeoutException, \
     InvalidOperatingModeException, ATCommandException, \
@@ -78,6 +81,20 @@ class AbstractXBeeDevice:
     The default timeout for all synchronous operations, in seconds.
     """
 
+    _DEFAULT_MAX_IN_FLIGHT_CMDS = 4
+    """
+    The default maximum number of AT commands waiting for a response at the
+    same time in :meth:`.AbstractXBeeDevice.get_parameters` and
+    :meth:`.AbstractXBeeDevice.set_parameters`.
+    """
+
+    _DEFAULT_CMD_RETRIES = 2
+    """
+    The default number of retries of an AT command that times out or fails to
+    be transmitted in :meth:`.AbstractXBeeDevice.get_parameters` and
+    :meth:`.AbstractXBeeDevice.set_parameters`.
+    """
+
     _BLE_API_USERNAME = "apiservice"
     """
     Bluetooth Low Energy API username.
@@ -239,6 +256,9 @@ class AbstractXBeeDevice:
         if new_hw:
             self._hardware_version = new_hw
 
+        if updated:
+            self._update_network_index()
+
         return updated
 
     def get_parameter(self, parameter, parameter_value=None, apply=None):
@@ -363,6 +383,105 @@ class AbstractXBeeDevice:
         # had in previous versions
         self.__send_parameter(parameter, parameter_value=value, apply=apply)
 
+    def get_parameters(self, parameters, apply=None,
+                       max_in_flight=_DEFAULT_MAX_IN_FLIGHT_CMDS,
+                       retries=_DEFAULT_CMD_RETRIES):
+        """
+        Returns the values of the provided parameters via AT Commands.
+
+        Unlike :meth:`.get_parameter`, this method does not wait for the
+        response of a command before sending the next one: up to
+        `max_in_flight` commands are waiting for their response at the same
+        time, each one with its own frame ID. Commands that time out or fail
+        to be transmitted are retried individually.
+
+        Args:
+            parameters (List): List of parameters (String or
+                :class: `.ATStringCommand`) to get.
+            apply (Boolean, optional, default=`None`): `True` to apply changes
+                in XBee configuration, `False` not to apply them, `None` to use
+                `is_apply_changes_enabled()` returned value.
+            max_in_flight (Integer, optional, default=4): Maximum number of
+                commands waiting for a response at the same time.
+            retries (Integer, optional, default=2): Number of times a command
+                is resent if it times out or fails to be transmitted.
+
+        Returns:
+            Dictionary: Parameter value (Bytearray) indexed by its AT command
+                (String).
+
+        Raises:
+            ValueError: If any parameter is not valid or `max_in_flight` is
+                not between 1 and 254.
+            TimeoutException: If the response of a command is not received
+                after all the retries.
+            XBeeException: If the XBee's communication interface is closed.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API. This method only checks the cached value of
+                the operating mode.
+            ATCommandException: If any response is not as expected.
+            OperationNotSupportedException: If any parameter has no value.
+
+        .. seealso::
+           | :meth:`.AbstractXBeeDevice.get_parameter`
+           | :meth:`.AbstractXBeeDevice.set_parameters`
+        """
+        values = self.__send_parameters(
+            [(param, None) for param in parameters], apply=apply,
+            max_in_flight=max_in_flight, retries=retries)
+
+        for param, value in values.items():
+            # Maybe a write-only parameter
+            if value is None:
+                raise OperationNotSupportedException(
+                    message="Could not get the %s value." % param)
+
+        return values
+
+    def set_parameters(self, parameters, apply=None,
+                       max_in_flight=_DEFAULT_MAX_IN_FLIGHT_CMDS,
+                       retries=_DEFAULT_CMD_RETRIES):
+        """
+        Sets the values of several parameters via AT Commands.
+
+        Commands are sent as :meth:`.get_parameters` does, without waiting for
+        the response of a command before sending the next one. They are sent
+        in the iteration order of `parameters`, but the XBee may process them
+        in a different order if any is retried.
+
+        Args:
+            parameters (Dictionary): Value (Bytearray) to set indexed by its
+                parameter (String or :class: `.ATStringCommand`).
+            apply (Boolean, optional, default=`None`): `True` to apply changes
+                in XBee configuration, `False` not to apply them, `None` to use
+                `is_apply_changes_enabled()` returned value.
+            max_in_flight (Integer, optional, default=4): Maximum number of
+                commands waiting for a response at the same time.
+            retries (Integer, optional, default=2): Number of times a command
+                is resent if it times out or fails to be transmitted.
+
+        Raises:
+            ValueError: If any parameter or value is not valid or
+                `max_in_flight` is not between 1 and 254.
+            TimeoutException: If the response of a command is not received
+                after all the retries.
+            XBeeException: If the XBee's communication interface is closed.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API. This method only checks the cached value of
+                the operating mode.
+            ATCommandException: If any response is not as expected.
+
+        .. seealso::
+           | :meth:`.AbstractXBeeDevice.set_parameter`
+           | :meth:`.AbstractXBeeDevice.get_parameters`
+        """
+        if any(value is None for value in parameters.values()):
+            raise ValueError("Value of the parameters cannot be None.")
+
+        self.__send_parameters(
+            list(parameters.items()), apply=apply,
+            max_in_flight=max_in_flight, retries=retries)
+
     def __send_parameter(self, parameter, parameter_value=None, apply=None):
         """
         Sends the given AT parameter to this XBee with an optional argument
@@ -406,6 +525,111 @@ class AbstractXBeeDevice:
 
         return response.response
 
+    def __send_parameters(self, commands, apply=None,
+                          max_in_flight=_DEFAULT_MAX_IN_FLIGHT_CMDS,
+                          retries=_DEFAULT_CMD_RETRIES):
+        """
+        Sends the given AT parameters to this XBee keeping up to
+        `max_in_flight` of them waiting for a response, and returns the
+        response of every parameter.
+
+        Args:
+            commands (List): List of tuples with the AT command/parameter
+                (String or :class: `.ATStringCommand`) and its value
+                (Bytearray or `None`).
+            apply (Boolean, optional, default=`None`): `True` to enable the
+                apply changes flag, `False` to disable it, `None` to use
+                `is_apply_changes_enabled()` returned value.
+            max_in_flight (Integer, optional): Maximum number of commands
+                waiting for a response at the same time.
+            retries (Integer, optional): Number of times a command is resent
+                if it times out or fails to be transmitted.
+
+        Returns:
+            Dictionary: Response (Bytearray) indexed by AT command (String).
+
+        Raises:
+            ValueError: If any parameter is not valid or `max_in_flight` is
+                not between 1 and 254.
+            TimeoutException: If the response of a command is not received
+                after all the retries.
+            XBeeException: If the XBee's communication interface is closed.
+            InvalidOperatingModeException: If the XBee's operating mode is not
+                API or ESCAPED API. This method only checks the cached value of
+                the operating mode.
+            ATCommandException: If any response is not as expected.
+        """
+        # Frame IDs are shared with any other request sent by the local XBee
+        if not 0 < max_in_flight < 0xFF:
+            raise ValueError("Maximum number of in-flight commands must be "
+                             "between 1 and 254.")
+
+        at_cmds = []
+        for parameter, value in commands:
+            if parameter is None:
+                raise ValueError("Parameter cannot be None.")
+            if isinstance(parameter, ATStringCommand):
+                parameter = parameter.command
+            if len(parameter) != 2:
+                raise ValueError("Parameter must contain exactly 2 characters.")
+            # The packet sender discards non API operating modes
+            if (not self.is_remote() and value
+                    and parameter.upper() == ATStringCommand.AP.command
+                    and not self._packet_sender.is_op_mode_valid(value)):
+                raise ATCommandException()
+            at_cmds.append(ATCommand(parameter, parameter=value))
+
+        operating_mode = self._get_operating_mode()
+        if operating_mode not in (OperatingMode.API_MODE, OperatingMode.ESCAPED_API_MODE):
+            raise InvalidOperatingModeException(op_mode=operating_mode)
+
+        local_xbee = self._local_xbee_device if self.is_remote() else self
+        if not local_xbee._packet_listener.is_running():
+            raise XBeeException("Packet listener is not running.")
+
+        responses = {}
+        pending = deque((cmd, 0) for cmd in at_cmds)
+        in_flight = {}
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < max_in_flight:
+                    cmd, attempt = pending.popleft()
+                    sender = FutureRequestSender(
+                        local_xbee, self._create_at_packet(cmd, apply=apply),
+                        self._timeout)
+                    in_flight[sender.send()] = (sender, cmd, attempt)
+
+                deadline = min(sender.deadline for sender, _, _ in in_flight.values())
+                wait(list(in_flight), timeout=max(0, deadline - time.time()),
+                     return_when=FIRST_COMPLETED)
+
+                now = time.time()
+                for future, (sender, cmd, attempt) in list(in_flight.items()):
+                    if not future.done() and sender.deadline > now:
+                        continue
+                    # Completes the future with a timeout if not done
+                    sender.expire()
+                    in_flight.pop(future)
+                    try:
+                        response = self.__to_at_response(cmd, future.result())
+                        self._check_at_cmd_response_is_valid(response)
+                    except (TimeoutException, ATCommandException) as exc:
+                        if (attempt >= retries
+                                or (isinstance(exc, ATCommandException)
+                                    and exc.status != ATCommandStatus.TX_FAILURE)):
+                            raise
+                        self._log.debug("Retrying AT command %s (%d/%d): %s",
+                                        cmd.command, attempt + 1, retries, str(exc))
+                        pending.append((cmd, attempt + 1))
+                        continue
+                    responses[cmd.command] = response.response
+        finally:
+            for sender, _, _ in in_flight.values():
+                sender.expire()
+
+        # Keep the order of the requested commands
+        return {cmd.command: responses[cmd.command] for cmd in at_cmds}
+
     def _check_at_cmd_response_is_valid(self, response):
         """
         Checks if the provided `ATCommandResponse` is valid throwing an
@@ -460,6 +684,32 @@ class AbstractXBeeDevice:
         if operating_mode not in (OperatingMode.API_MODE, OperatingMode.ESCAPED_API_MODE):
             raise InvalidOperatingModeException(op_mode=operating_mode)
 
+        packet = self._create_at_packet(command, apply=apply)
+
+        if self.is_remote():
+            answer_packet = self._local_xbee_device.send_packet_sync_and_get_response(
+                packet, timeout=self._timeout)
+        else:
+            answer_packet = self._send_packet_sync_and_get_response(packet)
+
+        return self.__to_at_response(command, answer_packet)
+
+    def _create_at_packet(self, command, apply=None):
+        """
+        Creates the packet to send the given AT command to this XBee with a
+        new frame ID.
+
+        Args:
+            command (:class:`.ATCommand`): AT command to send.
+            apply (Boolean, optional, default=`None`): `True` to enable the
+                apply changes flag, `False` to disable it, `None` to use
+                `is_apply_changes_enabled()` returned value.
+
+        Returns:
+            :class:`.XBeeAPIPacket`: The remote AT command packet if this is a
+                remote XBee, the local AT command (or queued AT command) packet
+                otherwise.
+        """
         apply = apply if apply is not None else self.is_apply_changes_enabled()
 
         if self.is_remote():
@@ -471,30 +721,36 @@ class AbstractXBeeDevice:
             if remote_16bit_addr is None:
                 remote_16bit_addr = XBee16BitAddress.UNKNOWN_ADDRESS
 
-            packet = RemoteATCommandPacket(
+            return RemoteATCommandPacket(
                 self._get_next_frame_id(), self.get_64bit_addr(), remote_16bit_addr,
                 remote_at_cmd_opts, command.command, parameter=command.parameter)
-        else:
-            if apply:
-                packet = ATCommPacket(self._get_next_frame_id(), command.command,
-                                      parameter=command.parameter)
-            else:
-                packet = ATCommQueuePacket(self._get_next_frame_id(),
-                                           command.command, parameter=command.parameter)
 
-        if self.is_remote():
-            answer_packet = self._local_xbee_device.send_packet_sync_and_get_response(
-                packet, timeout=self._timeout)
-        else:
-            answer_packet = self._send_packet_sync_and_get_response(packet)
+        if apply:
+            return ATCommPacket(self._get_next_frame_id(), command.command,
+                                parameter=command.parameter)
+
+        return ATCommQueuePacket(self._get_next_frame_id(),
+                                 command.command, parameter=command.parameter)
+
+    @staticmethod
+    def __to_at_response(command, answer_packet):
+        """
+        Builds the AT command response from the received answer packet.
 
-        response = None
+        Args:
+            command (:class:`.ATCommand`): The sent AT command.
+            answer_packet (:class:`.XBeeAPIPacket`): The received packet.
 
-        if isinstance(answer_packet, (ATCommResponsePacket, RemoteATCommandResponsePacket)):
-            response = ATCommandResponse(command, response=answer_packet.command_value,
-                                         status=answer_packet.status)
+        Returns:
+            :class:`.ATCommandResponse`: Response of the command or `None`
+                if the packet is not an AT command response.
+        """
+        if not isinstance(answer_packet, (ATCommResponsePacket,
+                                          RemoteATCommandResponsePacket)):
+            return None
 
-        return response
+        return ATCommandResponse(command, response=answer_packet.command_value,
+                                 status=answer_packet.status)
 
     def apply_changes(self):
         """
@@ -658,6 +914,8 @@ class AbstractXBeeDevice:
             raise
         else:
             if fire_event and updated:
+                # Look for the node with its new addresses
+                self._update_network_index()
                 network = self.get_local_xbee_device().get_network() if self.is_remote() \
                     else self.get_network()
                 if (network
@@ -668,6 +926,20 @@ class AbstractXBeeDevice:
                         NetworkEventType.UPDATE, reason, node=self)
         finally:
             self._initializing = False
+            self._update_network_index()
+
+    def _update_network_index(self):
+        """
+        Updates the lookup indexes of the network this remote node belongs to
+        after a change in its addresses or node identifier.
+        """
+        if not self.is_remote():
+            return
+
+        # Do not create the network if it does not exist yet
+        network = self.get_local_xbee_device()._get_existing_network()
+        if network is not None:
+            network._update_node_index(self)
 
     def read_device_info(self, init=True, fire_event=True):
         """
@@ -847,6 +1119,7 @@ class AbstractXBeeDevice:
         self.set_parameter(ATStringCommand.NI, bytearray(node_id, 'utf8'),
                            apply=self.is_apply_changes_enabled())
         self._node_id = node_id
+        self._update_network_index()
 
     def get_hardware_version(self):
         """
@@ -917,6 +1190,7 @@ class AbstractXBeeDevice:
         self.set_parameter(ATStringCommand.MY, value.address,
                            apply=self.is_apply_changes_enabled())
         self._16bit_addr = value
+        self._update_network_index()
 
     def get_64bit_addr(self):
         """
@@ -2059,6 +2333,28 @@ class AbstractXBeeDevice:
         if callback in self._packet_listener.get_packet_received_callbacks():
             self._packet_listener.del_packet_received_callback(callback)
 
+    def _add_pending_request(self, frame_id, callback):
+        """
+        Registers a callback to receive the response with the given frame ID.
+
+        Args:
+            frame_id (Integer): Frame ID of the sent request.
+            callback (Function): The callback. Receives one argument.
+
+                * The received packet as a :class:`.XBeeAPIPacket`
+        """
+        self._packet_listener.add_pending_request(frame_id, callback)
+
+    def _del_pending_request(self, frame_id, callback):
+        """
+        Removes a callback registered with :meth:`._add_pending_request`.
+
+        Args:
+            frame_id (Integer): Frame ID of the sent request.
+            callback (Function): The callback to remove.
+        """
+        self._packet_listener.del_pending_request(frame_id, callback)
+
     def _send_packet_sync_and_get_response(self, packet_to_send, timeout=None):
         """
         Sends the packet and waits for its corresponding response.
@@ -2363,6 +2659,9 @@ class XBeeDevice(AbstractXBeeDevice):
         self.__tmp_dm_routes_lock = threading.Lock()
         self.__route_received = RouteReceived()
 
+        self.__lazy_packets = False
+        self.__callback_dispatcher = None
+
     @classmethod
     def create_xbee_device(cls, comm_port_data):
         """
@@ -2475,6 +2774,9 @@ class XBeeDevice(AbstractXBeeDevice):
 
         self._is_open = True
 
+        if self._network is not None:
+            self._network._open_cache()
+
     def close(self):
         """
         Closes the communication with the XBee.
@@ -2484,6 +2786,7 @@ class XBeeDevice(AbstractXBeeDevice):
         """
         if self._network is not None:
             self._network.stop_discovery_process()
+            self._network._close_cache()
 
         if self._packet_listener is not None:
             self._packet_listener.stop()
@@ -2521,6 +2824,75 @@ class XBeeDevice(AbstractXBeeDevice):
         """
         return self._comm_iface
 
+    @property
+    def lazy_packets(self):
+        """
+        Returns whether received packets decode their fields on first access.
+
+        Returns:
+            Boolean: `True` if received packets are lazily decoded, `False`
+                otherwise.
+
+        .. seealso::
+           | :meth:`.factory.build_frame`
+        """
+        return self.__lazy_packets
+
+    @lazy_packets.setter
+    def lazy_packets(self, lazy_packets):
+        """
+        Configures whether received packets decode their fields on first
+        access.
+
+        Lazily decoded packets keep a view of the received frame and decode
+        the source addresses, RF data and IO samples when they are accessed,
+        reducing the work done for packets that are never fully inspected.
+
+        Args:
+            lazy_packets (Boolean): `True` to lazily decode received packets,
+                `False` to decode them as soon as they are received.
+        """
+        self.__lazy_packets = lazy_packets
+        if self._packet_listener is not None:
+            self._packet_listener.lazy_packets = lazy_packets
+
+    @property
+    def callback_dispatcher(self):
+        """
+        Returns the dispatcher that executes the callbacks of this XBee.
+
+        Returns:
+            :class:`.CallbackDispatcher`: The dispatcher, `None` if the default
+                one is used.
+
+        .. seealso::
+           | :class:`.CallbackDispatcher`
+        """
+        return self.__callback_dispatcher
+
+    @callback_dispatcher.setter
+    def callback_dispatcher(self, dispatcher):
+        """
+        Configures how the callbacks of this XBee (data received, packet
+        received, IO sample received, ...) are executed.
+
+        By default, callbacks are executed in a shared pool of threads, so
+        they may run in parallel and in a different order than packets are
+        received. Use an :class:`.OrderedDispatcher` to keep the order, an
+        :class:`.InlineDispatcher` to run them in the packet listener thread,
+        or a :class:`.PoolDispatcher` to bound the number of pending ones.
+
+        Args:
+            dispatcher (:class:`.CallbackDispatcher`): The dispatcher, `None`
+                to use the default one.
+
+        .. seealso::
+           | :attr:`.reader.DEFAULT_DISPATCHER`
+        """
+        self.__callback_dispatcher = dispatcher
+        if self._packet_listener is not None:
+            self._packet_listener.callback_dispatcher = dispatcher
+
     @property
     def operating_mode(self):
         """
@@ -2552,6 +2924,32 @@ class XBeeDevice(AbstractXBeeDevice):
         """
         super().set_parameter(parameter, value, apply=apply)
 
+    @AbstractXBeeDevice._before_send_method
+    def get_parameters(self, parameters, apply=None,
+                       max_in_flight=AbstractXBeeDevice._DEFAULT_MAX_IN_FLIGHT_CMDS,
+                       retries=AbstractXBeeDevice._DEFAULT_CMD_RETRIES):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`.AbstractXBeeDevice.get_parameters`
+        """
+        return super().get_parameters(parameters, apply=apply,
+                                      max_in_flight=max_in_flight, retries=retries)
+
+    @AbstractXBeeDevice._before_send_method
+    def set_parameters(self, parameters, apply=None,
+                       max_in_flight=AbstractXBeeDevice._DEFAULT_MAX_IN_FLIGHT_CMDS,
+                       retries=AbstractXBeeDevice._DEFAULT_CMD_RETRIES):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`.AbstractXBeeDevice.set_parameters`
+        """
+        super().set_parameters(parameters, apply=apply,
+                               max_in_flight=max_in_flight, retries=retries)
+
     @AbstractXBeeDevice._before_send_method
     @AbstractXBeeDevice._after_send_method
     def _send_data_64_16(self, x64addr, x16addr, data,
@@ -3537,6 +3935,20 @@ class XBeeDevice(AbstractXBeeDevice):
 
         return self._network
 
+    def _get_existing_network(self):
+        """
+        Returns the network of this XBee without creating it.
+
+        Returns:
+            :class:`.XBeeNetwork`: The XBee network, `None` if it does not
+                exist yet.
+        """
+        comm_network = self._comm_iface.get_network(self) if self._comm_iface else None
+        if comm_network:
+            return comm_network
+
+        return self._network
+
     def _restart_packet_listener(self):
         """
         Restarts the XBee packet listener.
@@ -3579,7 +3991,9 @@ class XBeeDevice(AbstractXBeeDevice):
 
         # Initialize the packet listener
         self._packet_listener = None
-        self._packet_listener = PacketListener(self._comm_iface, self)
+        self._packet_listener = PacketListener(
+            self._comm_iface, self, lazy_packets=self.__lazy_packets,
+            callback_dispatcher=self.__callback_dispatcher)
         self.__packet_queue = self._packet_listener.get_queue()
         self.__data_queue = self._packet_listener.get_data_queue()
         self.__explicit_queue = self._packet_listener.get_explicit_queue()
@@ -8142,6 +8556,7 @@ class RemoteRaw802Device(RemoteXBeeDevice):
             raise ValueError("64-bit address cannot be None")
 
         self._64bit_addr = address
+        self._update_network_index()
 
     def get_ai_status(self):
         """
@@ -8567,6 +8982,46 @@ class XBeeNetwork:
     High limit for the time (in seconds) to wait between node neighbors requests.
     """
 
+    DEFAULT_MAX_REQUESTS = 4
+    """
+    Default maximum number of simultaneous node neighbors requests for the
+    'Adaptive' deep discovery mode.
+    """
+
+    DEFAULT_MAX_REQUESTS_PER_DEPTH = 2
+    """
+    Default maximum number of simultaneous node neighbors requests to nodes at
+    the same hop depth for the 'Adaptive' deep discovery mode.
+    """
+
+    MAX_REQUESTS = 32
+    """
+    High limit for the number of simultaneous node neighbors requests for the
+    'Adaptive' deep discovery mode.
+    """
+
+    # 'Adaptive' mode: minimum timeout per node (seconds), max. pause after
+    # congestion (seconds), max. requests per node and scan, and polling time
+    __MIN_ADAPTIVE_NODE_TIMEOUT = 2
+    __MAX_CONGESTION_PAUSE = 30
+    __MAX_ADAPTIVE_ATTEMPTS = 3
+    __ADAPTIVE_POLL_TIME = 0.1
+
+    DEFAULT_REFRESH_MAX_AGE = 15 * 60  # seconds
+    """
+    Default time (in seconds) without traffic from a node before its
+    neighbors are requested again by the refresh process.
+    """
+
+    DEFAULT_TIME_BETWEEN_REFRESHES = 10  # seconds
+    """
+    Default time (in seconds) to wait between checks for stale nodes in the
+    refresh process.
+    """
+
+    # Route information source event of a failed hop (NACK)
+    __ROUTE_INFO_NACK = 0x11
+
     SCAN_TIL_CANCEL = 0  # 0 for not stopping
     """
     The neighbor discovery process continues until is manually stopped.
@@ -8598,6 +9053,14 @@ class XBeeNetwork:
 
         self._local_xbee = xbee_device
         self.__devices_list = []
+        # Indexes of the nodes in the network by 64-bit address, 16-bit
+        # address and node identifier. Each entry is the list of nodes with
+        # that key, in order of addition
+        self.__x64_index = {}
+        self.__x16_index = {}
+        self.__ni_index = {}
+        # Keys used to index each node (by object 'id')
+        self.__index_keys = {}
         self.__last_search_dev_list = []
         self.__lock = threading.Lock()
         self.__discovering = False
@@ -8612,6 +9075,8 @@ class XBeeNetwork:
 
         # FIFO to store the nodes to ask for their neighbors
         self._nodes_queue = Queue(self.__DEFAULT_QUEUE_MAX_SIZE)
+        # 64-bit addresses of the nodes queued again after a request error
+        self.__retried = set()
 
         # List with the MAC address (string format) of the still active request processes
         self.__active_processes = []
@@ -8624,7 +9089,11 @@ class XBeeNetwork:
 
         self.__scan_counter = 0
 
-        self.__connections = []
+        # Connections by the 64-bit addresses of their ends (node_a, node_b),
+        # in order of addition, and adjacency map: for each node 64-bit
+        # address, its connections by the 64-bit address of the other end
+        self.__connections = {}
+        self.__adjacency = {}
         self.__conn_lock = threading.Lock()
 
         # Dictionary to store the route and node discovery processes per node,
@@ -8640,6 +9109,25 @@ class XBeeNetwork:
         self.__time_bw_nodes = self.DEFAULT_TIME_BETWEEN_REQUESTS
         self._node_timeout = None
 
+        # 'Adaptive' deep discovery mode: configured limits, current window of
+        # simultaneous requests, hop depth of each node, RTT estimates
+        # (smoothed RTT, RTT variation) per node and per depth, and the active
+        # requests (start time, depth, timeout). Nodes are keyed by the 64-bit
+        # address string representation (to be thread-safe)
+        self.__max_requests = self.DEFAULT_MAX_REQUESTS
+        self.__max_requests_per_depth = self.DEFAULT_MAX_REQUESTS_PER_DEPTH
+        self.__window = self.__max_requests
+        self.__depths = {}
+        self.__node_rtts = {}
+        self.__depth_rtts = {}
+        self.__requests = {}
+        self.__attempts = {}
+        self.__congestion_count = 0
+        self.__paused_until = 0
+        self.__max_node_timeout = None
+        self.__sched_lock = threading.Lock()
+        self.__process_finished = threading.Event()
+
         self.__saved_nt = None
 
         self.__init_scan_cbs = InitDiscoveryScan()
@@ -8648,6 +9136,23 @@ class XBeeNetwork:
         # Dictionary to store registered callbacks per node.
         self.__packet_received_from = {}
 
+        # Persistent network cache. Nodes restored from a stored network are
+        # kept with the time they were last seen (by 64-bit address) until
+        # they are found again or revalidated
+        self.__cache_file = None
+        self.__cache_max_age = None
+        self.__unverified = {}
+        self.__cache_stop = threading.Event()
+        self.__revalidate_thread = None
+
+        # Incremental refresh: time each node was last heard (by 64-bit
+        # address), nodes marked as stale, and last route record per node
+        self.__refreshing = False
+        self.__last_seen = {}
+        self.__stale = set()
+        self.__stale_lock = threading.Lock()
+        self.__route_records = {}
+
     def __increment_scan_counter(self):
         """
         Increments (by one) the scan counter.
@@ -8734,6 +9239,67 @@ class XBeeNetwork:
                                                    kwargs={'discover_network': deep}, daemon=True)
         self.__discovery_thread.start()
 
+    def start_refresh_process(self, max_age=DEFAULT_REFRESH_MAX_AGE,
+                              time_bw_checks=DEFAULT_TIME_BETWEEN_REFRESHES):
+        """
+        Starts the incremental refresh process. This method is not blocking.
+
+        Instead of scanning the full network, this process only requests again
+        the neighbors of nodes whose routes or neighbors are likely stale:
+
+           * Nodes in a route record that changed since the previous one
+             (Zigbee).
+           * Responder and successor of a failed hop in route information
+             frames (DigiMesh).
+           * The local XBee after it resets, joins a network or starts a
+             network, as notified by its modem status.
+           * Non-reachable nodes that send traffic again.
+           * Nodes without traffic in the last `max_age` seconds.
+
+        New nodes found while refreshing are also requested. Only changes are
+        notified with :class:`.NetworkModified` events: new nodes, nodes with
+        new data and nodes that are no longer reachable.
+
+        The process runs until it is stopped with
+        :meth:`~.XBeeNetwork.stop_discovery_process`. It cannot run at the
+        same time as a discovery process. The neighbor requests use the node
+        timeout of the deep discovery
+        (see :meth:`~.XBeeNetwork.set_deep_discovery_timeouts`).
+
+        Args:
+            max_age (Float, optional, default=`DEFAULT_REFRESH_MAX_AGE`):
+                Seconds without traffic from a node before requesting its
+                neighbors again.
+            time_bw_checks (Float, optional, default=`DEFAULT_TIME_BETWEEN_REFRESHES`):
+                Seconds to wait between checks for stale nodes.
+
+        Raises:
+            ValueError: If `max_age` or `time_bw_checks` are not positive.
+
+        .. seealso::
+           | :meth:`.XBeeNetwork.add_network_modified_callback`
+           | :meth:`.XBeeNetwork.add_discovery_process_finished_callback`
+           | :meth:`.XBeeNetwork.is_discovery_running`
+           | :meth:`.XBeeNetwork.start_discovery_process`
+           | :meth:`.XBeeNetwork.stop_discovery_process`
+        """
+        if max_age is None or max_age <= 0:
+            raise ValueError("Maximum age must be greater than 0")
+        if time_bw_checks is None or time_bw_checks <= 0:
+            raise ValueError("Time between checks must be greater than 0")
+
+        with self.__lock:
+            if self.__discovering:
+                return
+            self.__discovering = True
+
+        self._log.info("Start network refresh for '%s'", self._local_xbee)
+
+        self.__discovery_thread = threading.Thread(
+            target=self.__refresh_and_notify_callbacks,
+            args=(max_age, time_bw_checks), daemon=True)
+        self.__discovery_thread.start()
+
     def stop_discovery_process(self):
         """
         Stops the discovery process if it is running.
@@ -8906,28 +9472,350 @@ class XBeeNetwork:
 
         return 0, str(file)
 
-    def add_network_modified_callback(self, callback):
+    def import_network(self, file_path):
         """
-        Adds a callback for the event :class:`.NetworkModified`.
+        Imports the nodes and connections of a network exported with
+        :meth:`.XBeeNetwork.export`.
 
-        Args:
-            callback (Function): The callback. Receives three arguments.
+        The network must have been exported from the same local XBee. Nodes
+        already in the network are updated with the imported information.
+        Imported nodes are considered stale, see
+        :meth:`.XBeeNetwork.set_cache_file`.
 
-                * The event type as a :class:`.NetworkEventType`.
-                * The reason of the event as a :class:`.NetworkEventReason`.
-                * The node added, updated or removed from the network as a
-                  :class:`.XBeeDevice` or :class:`.RemoteXBeeDevice`.
+        Params:
+            file_path (String): Path of the exported network file ('.xnet'
+                file or its 'network.xml').
+
+        Returns:
+            Tuple (Integer, String): Tuple with result (0: success, 1: failure)
+                and string (imported file path if success, error string otherwise).
 
         .. seealso::
-           | :meth:`.XBeeNetwork.del_network_modified_callback`
+           | :meth:`.XBeeNetwork.export`
         """
-        self._network_modified += callback
+        from zipfile import ZipFile, BadZipFile, is_zipfile
+        from digi.xbee.util.exportutils import read_network_xml
 
-    def add_device_discovered_callback(self, callback):
-        """
-        Adds a callback for the event :class:`.DeviceDiscovered`.
+        try:
+            if is_zipfile(file_path):
+                with ZipFile(file_path) as xnet_zip:
+                    with xnet_zip.open("network.xml") as xnet_file:
+                        network = read_network_xml(xnet_file)
+            else:
+                network = read_network_xml(file_path)
+        except (OSError, IOError) as exc:
+            return 1, "%s (%d): %s" % (exc.strerror, exc.errno, exc.filename)
+        except (KeyError, BadZipFile, ValueError) as exc:
+            return 1, str(exc)
 
-        Args:
+        error = self.__restore_network(network)
+        if error:
+            return 1, error
+
+        return 0, str(file_path)
+
+    def get_cache_file(self):
+        """
+        Returns the file used to persist this network.
+
+        Returns:
+            String: Path of the network cache file, `None` if not configured.
+
+        .. seealso::
+           | :meth:`.XBeeNetwork.set_cache_file`
+        """
+        return self.__cache_file
+
+    def set_cache_file(self, file_path, max_age=None):
+        """
+        Configures a file to persist this network between executions.
+
+        If configured, the network is restored from this file when the local
+        XBee is opened, and saved to it when the local XBee is closed. Restored
+        nodes that are not seen (discovered or receiving data from them) in
+        `max_age` seconds since they were last seen are revalidated in the
+        background by reading their node identifier. Nodes that do not answer
+        are marked as non-reachable.
+
+        Params:
+            file_path (String): Path of the network cache file, `None` to not
+                persist the network.
+            max_age (Integer, optional, default=`None`): Number of seconds a
+                node is considered valid since it was last seen. `None` to not
+                revalidate restored nodes.
+
+        Raises:
+            ValueError: If `max_age` is negative.
+
+        .. seealso::
+           | :meth:`.XBeeNetwork.load_cache`
+           | :meth:`.XBeeNetwork.save_cache`
+        """
+        if max_age is not None and max_age < 0:
+            raise ValueError("Maximum age cannot be negative")
+
+        self.__cache_file = file_path
+        self.__cache_max_age = max_age
+
+    def save_cache(self, file_path=None):
+        """
+        Saves the nodes and connections of this network to a cache file.
+
+        Params:
+            file_path (String, optional, default=`None`): Path of the cache
+                file. `None` to use the configured cache file.
+
+        Returns:
+            Tuple (Integer, String): Tuple with result (0: success, 1: failure)
+                and string (cache file path if success, error string otherwise).
+
+        .. seealso::
+           | :meth:`.XBeeNetwork.load_cache`
+           | :meth:`.XBeeNetwork.set_cache_file`
+        """
+        from digi.xbee.util.netcache import write_network_cache
+
+        file_path = file_path or self.__cache_file
+        if not file_path:
+            return 1, "No network cache file configured"
+        local_addr = self._local_xbee.get_64bit_addr()
+        if not XBee64BitAddress.is_known_node_addr(local_addr):
+            return 1, "Local XBee not initialized"
+
+        now = time.time()
+        nodes = [node for node in [self._local_xbee] + self.get_devices()
+                 if XBee64BitAddress.is_known_node_addr(node.get_64bit_addr())]
+        addrs = set(node.get_64bit_addr() for node in nodes)
+        network = {
+            "protocol": self._local_xbee.get_protocol(),
+            "local": local_addr,
+            "timestamp": now,
+            "nodes": [{
+                "x64bit_addr": node.get_64bit_addr(),
+                "x16bit_addr": node.get_16bit_addr() or XBee16BitAddress.UNKNOWN_ADDRESS,
+                "node_id": node.get_node_id(),
+                "role": node.get_role() or Role.UNKNOWN,
+                "hw_version": node.get_hardware_version(),
+                "fw_version": node.get_firmware_version(),
+                "parent": node.parent.get_64bit_addr()
+                          if isinstance(node, RemoteZigBeeDevice) and node.parent else None,
+                "timestamp": self.__unverified.get(node.get_64bit_addr(), now),
+            } for node in nodes],
+            "connections": [{
+                "node_a": conn.node_a.get_64bit_addr(),
+                "node_b": conn.node_b.get_64bit_addr(),
+                "lq_a2b": conn.lq_a2b,
+                "lq_b2a": conn.lq_b2a,
+                "status_a2b": conn.status_a2b,
+                "status_b2a": conn.status_b2a,
+            } for conn in self.get_connections()
+                if conn.node_a.get_64bit_addr() in addrs
+                and conn.node_b.get_64bit_addr() in addrs],
+        }
+
+        try:
+            write_network_cache(file_path, network)
+        except (OSError, IOError) as exc:
+            return 1, "%s (%d): %s" % (exc.strerror, exc.errno, exc.filename)
+        except ValueError as exc:
+            return 1, str(exc)
+
+        return 0, str(file_path)
+
+    def load_cache(self, file_path=None):
+        """
+        Restores the nodes and connections of a cache file into this network.
+
+        The cache must belong to the same local XBee. Nodes already in the
+        network are updated with the cached information.
+
+        Params:
+            file_path (String, optional, default=`None`): Path of the cache
+                file. `None` to use the configured cache file.
+
+        Returns:
+            Tuple (Integer, String): Tuple with result (0: success, 1: failure)
+                and string (cache file path if success, error string otherwise).
+
+        .. seealso::
+           | :meth:`.XBeeNetwork.save_cache`
+           | :meth:`.XBeeNetwork.set_cache_file`
+        """
+        from digi.xbee.util.netcache import read_network_cache
+
+        file_path = file_path or self.__cache_file
+        if not file_path:
+            return 1, "No network cache file configured"
+
+        try:
+            network = read_network_cache(file_path)
+        except (OSError, IOError) as exc:
+            return 1, "%s (%d): %s" % (exc.strerror, exc.errno, exc.filename)
+        except ValueError as exc:
+            return 1, str(exc)
+
+        error = self.__restore_network(network)
+        if error:
+            return 1, error
+
+        return 0, str(file_path)
+
+    def _open_cache(self):
+        """
+        Restores this network from the configured cache file, if any. Called
+        when the local XBee is opened.
+        """
+        from pathlib import Path
+
+        if not self.__cache_file or not Path(self.__cache_file).is_file():
+            return
+
+        code, msg = self.load_cache()
+        if code:
+            self._log.warning("Could not load network cache: %s", msg)
+
+    def _close_cache(self):
+        """
+        Stops the revalidation of restored nodes and saves this network to the
+        configured cache file, if any. Called when the local XBee is closed.
+        """
+        self.__cache_stop.set()
+        thread = self.__revalidate_thread
+        if thread and thread is not threading.current_thread():
+            thread.join()
+        self.__revalidate_thread = None
+
+        if not self.__cache_file or not self._local_xbee.is_open():
+            return
+
+        code, msg = self.save_cache()
+        if code:
+            self._log.warning("Could not save network cache: %s", msg)
+
+    def __restore_network(self, network):
+        """
+        Adds the nodes and connections of the provided stored network to this
+        network, and starts the revalidation of stale nodes if configured.
+
+        Args:
+            network (Dictionary): The stored network, see
+                :mod:`digi.xbee.util.netcache`.
+
+        Returns:
+            String: Error message, `None` if the network was restored.
+        """
+        local_addr = self._local_xbee.get_64bit_addr()
+        if not XBee64BitAddress.is_known_node_addr(local_addr):
+            return "Local XBee not initialized"
+        if network["local"] != local_addr:
+            return "Stored network belongs to another XBee (%s)" % network["local"]
+        if network["protocol"] != self._local_xbee.get_protocol():
+            return "Stored network protocol (%s) does not match" % network["protocol"].description
+
+        nodes = {local_addr: self._local_xbee}
+        for data in network["nodes"]:
+            x64 = data["x64bit_addr"]
+            if x64 in nodes:
+                continue
+            is_new = self.get_device_by_64(x64) is None
+            node = self._add_remote(
+                self.__create_remote(x64bit_addr=x64, x16bit_addr=data["x16bit_addr"],
+                                     node_id=data["node_id"], role=data["role"],
+                                     hw_version=data["hw_version"],
+                                     fw_version=data["fw_version"]),
+                NetworkEventReason.CACHED)
+            if not node:
+                continue
+            nodes[x64] = node
+            if is_new:
+                self.__unverified[x64] = data["timestamp"] or 0
+
+        for data in network["nodes"]:
+            node = nodes.get(data["x64bit_addr"])
+            if (isinstance(node, RemoteZigBeeDevice) and not node.parent
+                    and data["parent"] in nodes):
+                node.parent = nodes[data["parent"]]
+
+        for data in network["connections"]:
+            node_a = nodes.get(data["node_a"])
+            node_b = nodes.get(data["node_b"])
+            if node_a and node_b:
+                self._add_connection(Connection(
+                    node_a, node_b, lq_a2b=data["lq_a2b"], lq_b2a=data["lq_b2a"],
+                    status_a2b=data["status_a2b"], status_b2a=data["status_b2a"]))
+
+        self.__start_revalidation()
+
+        return None
+
+    def __start_revalidation(self):
+        """
+        Starts the background revalidation of restored nodes not seen in the
+        configured maximum age, if it is not running yet.
+        """
+        if (self.__cache_max_age is None or not self.__unverified
+                or not self._local_xbee.is_open()
+                or (self.__revalidate_thread and self.__revalidate_thread.is_alive())):
+            return
+
+        self.__cache_stop.clear()
+        self.__revalidate_thread = threading.Thread(
+            target=self.__revalidate_nodes, daemon=True)
+        self.__revalidate_thread.start()
+
+    def __revalidate_nodes(self):
+        """
+        Reads the node identifier of every restored node not seen in the
+        configured maximum age. Nodes that answer are marked as seen, the rest
+        as non-reachable.
+        """
+        limit = time.time() - self.__cache_max_age
+        stale = [x64 for x64, last_seen in list(self.__unverified.items())
+                 if last_seen <= limit]
+
+        for x64 in stale:
+            if self.__cache_stop.is_set() or not self._local_xbee.is_open():
+                break
+            node = self.get_device_by_64(x64)
+            if not node or x64 not in self.__unverified:
+                continue
+            try:
+                node_id = node.get_parameter(ATStringCommand.NI, apply=False).decode()
+            except XBeeException as exc:
+                self._log.debug("Stored node %s not reachable: %s", node, str(exc))
+                self._set_node_reachable(node, False)
+                continue
+
+            self.__unverified.pop(x64, None)
+            if node_id != node.get_node_id():
+                node._node_id = node_id
+                self._update_node_index(node)
+                self._network_modified(NetworkEventType.UPDATE,
+                                       NetworkEventReason.READ_INFO, node=node)
+            self._set_node_reachable(node, True)
+
+    def add_network_modified_callback(self, callback):
+        """
+        Adds a callback for the event :class:`.NetworkModified`.
+
+        Args:
+            callback (Function): The callback. Receives three arguments.
+
+                * The event type as a :class:`.NetworkEventType`.
+                * The reason of the event as a :class:`.NetworkEventReason`.
+                * The node added, updated or removed from the network as a
+                  :class:`.XBeeDevice` or :class:`.RemoteXBeeDevice`.
+
+        .. seealso::
+           | :meth:`.XBeeNetwork.del_network_modified_callback`
+        """
+        self._network_modified += callback
+
+    def add_device_discovered_callback(self, callback):
+        """
+        Adds a callback for the event :class:`.DeviceDiscovered`.
+
+        Args:
             callback (Function): The callback. Receives one argument.
 
                 * The discovered remote XBee as a :class:`.RemoteXBeeDevice`.
@@ -9145,9 +10033,18 @@ class XBeeNetwork:
 
         with self.__lock:
             self.__devices_list.clear()
+            self.__x64_index.clear()
+            self.__x16_index.clear()
+            self.__ni_index.clear()
+            self.__index_keys.clear()
 
         with self.__conn_lock:
             self.__connections.clear()
+            self.__adjacency.clear()
+
+        self.__unverified.clear()
+        self.__last_seen.clear()
+        self.__route_records.clear()
 
         self._network_modified(NetworkEventType.CLEAR, reason, node=None)
 
@@ -9216,6 +10113,66 @@ class XBeeNetwork:
         """
         return self.__mode, self.__rm_not_discovered_in_last_scan
 
+    def get_adaptive_discovery_options(self):
+        """
+        Returns the options of the 'Adaptive' deep discovery mode.
+
+        Returns:
+            Tuple (Integer, Integer): Tuple containing:
+                - max_requests (Integer): Maximum number of simultaneous node
+                    neighbors requests.
+                - max_per_depth (Integer): Maximum number of simultaneous node
+                    neighbors requests to nodes at the same hop depth.
+
+        .. seealso::
+           | :attr:`.NeighborDiscoveryMode.ADAPTIVE`
+           | :meth:`.XBeeNetwork.set_adaptive_discovery_options`
+        """
+        return self.__max_requests, self.__max_requests_per_depth
+
+    def set_adaptive_discovery_options(self, max_requests=None, max_per_depth=None):
+        """
+        Configures the options of the 'Adaptive' deep discovery mode.
+        These options are only applicable when the deep discovery mode is
+        :attr:`.NeighborDiscoveryMode.ADAPTIVE`
+        (see :meth:`~.XBeeNetwork.set_deep_discovery_options`)
+
+        The number of simultaneous requests starts at `max_requests`, it is
+        halved each time the network reports congestion and grows again by one
+        with each full window of successful requests.
+
+        Args:
+            max_requests (Integer, optional, default=`DEFAULT_MAX_REQUESTS`):
+                Maximum number of simultaneous node neighbors requests. It
+                must be between 1 and :const:`MAX_REQUESTS` inclusive.
+            max_per_depth (Integer, optional, default=`DEFAULT_MAX_REQUESTS_PER_DEPTH`):
+                Maximum number of simultaneous node neighbors requests to
+                nodes at the same hop depth. It must be between 1 and
+                `max_requests` inclusive.
+
+        Raises:
+            ValueError: If `max_requests` or `max_per_depth` are not between
+                their corresponding limits.
+
+        .. seealso::
+           | :attr:`.NeighborDiscoveryMode.ADAPTIVE`
+           | :meth:`.XBeeNetwork.get_adaptive_discovery_options`
+        """
+        if max_requests is None:
+            max_requests = self.DEFAULT_MAX_REQUESTS
+        if max_per_depth is None:
+            max_per_depth = min(self.DEFAULT_MAX_REQUESTS_PER_DEPTH, max_requests)
+
+        if not 1 <= max_requests <= self.MAX_REQUESTS:
+            raise ValueError("Maximum requests must be between 1 and %d"
+                             % self.MAX_REQUESTS)
+        if not 1 <= max_per_depth <= max_requests:
+            raise ValueError("Maximum requests per depth must be between 1 and %d"
+                             % max_requests)
+
+        self.__max_requests = max_requests
+        self.__max_requests_per_depth = max_per_depth
+
     def set_deep_discovery_options(self, deep_mode=NeighborDiscoveryMode.CASCADE,
                                    del_not_discovered_nodes_in_last_scan=False):
         """
@@ -9469,11 +10426,7 @@ class XBeeNetwork:
             return self._local_xbee
 
         with self.__lock:
-            for device in self.__devices_list:
-                if device.get_64bit_addr() is not None and device.get_64bit_addr() == x64bit_addr:
-                    return device
-
-        return None
+            return self.__get_indexed(self.__x64_index, x64bit_addr)
 
     def get_device_by_16(self, x16bit_addr):
         """
@@ -9502,11 +10455,7 @@ class XBeeNetwork:
             return self._local_xbee
 
         with self.__lock:
-            for device in self.__devices_list:
-                if device.get_16bit_addr() is not None and device.get_16bit_addr() == x16bit_addr:
-                    return device
-
-        return None
+            return self.__get_indexed(self.__x16_index, x16bit_addr)
 
     def get_device_by_node_id(self, node_id):
         """
@@ -9528,11 +10477,7 @@ class XBeeNetwork:
             return self._local_xbee
 
         with self.__lock:
-            for device in self.__devices_list:
-                if device.get_node_id() is not None and device.get_node_id() == node_id:
-                    return device
-
-        return None
+            return self.__get_indexed(self.__ni_index, node_id)
 
     def add_if_not_exist(self, x64bit_addr=None, x16bit_addr=None, node_id=None):
         """
@@ -9637,6 +10582,7 @@ class XBeeNetwork:
                     x64 = XBee64BitAddress(sh_val + sl_val)
                     is_x64_known_addr = XBee64BitAddress.is_known_node_addr(x64)
                     remote_xbee._64bit_addr = x64
+                    self._update_node_index(remote_xbee)
                 except XBeeException as exc:
                     self._log.debug(
                         "Error while trying to get 64-bit address of XBee (%s - %s): %s",
@@ -9646,8 +10592,7 @@ class XBeeNetwork:
             # Look for the node in the cache by its 64-bit address
             if is_x64_known_addr:
                 with self.__lock:
-                    if remote_xbee in self.__devices_list:
-                        found = self.__devices_list[self.__devices_list.index(remote_xbee)]
+                    found = self.__get_indexed(self.__x64_index, x64)
 
             # If not found, look for the node in the cache by its 16-bit address
             if not found:
@@ -9669,11 +10614,8 @@ class XBeeNetwork:
                     found = found_16
 
         if found:
-            already_in_scan = False
-            if reason in (NetworkEventReason.NEIGHBOR, NetworkEventReason.DISCOVERED):
-                already_in_scan = found.scan_counter == self.__scan_counter
-                if not already_in_scan:
-                    found._scan_counter = self.__scan_counter
+            already_in_scan = self.__mark_scanned(found, reason)
+            self.__mark_seen(found, reason)
 
             is_init = found._initializing and reason == NetworkEventReason.RECEIVED_MSG
             if not is_init and found.update_device_data_from(remote_xbee):
@@ -9685,7 +10627,10 @@ class XBeeNetwork:
         if reason in (NetworkEventReason.NEIGHBOR, NetworkEventReason.DISCOVERED):
             remote_xbee._scan_counter = self.__scan_counter
 
-        self.__devices_list.append(remote_xbee)
+        with self.__lock:
+            self.__devices_list.append(remote_xbee)
+            self.__index_node(remote_xbee)
+        self.__mark_seen(remote_xbee, reason)
         self._network_modified(NetworkEventType.ADD, reason, node=remote_xbee)
 
         return remote_xbee
@@ -9726,11 +10671,177 @@ class XBeeNetwork:
             | :class:`digi.xbee.models.protocol.Role`
             | :class:`digi.xbee.models.mode.OperatingMode`
         """
+        # Fast path: the node is already in the network and the provided data
+        # does not change it, so there is no need to create a remote object
+        found = self.__get_cached_remote(x64bit_addr, x16bit_addr, node_id,
+                                         role, hw_version, fw_version)
+        if found:
+            self.__mark_seen(found, reason)
+            return None if self.__mark_scanned(found, reason) else found
+
         return self._add_remote(
             self.__create_remote(x64bit_addr=x64bit_addr, x16bit_addr=x16bit_addr,
                                  node_id=node_id, role=role, hw_version=hw_version,
                                  fw_version=fw_version, op_mode=op_mode), reason)
 
+    def __get_cached_remote(self, x64bit_addr, x16bit_addr, node_id, role,
+                            hw_version, fw_version):
+        """
+        Returns the remote node of the network with the provided 64-bit address
+        if its data is already up to date with the rest of provided values.
+
+        Args:
+            x64bit_addr (:class:`.XBee64BitAddress`): The 64-bit address.
+            x16bit_addr (:class:`.XBee16BitAddress`): The 16-bit address.
+            node_id (String): The node identifier.
+            role (:class:`.Role`): The role.
+            hw_version (:class:`.HardwareVersion`): The hardware version.
+            fw_version (bytearray): The firmware version.
+
+        Returns:
+            :class:`.RemoteXBeeDevice`: The cached remote node, `None` if it is
+                not in the network or it must be updated.
+        """
+        if (hw_version or fw_version
+                or not XBee64BitAddress.is_known_node_addr(x64bit_addr)
+                or x64bit_addr == self._local_xbee.get_64bit_addr()):
+            return None
+
+        with self.__lock:
+            found = self.__get_indexed(self.__x64_index, x64bit_addr)
+        if not found:
+            return None
+
+        if node_id is not None and node_id != found._node_id:
+            return None
+        if role is not None and role != Role.UNKNOWN and role != found._role:
+            return None
+        # DigiMesh and Point-to-Multipoint nodes do not use 16-bit addresses
+        if (self._local_xbee.get_protocol() not in (XBeeProtocol.DIGI_MESH,
+                                                    XBeeProtocol.DIGI_POINT)
+                and XBee16BitAddress.is_known_node_addr(x16bit_addr)
+                and x16bit_addr != found._16bit_addr):
+            return None
+
+        return found
+
+    def __mark_scanned(self, node, reason):
+        """
+        Sets the current scan counter to the provided node if the reason of
+        its addition comes from a discovery process.
+
+        Args:
+            node (:class:`.AbstractXBeeDevice`): The node to mark.
+            reason (:class:`.NetworkEventReason`): Reason of the addition.
+
+        Returns:
+            Boolean: `True` if the node was already found in the current scan,
+                `False` otherwise.
+        """
+        if reason not in (NetworkEventReason.NEIGHBOR, NetworkEventReason.DISCOVERED):
+            return False
+
+        if node.scan_counter == self.__scan_counter:
+            return True
+        node._scan_counter = self.__scan_counter
+        return False
+
+    def __mark_seen(self, node, reason):
+        """
+        Removes the provided node from the nodes restored from a stored network
+        pending to be seen, unless the reason of its addition is that restore,
+        and saves the time of its last received message.
+
+        Args:
+            node (:class:`.AbstractXBeeDevice`): The node to mark.
+            reason (:class:`.NetworkEventReason`): Reason of the addition.
+        """
+        if self.__unverified and reason != NetworkEventReason.CACHED:
+            self.__unverified.pop(node.get_64bit_addr(), None)
+
+        if reason == NetworkEventReason.RECEIVED_MSG:
+            self.__last_seen[node.get_64bit_addr()] = time.time()
+            # A node sending traffic again may have new neighbors
+            if self.__refreshing and not node.reachable:
+                self.__mark_stale(node)
+
+    def _update_node_index(self, node):
+        """
+        Updates the lookup indexes of the network after a change in the
+        addresses or the node identifier of the provided node. If the node is
+        not in the network, it does nothing.
+
+        Args:
+            node (:class:`.AbstractXBeeDevice`): The modified node.
+        """
+        with self.__lock:
+            if id(node) in self.__index_keys:
+                self.__index_node(node)
+
+    def __index_node(self, node):
+        """
+        Adds or updates the entries of the provided node in the lookup indexes.
+        The network lock must be held by the caller.
+
+        Args:
+            node (:class:`.AbstractXBeeDevice`): The node to index.
+        """
+        x64 = node.get_64bit_addr()
+        x16 = node.get_16bit_addr()
+        # Unknown and broadcast addresses are not indexed: 'get_device_by_64()'
+        # and 'get_device_by_16()' reject them, so they never match a node
+        keys = (x64 if XBee64BitAddress.is_known_node_addr(x64) else None,
+                x16 if XBee16BitAddress.is_known_node_addr(x16) else None,
+                node.get_node_id())
+        old_keys = self.__index_keys.get(id(node))
+        if old_keys == keys:
+            return
+        if old_keys:
+            self.__unindex_node(node)
+
+        for index, key in zip((self.__x64_index, self.__x16_index,
+                               self.__ni_index), keys):
+            if key is not None:
+                index.setdefault(key, []).append(node)
+        self.__index_keys[id(node)] = keys
+
+    def __unindex_node(self, node):
+        """
+        Removes the entries of the provided node from the lookup indexes.
+        The network lock must be held by the caller.
+
+        Args:
+            node (:class:`.AbstractXBeeDevice`): The node to remove.
+        """
+        keys = self.__index_keys.pop(id(node), None)
+        if not keys:
+            return
+
+        for index, key in zip((self.__x64_index, self.__x16_index,
+                               self.__ni_index), keys):
+            nodes = index.get(key) if key is not None else None
+            if not nodes:
+                continue
+            nodes[:] = [item for item in nodes if item is not node]
+            if not nodes:
+                del index[key]
+
+    @staticmethod
+    def __get_indexed(index, key):
+        """
+        Returns the first node added to the network with the provided key in
+        the given index. The network lock must be held by the caller.
+
+        Args:
+            index (Dictionary): The index to search in.
+            key: The 64-bit address, 16-bit address or node identifier.
+
+        Returns:
+            :class:`.AbstractXBeeDevice`: The node, `None` if not found.
+        """
+        nodes = index.get(key)
+        return nodes[0] if nodes else None
+
     def add_remotes(self, remote_xbees):
         """
         Adds a list of remote XBee nodes to the network.
@@ -9761,13 +10872,16 @@ class XBeeNetwork:
             return
 
         with self.__lock:
-            if remote_xbee not in self.__devices_list:
+            found_node = self.__get_indexed(
+                self.__x64_index, remote_xbee.get_64bit_addr())
+            if not found_node and id(remote_xbee) in self.__index_keys:
+                found_node = remote_xbee
+            if not found_node:
                 return
 
-            i = self.__devices_list.index(remote_xbee)
-            found_node = self.__devices_list[i]
             if force:
                 self.__devices_list.remove(found_node)
+                self.__unindex_node(found_node)
                 if found_node.reachable:
                     self._network_modified(NetworkEventType.DEL, reason, node=remote_xbee)
 
@@ -9936,31 +11050,255 @@ class XBeeNetwork:
                 return XBeeNetwork.ND_PACKET_FINISH
             return XBeeNetwork.ND_PACKET_REMOTE
 
-        return None
+        return None
+
+    def __discover_devices_and_notify_callbacks(self, discover_network=False):
+        """
+        Blocking method. Performs a discovery operation, waits until it finishes
+        (timeout or 'end' packet for 802.15.4), and notifies callbacks.
+
+        Args:
+            discover_network (Boolean, optional, default=`False`): `True` to
+                discovery the full network with connections between nodes,
+                `False` to only discover nodes with a single 'ND'.
+        """
+        self._stop_event.clear()
+        self.__last_search_dev_list.clear()
+        self.__discovering = True
+        self.__discover_result = None
+
+        if not discover_network:
+            status = self.__discover_devices()
+            self._discovery_done(self.__active_processes)
+        else:
+            status = self._discover_full_network()
+
+        self._log.info("End network discovery for '%s'", self._local_xbee)
+        self.__device_discovery_finished(status if status else NetworkDiscoveryStatus.SUCCESS)
+
+    def __refresh_and_notify_callbacks(self, max_age, time_bw_checks):
+        """
+        Blocking method. Performs the incremental refresh until it is stopped,
+        and notifies callbacks.
+
+        Args:
+            max_age (Float): Seconds without traffic from a node before
+                requesting its neighbors again.
+            time_bw_checks (Float): Seconds to wait between checks for stale
+                nodes.
+        """
+        self._stop_event.clear()
+        self.__discover_result = None
+
+        listener = self._local_xbee._packet_listener
+        listener.add_route_record_received_callback(self.__refresh_route_record_cb)
+        listener.add_route_info_received_callback(self.__refresh_route_info_cb)
+        listener.add_modem_status_received_callback(self.__refresh_modem_status_cb)
+
+        code = NetworkDiscoveryStatus.SUCCESS
+        try:
+            try:
+                self._prepare_network_discovery()
+            except XBeeException as exc:
+                self._log.warning(str(exc))
+
+            # Start refreshing the neighbors of the local XBee
+            self.__mark_stale(self._local_xbee)
+            self.__refreshing = True
+
+            while not self._stop_event.is_set():
+                code = self.__refresh_nodes(self.__get_stale_nodes(max_age))
+                if code == NetworkDiscoveryStatus.CANCEL:
+                    break
+                self._stop_event.wait(time_bw_checks)
+
+            code = NetworkDiscoveryStatus.CANCEL
+        finally:
+            self.__refreshing = False
+            listener.del_route_record_received_callback(self.__refresh_route_record_cb)
+            listener.del_route_info_callback(self.__refresh_route_info_cb)
+            listener.del_modem_status_received_callback(self.__refresh_modem_status_cb)
+            self._discovery_done(self.__active_processes)
+
+        self._log.info("End network refresh for '%s'", self._local_xbee)
+        self.__device_discovery_finished(code)
+
+    def __get_stale_nodes(self, max_age):
+        """
+        Returns the nodes marked as stale and those without traffic in the
+        last `max_age` seconds, and clears the stale marks. Nodes never heard
+        are considered heard now.
+
+        Args:
+            max_age (Float): Seconds without traffic from a node to consider
+                it stale.
+
+        Returns:
+            List: List of stale nodes.
+        """
+        with self.__stale_lock:
+            stale, self.__stale = self.__stale, set()
+
+        now = time.time()
+        nodes = []
+        for node in [self._local_xbee] + self.get_devices():
+            x64 = node.get_64bit_addr()
+            if x64 in stale or self.__last_seen.setdefault(x64, now) <= now - max_age:
+                nodes.append(node)
+
+        return nodes
+
+    def __refresh_nodes(self, nodes):
+        """
+        Requests the neighbors of the given nodes, one after another, and of
+        the new nodes found while doing it.
+
+        Args:
+            nodes (List): List of stale nodes.
+
+        Returns:
+            :class:`.NetworkDiscoveryStatus`: Resulting status of the process.
+        """
+        # Stale nodes are not checked again until `max_age` expires, unless
+        # they are marked again
+        now = time.time()
+        for node in nodes:
+            self.__last_seen[node.get_64bit_addr()] = now
+
+        requesters = self._get_refresh_requesters(nodes)
+        if not requesters:
+            return NetworkDiscoveryStatus.SUCCESS
+
+        self._log.debug("")
+        self._log.debug(" [*] Refreshing %d node(s)", len(requesters))
+
+        # A new scan, so the links of the requested nodes that are not found
+        # again are marked as unknown when their requests finish (see
+        # '_node_discovery_process_finished')
+        self.__increment_scan_counter()
+        self._local_xbee._scan_counter = self.__scan_counter
+
+        known = {node.get_64bit_addr() for node in self.get_devices()}
+        known.add(self._local_xbee.get_64bit_addr())
+        requested = set()
+        # Use the nodes FIFO, the error handlers queue there the nodes to
+        # request again
+        self.__clear_queue(self._nodes_queue)
+        self.__retried.clear()
+        for node in requesters:
+            self._nodes_queue.put(node)
+            known.discard(node.get_64bit_addr())
+
+        while not self._nodes_queue.empty():
+            requester = self._nodes_queue.get()
+            x64 = requester.get_64bit_addr()
+            if x64 in self.__retried:
+                # Its previous request failed
+                self.__retried.discard(x64)
+            elif x64 in known or x64 in requested:
+                # Neighbors already in the network are not requested, only
+                # the stale and new nodes
+                continue
+            requested.add(x64)
+
+            code = self._discover_neighbors(requester, self._nodes_queue,
+                                            self.__active_processes, self._node_timeout)
+            if code == NetworkDiscoveryStatus.CANCEL:
+                return code
+
+            while self.__active_processes:
+                if self._stop_event.wait(self.__ADAPTIVE_POLL_TIME):
+                    return NetworkDiscoveryStatus.CANCEL
+
+        return NetworkDiscoveryStatus.SUCCESS
+
+    def _get_refresh_requesters(self, nodes):
+        """
+        Returns the nodes to request their neighbors to refresh the given
+        stale nodes.
+
+        A single node discovery of the local XBee finds all the nodes, so it
+        is the only requester.
+
+        Args:
+            nodes (List): List of stale nodes.
+
+        Returns:
+            List: List of nodes to request their neighbors.
+        """
+        return [self._local_xbee] if nodes else []
+
+    def __mark_stale(self, node):
+        """
+        Marks the given node as stale, so its neighbors are requested in the
+        next check of the refresh process.
+
+        Args:
+            node (:class:`.AbstractXBeeDevice`): The stale node.
+        """
+        if not node:
+            return
+
+        with self.__stale_lock:
+            self.__stale.add(node.get_64bit_addr())
+
+    def __refresh_route_record_cb(self, src, hops):
+        """
+        Callback to receive route record indicators while refreshing. If the
+        route of the source node changed, the source and the hops of both
+        routes are marked as stale.
+
+        Args:
+            src (:class:`.RemoteXBeeDevice`): The remote node that sent the
+                route record indicator frame.
+            hops (List): List of 16-bit addresses of the intermediate hops.
+        """
+        if not src:
+            return
+
+        route = tuple(hops)
+        previous = self.__route_records.get(src.get_64bit_addr())
+        self.__route_records[src.get_64bit_addr()] = route
+        if previous is None or previous == route:
+            return
 
-    def __discover_devices_and_notify_callbacks(self, discover_network=False):
+        self._log.debug(" [*] Route to %s changed, marked as stale", src)
+        self.__mark_stale(self.get_device_by_64(src.get_64bit_addr()))
+        for hop in set(previous) | set(route):
+            self.__mark_stale(self.get_device_by_16(hop))
+
+    def __refresh_route_info_cb(self, src_event, _timestamp, _ack_timeout_count,
+                                _tx_block_count, _dst_addr, _src_addr,
+                                responder_addr, successor_addr):
         """
-        Blocking method. Performs a discovery operation, waits until it finishes
-        (timeout or 'end' packet for 802.15.4), and notifies callbacks.
+        Callback to receive route information frames while refreshing. The
+        nodes of a failed hop are marked as stale.
 
-        Args:
-            discover_network (Boolean, optional, default=`False`): `True` to
-                discovery the full network with connections between nodes,
-                `False` to only discover nodes with a single 'ND'.
+        .. seealso::
+           | :class:`.RouteInformationReceived`
         """
-        self._stop_event.clear()
-        self.__last_search_dev_list.clear()
-        self.__discovering = True
-        self.__discover_result = None
+        if src_event != self.__ROUTE_INFO_NACK:
+            return
 
-        if not discover_network:
-            status = self.__discover_devices()
-            self._discovery_done(self.__active_processes)
-        else:
-            status = self._discover_full_network()
+        self._log.debug(" [*] Failed hop %s >>> %s, marked as stale",
+                        responder_addr, successor_addr)
+        for x64 in (responder_addr, successor_addr):
+            if x64 == self._local_xbee.get_64bit_addr():
+                self.__mark_stale(self._local_xbee)
+            else:
+                self.__mark_stale(self.get_device_by_64(x64))
 
-        self._log.info("End network discovery for '%s'", self._local_xbee)
-        self.__device_discovery_finished(status if status else NetworkDiscoveryStatus.SUCCESS)
+    def __refresh_modem_status_cb(self, modem_status):
+        """
+        Callback to receive modem status frames while refreshing. The local
+        XBee is marked as stale when its neighbors may have changed.
+
+        Args:
+            modem_status (:class:`.ModemStatus`): The modem status.
+        """
+        if modem_status in (ModemStatus.HARDWARE_RESET, ModemStatus.WATCHDOG_TIMER_RESET,
+                            ModemStatus.JOINED_NETWORK, ModemStatus.COORDINATOR_STARTED):
+            self.__mark_stale(self._local_xbee)
 
     def _discover_full_network(self):
         """
@@ -10030,17 +11368,12 @@ class XBeeNetwork:
                 xb_item._scan_counter = self.__scan_counter
 
         with self.__conn_lock:
-            for conn_item in self.__connections:
+            for conn_item in self.__connections.values():
                 conn_item.scan_counter_a2b = self.__scan_counter
                 conn_item.scan_counter_b2a = self.__scan_counter
 
         # Clear the nodes FIFO
-        while not nodes_queue.empty():
-            try:
-                nodes_queue.get(block=False)
-            except Empty:
-                continue
-            nodes_queue.task_done()
+        self.__clear_queue(nodes_queue)
 
         self.__purge(force=self.__rm_not_discovered_in_last_scan)
 
@@ -10051,6 +11384,33 @@ class XBeeNetwork:
 
         return NetworkDiscoveryStatus.SUCCESS
 
+    @staticmethod
+    def __clear_queue(nodes_queue):
+        """
+        Removes all the nodes from the given FIFO.
+
+        Args:
+             nodes_queue (:class:`queue.Queue`): FIFO where the nodes to
+                discover their neighbors are stored.
+        """
+        while not nodes_queue.empty():
+            try:
+                nodes_queue.get(block=False)
+            except Empty:
+                continue
+            nodes_queue.task_done()
+
+    def _request_neighbors_again(self, requester):
+        """
+        Adds the given node to the nodes FIFO to request its neighbors again
+        after an error in its previous request.
+
+        Args:
+            requester (:class:`.AbstractXBeeDevice`): XBee to request again.
+        """
+        self.__retried.add(requester.get_64bit_addr())
+        self._nodes_queue.put(requester)
+
     def _prepare_network_discovery(self):
         """
         Performs XBee configuration before starting the full network discovery.
@@ -10093,8 +11453,21 @@ class XBeeNetwork:
         self._log.debug("       Stop after scan: %d", self.__stop_scan)
         self._log.debug("       Timeout/node: %s", self._node_timeout
                         if self._node_timeout is not None else "-")
+        if self.__mode == NeighborDiscoveryMode.ADAPTIVE:
+            self._log.debug("       Max. requests: %d (%d per depth)",
+                            self.__max_requests, self.__max_requests_per_depth)
         self._log.debug("================================")
 
+        # Hop depths and attempts are calculated per scan, RTT estimates are
+        # kept between scans
+        with self.__sched_lock:
+            self.__depths = {str(self._local_xbee.get_64bit_addr()): 0}
+            self.__requests.clear()
+            self.__attempts.clear()
+            self.__window = self.__max_requests
+            self.__congestion_count = 0
+            self.__paused_until = 0
+
     def __discover_network(self, nodes_queue, active_processes, node_timeout):
         """
         Discovers the network of the local node.
@@ -10109,6 +11482,10 @@ class XBeeNetwork:
         Returns:
             :class:`.NetworkDiscoveryStatus`: Resulting status of the process.
         """
+        if self.__mode == NeighborDiscoveryMode.ADAPTIVE:
+            return self.__discover_network_adaptive(nodes_queue, active_processes,
+                                                    node_timeout)
+
         code = NetworkDiscoveryStatus.SUCCESS
 
         # Add local node to the FIFO
@@ -10156,6 +11533,242 @@ class XBeeNetwork:
 
         return code
 
+    def __discover_network_adaptive(self, nodes_queue, active_processes, node_timeout):
+        """
+        Discovers the network of the local node in 'Adaptive' mode.
+
+        Nodes in the FIFO are requested closest first, keeping up to the
+        current window of simultaneous requests and the configured maximum
+        per hop depth. A new request is sent as soon as a previous one
+        finishes, without waiting a fixed time.
+
+        Args:
+            nodes_queue (:class:`queue.Queue`): FIFO where the nodes to
+                discover their neighbors are stored.
+            active_processes (List): List of active discovery processes.
+            node_timeout (Float): Maximum number of seconds to discover
+                neighbors for each node.
+
+        Returns:
+            :class:`.NetworkDiscoveryStatus`: Resulting status of the process.
+        """
+        self.__max_node_timeout = node_timeout
+        pending = []
+
+        # Add local node to the FIFO
+        nodes_queue.put(self._local_xbee)
+
+        while True:
+            # Check for cancel
+            if self._stop_event.is_set():
+                return NetworkDiscoveryStatus.CANCEL
+
+            self.__process_finished.clear()
+
+            # Move the new nodes in the FIFO to the pending list
+            while True:
+                try:
+                    node = nodes_queue.get(block=False)
+                except Empty:
+                    break
+                nodes_queue.task_done()
+                if node not in pending:
+                    pending.append(node)
+            pending.sort(key=self.__get_depth)
+
+            code = self.__send_adaptive_requests(pending, nodes_queue,
+                                                 active_processes, node_timeout)
+            if code == NetworkDiscoveryStatus.CANCEL:
+                return code
+
+            # Check if all processes finish
+            if not pending and not active_processes and nodes_queue.empty():
+                self._check_not_discovered_nodes(self.__devices_list, nodes_queue)
+                if not nodes_queue.empty():
+                    continue
+                break
+
+            # Wait for a finished process, a new node in the FIFO or the end
+            # of a congestion pause
+            self.__process_finished.wait(
+                max(self.__ADAPTIVE_POLL_TIME, self.__paused_until - time.time()))
+
+        return NetworkDiscoveryStatus.SUCCESS
+
+    def __send_adaptive_requests(self, pending, nodes_queue, active_processes, node_timeout):
+        """
+        Sends node neighbors requests to the pending nodes, closest first,
+        while the number of active requests is below the limits.
+
+        Args:
+            pending (List): Nodes to request sorted by hop depth. Requested
+                nodes are removed from the list.
+            nodes_queue (:class:`queue.Queue`): FIFO where the nodes to
+                discover their neighbors are stored.
+            active_processes (List): List of active discovery processes.
+            node_timeout (Float): Maximum number of seconds to discover
+                neighbors for each node.
+
+        Returns:
+             :class:`.NetworkDiscoveryStatus`: Resulting status of the process.
+        """
+        idx = 0
+        while (idx < len(pending) and len(active_processes) < self.__window
+               and time.time() >= self.__paused_until):
+            requester = pending[idx]
+            key = str(requester.get_64bit_addr())
+            depth = self.__get_depth(requester)
+
+            # Keep the node if its previous request did not finish or there
+            # are too many requests to nodes at the same depth
+            with self.__sched_lock:
+                same_depth = sum(1 for req in self.__requests.values()
+                                 if req[1] == depth)
+            if key in active_processes or same_depth >= self.__max_requests_per_depth:
+                idx += 1
+                continue
+
+            pending.pop(idx)
+            timeout = self.__get_node_timeout(key, depth, node_timeout)
+
+            self._log.debug("")
+            self._log.debug(" [*] Discovering neighbors of %s (depth %d, timeout %s)",
+                            requester, depth, timeout if timeout is not None else "-")
+            with self.__sched_lock:
+                self.__requests[key] = (time.time(), depth, timeout)
+                self.__attempts[key] = self.__attempts.get(key, 0) + 1
+
+            code = self._discover_neighbors(requester, nodes_queue,
+                                            active_processes, timeout)
+            if code == NetworkDiscoveryStatus.CANCEL:
+                return code
+
+        return NetworkDiscoveryStatus.SUCCESS
+
+    def __get_depth(self, node):
+        """
+        Returns the hop depth of the given node in the current scan. Nodes
+        with unknown depth are considered direct neighbors of the local node.
+
+        Args:
+            node (:class:`.AbstractXBeeDevice`): The node to get its depth.
+
+        Returns:
+            Integer: The hop depth of the node.
+        """
+        return self.__depths.get(str(node.get_64bit_addr()), 1)
+
+    def __update_depths(self, node_a, node_b):
+        """
+        Updates the hop depth of the ends of a new connection: a node is one
+        hop further than its closest known neighbor.
+
+        Args:
+            node_a (:class:`.AbstractXBeeDevice`): One end of the connection.
+            node_b (:class:`.AbstractXBeeDevice`): Other end of the connection.
+        """
+        key_a = str(node_a.get_64bit_addr())
+        key_b = str(node_b.get_64bit_addr())
+        with self.__sched_lock:
+            depth_a = self.__depths.get(key_a)
+            depth_b = self.__depths.get(key_b)
+            if depth_a is not None and (depth_b is None or depth_b > depth_a + 1):
+                self.__depths[key_b] = depth_a + 1
+            elif depth_b is not None and (depth_a is None or depth_a > depth_b + 1):
+                self.__depths[key_a] = depth_b + 1
+
+    def __get_node_timeout(self, key, depth, node_timeout):
+        """
+        Returns the timeout for the next node neighbors request of a node. It
+        is calculated as the smoothed RTT plus four times the RTT variation
+        (RFC 6298) of the node, or of the nodes at the same depth if the node
+        has not answered yet, between a minimum value and `node_timeout`.
+
+        Args:
+            key (String): 64-bit address of the node.
+            depth (Integer): Hop depth of the node.
+            node_timeout (Float): Maximum number of seconds to discover
+                neighbors for each node.
+
+        Returns:
+            Float: The timeout in seconds, `node_timeout` if there is no RTT
+                measure yet.
+        """
+        with self.__sched_lock:
+            rtt = self.__node_rtts.get(key) or self.__depth_rtts.get(depth)
+        if not rtt:
+            return node_timeout
+
+        timeout = max(self.__MIN_ADAPTIVE_NODE_TIMEOUT, rtt[0] + 4 * rtt[1])
+        if node_timeout:
+            timeout = min(timeout, node_timeout)
+
+        return timeout
+
+    def __update_schedule(self, requester, error):
+        """
+        Updates the 'Adaptive' mode scheduler with the result of a finished
+        node neighbors request:
+
+          * On success, the RTT estimates of the node and its depth are
+            updated and the window of simultaneous requests grows (by one
+            each full window of successful requests).
+          * On congestion (transmit status 'CCA failure', 'No buffers',
+            'No acknowledgement received' or resource errors) the window is
+            halved, new requests are paused with an exponential backoff and
+            the node is requested again.
+          * On timeout, the node is requested again with the double timeout
+            while it is below the maximum.
+
+        Args:
+            requester (:class:`.AbstractXBeeDevice`): XBee that requested the
+                discovery process.
+            error (String): Error message, `None` if successfully finished.
+
+        Returns:
+            Boolean: `True` if the node must be requested again, `False`
+                otherwise.
+        """
+        key = str(requester.get_64bit_addr())
+        with self.__sched_lock:
+            request = self.__requests.pop(key, None)
+            if not request:
+                return False
+
+            start, depth, timeout = request
+            if not error:
+                rtt = time.time() - start
+                srtt, rttvar = self.__node_rtts.get(key) \
+                    or self.__depth_rtts.get(depth) or (rtt, rtt / 2)
+                rttvar = 0.75 * rttvar + 0.25 * abs(srtt - rtt)
+                srtt = 0.875 * srtt + 0.125 * rtt
+                self.__node_rtts[key] = self.__depth_rtts[depth] = (srtt, rttvar)
+                self.__window = min(self.__max_requests, self.__window + 1 / self.__window)
+                self.__congestion_count = 0
+                return False
+
+            if self.__attempts.get(key, 0) >= self.__MAX_ADAPTIVE_ATTEMPTS:
+                return False
+
+            if any(status.description in error for status in (
+                    TransmitStatus.CCA_FAILURE, TransmitStatus.NO_BUFFERS,
+                    TransmitStatus.NO_ACK, TransmitStatus.RESOURCE_ERROR)):
+                self.__window = max(1, self.__window / 2)
+                pause = min(self.__MAX_CONGESTION_PAUSE, 2 ** self.__congestion_count)
+                self.__congestion_count += 1
+                self.__paused_until = time.time() + pause
+                self._log.debug("     o [***] Congestion, pause %d s, max. requests %d",
+                                pause, int(self.__window))
+                return True
+
+            if (error.endswith("answer not received") and timeout
+                    and (not self.__max_node_timeout or timeout < self.__max_node_timeout)):
+                # Next timeout: srtt + 4 * rttvar = 2 * timeout
+                self.__node_rtts[key] = (timeout, timeout / 4)
+                return True
+
+        return False
+
     def __discover_next_node_neighbors(self, nodes_queue, active_processes, node_timeout):
         """
         Discovers the neighbors of the next node in the given FIFO.
@@ -10325,6 +11938,9 @@ class XBeeNetwork:
         if str(requester.get_64bit_addr()) in self.__active_processes:
             self.__active_processes.remove(str(requester.get_64bit_addr()))
 
+        retry = (self.__mode == NeighborDiscoveryMode.ADAPTIVE
+                 and self.__update_schedule(requester, error))
+
         if code and code not in (NetworkDiscoveryStatus.SUCCESS,
                                  NetworkDiscoveryStatus.CANCEL) or error:
             self._log.debug("[***** ERROR] During neighbors scan of %s", requester)
@@ -10333,11 +11949,17 @@ class XBeeNetwork:
             else:
                 self._log.debug("        %s", code.description)
 
-            self._handle_special_errors(requester, error)
+            if retry:
+                self._log.debug("     o Requesting again %s", requester)
+                self._request_neighbors_again(requester)
+            else:
+                self._handle_special_errors(requester, error)
         else:
             self._log.debug("[!!!] Process finishes for %s  - Remaining: %d",
                             requester, len(self.__active_processes))
 
+        self.__process_finished.set()
+
     def _handle_special_errors(self, requester, error):
         """
         Process some special errors.
@@ -10643,7 +12265,7 @@ class XBeeNetwork:
            | :meth:`.XBeeNetwork.start_discovery_process`
         """
         with self.__conn_lock:
-            return self.__connections.copy()
+            return list(self.__connections.values())
 
     def get_node_connections(self, node):
         """
@@ -10666,13 +12288,174 @@ class XBeeNetwork:
            | :meth:`.XBeeNetwork.get_connections`
            | :meth:`.XBeeNetwork.start_discovery_process`
         """
-        connections = []
         with self.__conn_lock:
-            for conn in self.__connections:
-                if conn.node_a == node or conn.node_b == node:
-                    connections.append(conn)
+            return list(self.__adjacency.get(node.get_64bit_addr(), {}).values())
+
+    def get_node_degree(self, node):
+        """
+        Returns the number of network connections with one of their ends
+        `node`.
+
+        Args:
+            node (:class:`.AbstractXBeeDevice`): The node to get its degree.
+
+        Returns:
+            Integer: The number of connections of the node.
+
+        .. seealso::
+           | :meth:`.XBeeNetwork.get_node_connections`
+        """
+        with self.__conn_lock:
+            return len(self.__adjacency.get(node.get_64bit_addr(), {}))
+
+    def get_shortest_path(self, node_from, node_to):
+        """
+        Returns the best path between two nodes using the known network
+        connections. Each hop costs 1 plus a penalty between 0 and 1 that
+        depends on the worst known link quality of the connection, so the
+        path with less hops is preferred and, among those with the same
+        number of hops, the one with better links.
+
+        A deep discover must be performed to get the connections between
+        network nodes.
+
+        Args:
+            node_from (:class:`.AbstractXBeeDevice`): Start node of the path.
+            node_to (:class:`.AbstractXBeeDevice`): End node of the path.
+
+        Returns:
+            List: List of nodes (:class:`.AbstractXBeeDevice`) of the path,
+                from `node_from` to `node_to` both included, `None` if there
+                is no path between them.
+
+        .. seealso::
+           | :meth:`.XBeeNetwork.get_connections`
+           | :meth:`.XBeeNetwork.start_discovery_process`
+        """
+        src = node_from.get_64bit_addr()
+        dst = node_to.get_64bit_addr()
+        if src == dst:
+            return [node_from]
+
+        with self.__conn_lock:
+            costs = {src: 0}
+            previous = {}
+            done = set()
+            # Heap entries: (cost, counter, 64-bit address, node)
+            heap = [(0, 0, src, node_from)]
+            counter = 1
+            while heap:
+                cost, _, x64, node = heapq.heappop(heap)
+                if x64 in done:
+                    continue
+                done.add(x64)
+                if x64 == dst:
+                    break
+                for nb_x64, conn in self.__adjacency.get(x64, {}).items():
+                    if nb_x64 in done:
+                        continue
+                    nb_cost = cost + 1 + self.__link_penalty(conn)
+                    if nb_cost < costs.get(nb_x64, float("inf")):
+                        costs[nb_x64] = nb_cost
+                        neighbor = conn.node_b \
+                            if conn.node_a.get_64bit_addr() == x64 else conn.node_a
+                        previous[nb_x64] = (x64, node)
+                        heapq.heappush(heap, (nb_cost, counter, nb_x64, neighbor))
+                        counter += 1
+            else:
+                return None
+
+        path = [node_to]
+        x64 = dst
+        while x64 != src:
+            x64, node = previous[x64]
+            path.append(node)
+        path.reverse()
+
+        return path
+
+    def get_articulation_points(self):
+        """
+        Returns the nodes whose failure splits the network in several parts,
+        that is, nodes that are the only link between two groups of nodes,
+        using the known network connections.
+
+        A deep discover must be performed to get the connections between
+        network nodes.
+
+        Returns:
+            List: List of nodes (:class:`.AbstractXBeeDevice`).
+
+        .. seealso::
+           | :meth:`.XBeeNetwork.get_connections`
+           | :meth:`.XBeeNetwork.start_discovery_process`
+        """
+        points = {}
+        with self.__conn_lock:
+            order = {}
+            low = {}
+            for root in self.__adjacency:
+                if root in order:
+                    continue
+                # Iterative depth first search (Tarjan): stack entries are
+                # (64-bit address, parent 64-bit address, neighbors iterator)
+                order[root] = low[root] = len(order)
+                root_children = 0
+                stack = [(root, None, iter(self.__adjacency[root].items()))]
+                while stack:
+                    x64, parent, neighbors = stack[-1]
+                    for nb_x64, conn in neighbors:
+                        if nb_x64 == parent:
+                            continue
+                        if nb_x64 in order:
+                            low[x64] = min(low[x64], order[nb_x64])
+                            continue
+                        order[nb_x64] = low[nb_x64] = len(order)
+                        if x64 == root:
+                            root_children += 1
+                        stack.append((nb_x64, x64, iter(self.__adjacency[nb_x64].items())))
+                        break
+                    else:
+                        stack.pop()
+                        if parent is None:
+                            continue
+                        low[parent] = min(low[parent], low[x64])
+                        if parent != root and low[x64] >= order[parent]:
+                            conn = self.__adjacency[parent][x64]
+                            points[parent] = conn.node_a \
+                                if conn.node_a.get_64bit_addr() == parent else conn.node_b
+                if root_children > 1:
+                    conn = next(iter(self.__adjacency[root].values()))
+                    points[root] = conn.node_a \
+                        if conn.node_a.get_64bit_addr() == root else conn.node_b
+
+        return list(points.values())
 
-        return connections
+    @staticmethod
+    def __link_penalty(connection):
+        """
+        Returns the penalty, between 0 (best) and 1 (worst or unknown), of the
+        worst known link quality of the provided connection.
+
+        Args:
+            connection (:class:`.Connection`): The connection.
+
+        Returns:
+            Float: The penalty of the connection.
+        """
+        penalties = []
+        for link in (connection.lq_a2b, connection.lq_b2a):
+            value = getattr(link, "lq", link)
+            if value is None or value == LinkQuality.UNKNOWN_VALUE:
+                continue
+            if getattr(link, "is_rssi", False):
+                # RSSI in -dBm: 0 (best) to 100 (worst)
+                penalties.append(min(max(value, 0), 100) / 100)
+            else:
+                # LQI: 255 (best) to 0 (worst)
+                penalties.append((255 - min(max(value, 0), 255)) / 255)
+
+        return max(penalties) if penalties else 1
 
     def __get_connections_for_node_a_b(self, node, node_a=True):
         """
@@ -10688,14 +12471,10 @@ class XBeeNetwork:
         Returns:
             List: List of :class:`.Connection` with `node` as `node_a` end.
         """
-        connections = []
+        x64 = node.get_64bit_addr()
         with self.__conn_lock:
-            for conn in self.__connections:
-                if ((node_a and conn.node_a == node)
-                        or (not node_a and conn.node_b == node)):
-                    connections.append(conn)
-
-        return connections
+            return [conn for conn in self.__adjacency.get(x64, {}).values()
+                    if (conn.node_a if node_a else conn.node_b).get_64bit_addr() == x64]
 
     def __get_connection(self, node_a, node_b):
         """
@@ -10717,15 +12496,9 @@ class XBeeNetwork:
         if not node_b:
             raise ValueError("Node B cannot be None")
 
-        conn = Connection(node_a, node_b)
-
         with self.__conn_lock:
-            if conn not in self.__connections:
-                return None
-
-            index = self.__connections.index(conn)
-
-            return self.__connections[index]
+            return self.__connections.get(
+                (node_a.get_64bit_addr(), node_b.get_64bit_addr()))
 
     def __append_connection(self, connection):
         """
@@ -10741,7 +12514,7 @@ class XBeeNetwork:
             raise ValueError("Connection cannot be None")
 
         with self.__conn_lock:
-            self.__connections.append(connection)
+            self.__link_connection(connection)
 
     def __del_connection(self, connection):
         """
@@ -10757,8 +12530,41 @@ class XBeeNetwork:
             raise ValueError("Connection cannot be None")
 
         with self.__conn_lock:
-            if connection in self.__connections:
-                self.__connections.remove(connection)
+            self.__unlink_connection(connection)
+
+    def __link_connection(self, connection):
+        """
+        Adds a connection to the connections map and the adjacency map. The
+        connections lock must be held by the caller.
+
+        Args:
+            connection (:class:`.Connection`): The connection to add.
+        """
+        x64_a = connection.node_a.get_64bit_addr()
+        x64_b = connection.node_b.get_64bit_addr()
+        self.__connections[(x64_a, x64_b)] = connection
+        self.__adjacency.setdefault(x64_a, {})[x64_b] = connection
+        self.__adjacency.setdefault(x64_b, {})[x64_a] = connection
+
+    def __unlink_connection(self, connection):
+        """
+        Removes a connection from the connections map and the adjacency map.
+        The connections lock must be held by the caller.
+
+        Args:
+            connection (:class:`.Connection`): The connection to remove.
+        """
+        key = (connection.node_a.get_64bit_addr(), connection.node_b.get_64bit_addr())
+        stored = self.__connections.pop(key, None)
+        if stored is None:
+            return
+
+        for x64, other in (key, key[::-1]):
+            neighbors = self.__adjacency.get(x64)
+            if neighbors is not None and neighbors.get(other) is stored:
+                del neighbors[other]
+                if not neighbors:
+                    del self.__adjacency[x64]
 
     def _add_connection(self, connection):
         """
@@ -10788,6 +12594,8 @@ class XBeeNetwork:
         if not node_a or not node_b:
             return False
 
+        self.__update_depths(node_a, node_b)
+
         # Check if the connection already exists a -> b or b -> a
         c_ab = self.__get_connection(node_a, node_b)
         c_ba = self.__get_connection(node_b, node_a)
@@ -10840,7 +12648,7 @@ class XBeeNetwork:
             c_removed[:] = node_conn[:]
             for conn in node_conn:
                 if force:
-                    self.__connections.remove(conn)
+                    self.__unlink_connection(conn)
                 else:
                     conn.lq_a2b = LinkQuality.UNKNOWN
 
@@ -10904,7 +12712,7 @@ class XBeeNetwork:
         """
         connections_to_remove = []
         with self.__conn_lock:
-            for conn in self.__connections:
+            for conn in self.__connections.values():
                 if (conn.scan_counter_a2b != self.__scan_counter
                         and conn.scan_counter_b2a != self.__scan_counter):
                     conn.lq_a2b = LinkQuality.UNKNOWN
@@ -11068,10 +12876,29 @@ class ZigBeeNetwork(XBeeNetwork):
                 x16 = XBee16BitAddress(
                     requester.get_parameter(ATStringCommand.MY, apply=False))
                 if x16_orig != x16:
-                    self._nodes_queue.put(requester)
+                    self._request_neighbors_again(requester)
             except XBeeException:
                 pass
 
+    def _get_refresh_requesters(self, nodes):
+        """
+        Override.
+
+        End devices have no neighbor table, their parents are requested
+        instead.
+
+        .. seealso::
+           | :meth:`.XBeeNetwork._get_refresh_requesters`
+        """
+        requesters = []
+        for node in nodes:
+            if node.get_role() == Role.END_DEVICE:
+                node = getattr(node, "parent", None)
+            if node and node not in requesters:
+                requesters.append(node)
+
+        return requesters
+
     def _check_not_discovered_nodes(self, devices_list, nodes_queue):
         """
         Override.
@@ -11145,7 +12972,7 @@ class ZigBeeNetwork(XBeeNetwork):
                 self._log.warning("Unable to restore 'AO0 value: %s", str(exc))
 
             # Add the node to the FIFO to try again
-            self._nodes_queue.put(requester)
+            self._request_neighbors_again(requester)
 
     def __enable_explicit_mode(self):
         """
@@ -11615,6 +13442,15 @@ class DigiMeshNetwork(XBeeNetwork):
 
         return NetworkDiscoveryStatus.SUCCESS
 
+    def _get_refresh_requesters(self, nodes):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`.XBeeNetwork._get_refresh_requesters`
+        """
+        return list(nodes)
+
     def _check_not_discovered_nodes(self, devices_list, nodes_queue):
         """
         Override.
@@ -11791,13 +13627,10 @@ class NetworkEventType(Enum):
             :class:`.NetworkEventType`: the `NetworkEventType` with the given
                 code, `None` if there is not any event with the provided code.
         """
-        for ev_type in cls:
-            if ev_type.code == code:
-                return ev_type
-
-        return None
+        return cls.lookupTable.get(code)
 
 
+NetworkEventType.lookupTable = utils.enum_lookup_table(NetworkEventType)
 NetworkEventType.__doc__ += utils.doc_enum(NetworkEventType)
 
 
@@ -11814,6 +13647,7 @@ class NetworkEventReason(Enum):
     ROUTE = (0x04, "Hop of a network route")
     READ_INFO = (0x05, "Read XBee information")
     FIRMWARE_UPDATE = (0x06, "The firmware of the device was updated")
+    CACHED = (0x07, "Restored from a stored network")
 
     def __init__(self, code, description):
         self.__code = code
@@ -11851,13 +13685,10 @@ class NetworkEventReason(Enum):
             :class:`.NetworkEventReason`: the `NetworkEventReason` with the
                 given code, `None` if there is not any reason with the provided code.
         """
-        for reason in cls:
-            if reason.code == code:
-                return reason
-
-        return None
+        return cls.lookupTable.get(code)
 
 
+NetworkEventReason.lookupTable = utils.enum_lookup_table(NetworkEventReason)
 NetworkEventReason.__doc__ += utils.doc_enum(NetworkEventReason)
 
 
@@ -11922,7 +13753,7 @@ class LinkQuality:
         Returns:
              Boolean: `True` if this is an RSSI value, `False` for LQI.
         """
-        return self.__lq
+        return self.__is_rssi
 
 
 LinkQuality.UNKNOWN = LinkQuality(lq=LinkQuality.UNKNOWN_VALUE)
@@ -24,6 +24,7 @@ from enum import Enum
 from os import listdir
 from os.path import isfile
 from pathlib import PurePosixPath
+from queue import Queue, Empty
 from serial.serialutil import SerialException
 
 from digi.xbee.exception import XBeeException, OperationNotSupportedException
@@ -39,6 +40,7 @@ from digi.xbee.models.protocol import XBeeProtocol
 from digi.xbee.models.status import TransmitStatus, FSCommandStatus
 from digi.xbee.packets.filesystem import RemoteFSRequestPacket, FSRequestPacket
 from digi.xbee.util import xmodem, utils
+from digi.xbee.util.imagesource import ImageSource
 from digi.xbee.util.xmodem import XModemException
 
 _ANSWER_ATFS = "AT%s" % ATStringCommand.FS.command
@@ -102,6 +104,12 @@ _DEFAULT_BLOCK_SIZE = 64
 
 _TRANSFER_TIMEOUT = 5  # Seconds.
 
+_MAX_WINDOW = 16
+_WINDOW_RETRIES = 3
+_WINDOW_MIN_RTO = 0.2  # Seconds.
+# Number of windows of data read or written by each step of a get/put.
+_WINDOWS_PER_STEP = 4
+
 _log = logging.getLogger(__name__)
 _printable_ascii_bytes = string.printable.encode()
 
@@ -145,11 +153,7 @@ class _FilesystemFunction(Enum):
                 name, `None` if there is not a `_FilesystemFunction` with the
                 provided name.
         """
-        for value in _FilesystemFunction:
-            if value.name == name:
-                return value
-
-        return None
+        return cls.lookupTable.get(name)
 
     @property
     def name(self):
@@ -172,6 +176,9 @@ class _FilesystemFunction(Enum):
         return self.__command
 
 
+_FilesystemFunction.lookupTable = utils.enum_lookup_table(_FilesystemFunction, "name")
+
+
 class FileSystemElement:
     """
     Class used to represent XBee file system elements (files and directories).
@@ -470,6 +477,154 @@ class _FSFrameSender:
         raise FileSystemException(exc_msg_fmt % msg, fs_status=status)
 
 
+class _FSWindowSender:
+    """
+    Helper class used to send several file system frames to the same XBee
+    keeping a window of them waiting for their responses.
+
+    The window grows while the round trip time does not, and it is halved
+    when a response is not received in the retransmission timeout (smoothed
+    RTT plus four times the RTT variation). Only the frames without response
+    are sent again, with a new frame id, so a late response to a previous
+    transmission is discarded.
+    """
+
+    def __init__(self, xbee, max_window, timeout):
+        """
+        Class constructor. Instantiates a new :class:`._FSWindowSender` with
+        the given parameters.
+
+        Args:
+            xbee (:class:`.AbstractXBeeDevice`): Destination XBee.
+            max_window (Integer): Maximum number of frames waiting for response.
+            timeout (Float): Maximum number of seconds to wait for a response.
+        """
+        self.__xbee = xbee
+        self.__max_window = max_window
+        self.__timeout = timeout
+        self.__responses = Queue()
+        self.__frame_ids = {}
+
+    def __str__(self):
+        return "File system window sender (dst: %s)" % self.__xbee
+
+    def _fs_frame_cb(self, xbee, frame_id, cmd, _receive_opts):
+        """
+        Callback to execute when a new frame id is received.
+
+        .. seealso::
+           | :meth:`._FSFrameSender._fs_frame_cb`
+        """
+        if frame_id in self.__frame_ids and xbee == self.__xbee:
+            self.__responses.put((frame_id, cmd))
+
+    def send(self, cmds, response_cb):
+        """
+        Sends the provided file system commands and waits for their responses.
+
+        Args:
+            cmds (List): List of :class:`.FSCmd` to send.
+            response_cb (Function): Method called with each successful
+                response, in the order of the commands. Receives two
+                arguments:
+
+                * The index of the command (Integer).
+                * The response command (:class:`.FSCmd`).
+
+        Returns:
+            Integer: Status of the first failed command or of the last one.
+                See :class:`.FSCommandStatus`.
+
+        Raises:
+            FileSystemException: If a command is not answered after retrying.
+        """
+        local_xb = self.__xbee
+        if self.__xbee.is_remote():
+            local_xb = self.__xbee.get_local_xbee_device()
+
+        window = 1.0
+        srtt = rttvar = min_rtt = None
+        rto = self.__timeout
+        in_flight = {}  # Command index -> (sent time, retries, frame id)
+        results = {}
+        next_idx = 0
+        deliver_idx = 0
+        status = FSCommandStatus.SUCCESS.code
+
+        def _send(idx, retries):
+            if idx in in_flight:
+                self.__frame_ids.pop(in_flight[idx][2], None)
+            frame = FileSystemManager._create_fs_frame(self.__xbee, cmds[idx])
+            self.__frame_ids[frame.frame_id] = idx
+            in_flight[idx] = (time.time(), retries, frame.frame_id)
+            try:
+                local_xb.send_packet(frame)
+            except XBeeException as exc:
+                _FSFrameSender(self.__xbee)._throw_fs_exc(cmds[idx], str(exc))
+
+        local_xb.add_fs_frame_received_callback(self._fs_frame_cb)
+        try:
+            while deliver_idx < len(cmds):
+                while len(in_flight) < int(window) and next_idx < len(cmds):
+                    _send(next_idx, 0)
+                    next_idx += 1
+
+                deadline = min(val[0] for val in in_flight.values()) + rto
+                try:
+                    frame_id, cmd = self.__responses.get(
+                        timeout=max(0, deadline - time.time()))
+                except Empty:
+                    # Retransmit only the expired commands
+                    now = time.time()
+                    for idx, (sent, retries, _f_id) in list(in_flight.items()):
+                        if sent + rto > now:
+                            continue
+                        if retries >= _WINDOW_RETRIES:
+                            _FSFrameSender(self.__xbee)._throw_fs_exc(
+                                cmds[idx], "Response not received in timeout")
+                        _log.debug("%s: retransmitting %s (%d)", str(self),
+                                   cmds[idx].type.description, idx)
+                        _send(idx, retries + 1)
+                    window = max(1.0, window / 2)
+                    rto = min(rto * 2, self.__timeout)
+                    continue
+
+                idx = self.__frame_ids.pop(frame_id, None)
+                if idx is None or idx not in in_flight or cmd.type != cmds[idx].type:
+                    continue
+                sent, retries, _f_id = in_flight.pop(idx)
+
+                if cmd.status_value != FSCommandStatus.SUCCESS.code:
+                    status = cmd.status_value
+                    break
+
+                # Karn's algorithm: only use RTT of not retransmitted commands
+                if not retries:
+                    rtt = time.time() - sent
+                    if srtt is None:
+                        srtt, rttvar, min_rtt = rtt, rtt / 2, rtt
+                    else:
+                        rttvar = 0.75 * rttvar + 0.25 * abs(srtt - rtt)
+                        srtt = 0.875 * srtt + 0.125 * rtt
+                        min_rtt = min(min_rtt, rtt)
+                    rto = min(max(srtt + 4 * rttvar, _WINDOW_MIN_RTO), self.__timeout)
+                    # Grow while queuing does not increase the RTT
+                    if rtt < 2 * min_rtt:
+                        window = min(self.__max_window, window + 1)
+                    else:
+                        window = max(1.0, window - 1)
+
+                results[idx] = cmd
+                while deliver_idx in results:
+                    response_cb(deliver_idx, results.pop(deliver_idx))
+                    deliver_idx += 1
+        finally:
+            local_xb.del_fs_frame_received_callback(self._fs_frame_cb)
+            self.__frame_ids.clear()
+
+        return status
+
+
 class FileProcess(metaclass=ABCMeta):
     """
     This class represents a file process.
@@ -648,7 +803,8 @@ class FileProcess(metaclass=ABCMeta):
 
 class _ReadFileProcess(FileProcess):
 
-    def __init__(self, f_mng, file, offset, timeout, read_callback=None):
+    def __init__(self, f_mng, file, offset, timeout, read_callback=None,
+                 window=1):
         """
         Override.
 
@@ -661,13 +817,18 @@ class _ReadFileProcess(FileProcess):
                 * The progress percentage as float.
                 * The total size of the file.
                 * The completion status code (integer). See `.FSCommandStatus`.
+            window (Integer, optional, default=1): Maximum number of read
+                requests waiting for response.
         """
         if offset is not None and not isinstance(offset, int) or offset < 0:
             raise ValueError("Offset must be 0 or greater")
+        if not isinstance(window, int) or window not in range(1, _MAX_WINDOW + 1):
+            raise ValueError("Window must be between 1 and %d" % _MAX_WINDOW)
 
         super().__init__(f_mng, file, timeout)
         self.__offset = offset
         self.__l_off = offset
+        self.__window = window
         self._cb = read_callback
         self.__size = 0
         self.__data = bytearray()
@@ -774,6 +935,11 @@ class _ReadFileProcess(FileProcess):
         chunk_len = min(self.block_size, remain_to_read)
         _log.debug(self._log_str("Block size: %d", chunk_len))
 
+        if self.__window > 1 and chunk_len < remain_to_read:
+            if not self.__read_window(chunk_len, remain_to_read):
+                return True
+            chunk_len = min(chunk_len, remain_to_read - len(self.__data))
+
         while (chunk_len and len(self.__data) < remain_to_read
                and self.__l_off < self._fsize):
             _log.debug(self._log_str("Reading, offset: %d, size: %d",
@@ -802,6 +968,45 @@ class _ReadFileProcess(FileProcess):
 
         return self.__l_off >= self._fsize
 
+    def __read_window(self, chunk_len, remain_to_read):
+        """
+        Reads the provided amount of data keeping several read requests
+        waiting for response. If a chunk is shorter than requested, the
+        following responses are discarded and the rest of the data must be
+        read sequentially.
+
+        Args:
+            chunk_len (Integer): Size of each read request.
+            remain_to_read (Integer): Number of bytes to read.
+
+        Returns:
+            Boolean: `True` if the read was successful, `False` otherwise.
+        """
+        cmds = []
+        for off in range(0, remain_to_read, chunk_len):
+            cmds.append(ReadFileCmdRequest(
+                self._fid, self.__l_off + off,
+                min(chunk_len, remain_to_read - off)))
+
+        _log.debug(self._log_str("Reading %d blocks (window: %d)",
+                                 len(cmds), self.__window))
+
+        def _read_cb(idx, resp):
+            # Discard responses after an incomplete one
+            if cmds[idx].offset != self.__l_off:
+                return
+            chunk = resp.data
+            self.__data += chunk
+            self.__l_off += len(chunk)
+            if self._cb:
+                self._cb(chunk, len(self.__data) * 100 / remain_to_read,
+                         self._fsize, FSCommandStatus.SUCCESS.code)
+
+        self._status = _FSWindowSender(
+            self._f_mng.xbee, self.__window, self._timeout).send(cmds, _read_cb)
+
+        return self._status == FSCommandStatus.SUCCESS.code
+
     def _notify_process_finished(self):
         """
         Override.
@@ -815,7 +1020,8 @@ class _ReadFileProcess(FileProcess):
 
 class _WriteFileProcess(FileProcess):
 
-    def __init__(self, f_mng, file, offset, options, timeout, write_callback=None):
+    def __init__(self, f_mng, file, offset, options, timeout, write_callback=None,
+                 window=1):
         """
         Override.
 
@@ -826,13 +1032,18 @@ class _WriteFileProcess(FileProcess):
                 * The amount of bytes written in the chunk.
                 * The progress percentage as float.
                 * The completion status code (integer). See `.FSCommandStatus`.
+            window (Integer, optional, default=1): Maximum number of write
+                requests waiting for response.
         """
         if offset is not None and not isinstance(offset, int) or offset < 0:
             raise ValueError("Offset must be 0 or greater")
+        if not isinstance(window, int) or window not in range(1, _MAX_WINDOW + 1):
+            raise ValueError("Window must be between 1 and %d" % _MAX_WINDOW)
 
         super().__init__(f_mng, file, timeout)
         self.__offset = offset
         self.__options = options
+        self.__window = window
         self._cb = write_callback
         self.__n_bytes = 0
         self.__data = bytearray()
@@ -921,6 +1132,12 @@ class _WriteFileProcess(FileProcess):
         chunk_len = min(self.block_size, len(self.__data))
         _log.debug(self._log_str("Block size: %d", chunk_len))
 
+        if self.__window > 1 and chunk_len < len(self.__data):
+            if not self.__write_window(chunk_len):
+                return True
+            data_offset = len(self.__data)
+            last_offset = self.__offset + data_offset
+
         while chunk_len and data_offset < len(self.__data):
             _log.debug(self._log_str("Writing, offset: %d, size: %d",
                                      last_offset, chunk_len))
@@ -946,6 +1163,39 @@ class _WriteFileProcess(FileProcess):
 
         return False
 
+    def __write_window(self, chunk_len):
+        """
+        Writes the data keeping several write requests waiting for response.
+        Each request includes its file offset, so a retransmitted or reordered
+        request writes its data in the right position.
+
+        Args:
+            chunk_len (Integer): Size of each write request.
+
+        Returns:
+            Boolean: `True` if the write was successful, `False` otherwise.
+        """
+        cmds = []
+        for off in range(0, len(self.__data), chunk_len):
+            cmds.append(WriteFileCmdRequest(
+                self._fid, self.__offset + off,
+                data=bytearray(self.__data[off:off + chunk_len])))
+
+        _log.debug(self._log_str("Writing %d blocks (window: %d)",
+                                 len(cmds), self.__window))
+
+        def _write_cb(idx, _resp):
+            n_bytes = len(cmds[idx].data)
+            self.__n_bytes += n_bytes
+            if self._cb:
+                self._cb(n_bytes, self.__n_bytes * 100 / len(self.__data),
+                         FSCommandStatus.SUCCESS.code)
+
+        self._status = _FSWindowSender(
+            self._f_mng.xbee, self.__window, self._timeout).send(cmds, _write_cb)
+
+        return self._status == FSCommandStatus.SUCCESS.code
+
     def _notify_process_finished(self):
         """
         Override.
@@ -1244,7 +1494,7 @@ class FileSystemManager:
         if status != FSCommandStatus.SUCCESS.code:
             _raise_exception(status, "Error removing entry '%s'" % entry_path)
 
-    def read_file(self, file, offset=0, progress_cb=None):
+    def read_file(self, file, offset=0, progress_cb=None, window=1):
         """
         Reads from the provided file starting at the given offset.
         If there is no progress callback the function blocks
@@ -1262,6 +1512,10 @@ class FileSystemManager:
                     * The progress percentage as float.
                     * The total size of the file.
                     * The status when process finishes.
+            window (Integer, optional, default=1): Maximum number of read
+                requests waiting for response, from 1 to 16. A value greater
+                than 1 sends the next requests without waiting for the previous
+                responses, and only retransmits the unanswered ones.
 
         Returns:
             :class:`.FileProcess`: The process to read data from the file.
@@ -1275,9 +1529,10 @@ class FileSystemManager:
            | :meth:`.get_file`
         """
         return _ReadFileProcess(self, file, offset, self.DEFAULT_TIMEOUT,
-                                read_callback=progress_cb)
+                                read_callback=progress_cb, window=window)
 
-    def write_file(self, file, offset=0, secure=False, options=None, progress_cb=None):
+    def write_file(self, file, offset=0, secure=False, options=None, progress_cb=None,
+                   window=1):
         """
         Writes to the provided file the data starting at the given offset. The
         function blocks until the all data is written.
@@ -1296,6 +1551,10 @@ class FileSystemManager:
                     * The amount of bytes written (for each chunk).
                     * The progress percentage as float.
                     * The status when process finishes.
+            window (Integer, optional, default=1): Maximum number of write
+                requests waiting for response, from 1 to 16. A value greater
+                than 1 sends the next requests without waiting for the previous
+                responses, and only retransmits the unanswered ones.
 
         Raises:
             FileSystemException: If there is any error performing the operation
@@ -1321,9 +1580,10 @@ class FileSystemManager:
             wr_options |= FileOpenRequestOption.APPEND
 
         return _WriteFileProcess(self, file, offset, wr_options,
-                                 self.DEFAULT_TIMEOUT, write_callback=progress_cb)
+                                 self.DEFAULT_TIMEOUT, write_callback=progress_cb,
+                                 window=window)
 
-    def get_file(self, src, dest, progress_cb=None):
+    def get_file(self, src, dest, progress_cb=None, window=1):
         """
         Downloads the given XBee file in the specified destination path.
 
@@ -1337,6 +1597,8 @@ class FileSystemManager:
                     * The progress percentage as float.
                     * Destination file path.
                     * Source file path.
+            window (Integer, optional, default=1): Maximum number of read
+                requests waiting for response. See :meth:`.read_file`.
 
         Raises:
             FileSystemException: If there is any error performing the operation
@@ -1362,8 +1624,11 @@ class FileSystemManager:
                 progress_cb(total_read * 100.0 / size, dest, src_path)
 
         with open(dest, "wb+") as dst_file:
-            r_proc = self.read_file(src, offset=0, progress_cb=p_cb)
+            r_proc = self.read_file(src, offset=0, progress_cb=p_cb,
+                                    window=window)
             size = r_proc.block_size
+            if window > 1:
+                size *= window * _WINDOWS_PER_STEP
             while True:
                 try:
                     data = r_proc.next(size=size, last=False)
@@ -1375,7 +1640,7 @@ class FileSystemManager:
                     raise exc
 
     def put_file(self, src, dest, secure=False, overwrite=False,
-                 mk_parents=True, progress_cb=None):
+                 mk_parents=True, progress_cb=None, window=1):
         """
         Uploads the given file to the specified destination path of the XBee.
 
@@ -1395,6 +1660,8 @@ class FileSystemManager:
                     * The progress percentage as float.
                     * Destination file path.
                     * Source file path.
+            window (Integer, optional, default=1): Maximum number of write
+                requests waiting for response. See :meth:`.write_file`.
 
         Returns:
             :class:`.FileSystemElement`: The new created file.
@@ -1433,9 +1700,12 @@ class FileSystemManager:
             if overwrite:
                 wr_opts.append("truncate")
             w_proc = self.write_file(dest, offset=0, secure=secure,
-                                     options=wr_opts, progress_cb=p_cb)
+                                     options=wr_opts, progress_cb=p_cb,
+                                     window=window)
             try:
                 size = w_proc.block_size
+                if window > 1:
+                    size *= window * _WINDOWS_PER_STEP
                 data = src_file.read(size)
                 while data:
                     try:
@@ -1448,7 +1718,8 @@ class FileSystemManager:
                             raise exc
                         self.remove(dest, rm_children=False)
                         w_proc = self.write_file(dest, offset=0, secure=secure,
-                                                 options=wr_opts, progress_cb=p_cb)
+                                                 options=wr_opts, progress_cb=p_cb,
+                                                 window=window)
                         w_proc.next(data, last=False)
                     data = src_file.read(size)
             finally:
@@ -1458,7 +1729,7 @@ class FileSystemManager:
                                  is_dir=False, size=os.stat(src).st_size,
                                  is_secure=secure)
 
-    def put_dir(self, src, dest="/flash", verify=True, progress_cb=None):
+    def put_dir(self, src, dest="/flash", verify=True, progress_cb=None, window=1):
         """
         Uploads the given source directory contents into the given destination
         directory in the XBee.
@@ -1475,6 +1746,9 @@ class FileSystemManager:
                     * The progress percentage as float.
                     * Destination file path.
                     * The absolute path of the local being uploaded as string.
+            window (Integer, optional, default=1): Maximum number of write
+                requests waiting for response. See :meth:`.write_file`.
+
         Raises:
             FileSystemException: If there is any error performing the operation
                 and `progress_cb` is `None`.
@@ -1504,7 +1778,8 @@ class FileSystemManager:
             dst_file_path = os.path.join(dest_path, file)
             if isfile(src_file_path):
                 self.put_file(src_file_path, dst_file_path, overwrite=True,
-                              mk_parents=True, progress_cb=progress_cb)
+                              mk_parents=True, progress_cb=progress_cb,
+                              window=window)
                 if not verify:
                     continue
                 xb_hash = self.get_file_hash(dst_file_path)
@@ -1518,7 +1793,8 @@ class FileSystemManager:
                 _log.error(msg)
                 _raise_exception(None, msg)
             else:
-                self.put_dir(src_file_path, dst_file_path, progress_cb=progress_cb)
+                self.put_dir(src_file_path, dst_file_path, progress_cb=progress_cb,
+                             window=window)
 
     def get_file_hash(self, file, timeout=DEFAULT_TIMEOUT):
         """
@@ -2701,7 +2977,7 @@ class LocalXBeeFileSystemManager:
             raise FileSystemException(_ERROR_EXECUTE_COMMAND % (
                 command.replace("\r", ""), result.groups()[1]))
 
-    def _xmodem_write_cb(self, data):
+    def _xmodem_write_cb(self, data, purge=True):
         """
         Callback function used to write data to the serial port when requested
         from the XModem transfer.
@@ -2709,13 +2985,17 @@ class LocalXBeeFileSystemManager:
         Args:
             data (Bytearray): The data to write to serial port from the XModem
                 transfer.
+            purge (Boolean, optional, default=`True`): `True` to discard the
+                pending data of the serial port before writing, `False` to
+                keep it (pending acknowledgements of a windowed transfer).
 
         Returns:
             Boolean: `True` if the data was successfully written, `False`
                 otherwise.
         """
         try:
-            self._serial_port.purge_port()
+            if purge:
+                self._serial_port.purge_port()
             self._serial_port.write(data)
             self._serial_port.flush()
             return True
@@ -3041,12 +3321,15 @@ class LocalXBeeFileSystemManager:
         _log.info("Moving file '%s' to '%s'", source_path, dest_path)
         self._execute_command(_FilesystemFunction.MV, source_path, dest_path)
 
-    def put_file(self, source_path, dest_path, secure=False, progress_callback=None):
+    def put_file(self, source_path, dest_path, secure=False, progress_callback=None,
+                 window=1):
         """
         Transfers the given file in the specified destination path of the XBee.
 
         Args:
-            source_path (String): the path of the file to transfer.
+            source_path (String, Bytearray or file-like object): the path of
+                the file to transfer, or the data to transfer as a bytes-like
+                object or a readable file-like object.
             dest_path (String): the destination path to put the file in.
             secure (Boolean, optional, default=`False`): `True` if the file
                 should be stored securely, `False` otherwise.
@@ -3055,6 +3338,11 @@ class LocalXBeeFileSystemManager:
 
                     * The progress percentage as integer.
 
+            window (Integer, optional, default=1): Maximum number of YModem
+                blocks sent before waiting for their acknowledgement. Values
+                greater than 1 require the XBee to read the next blocks while
+                storing the current one.
+
         Raises:
             FileSystemException: If there is any error transferring the file or
                 the function is not supported.
@@ -3086,7 +3374,9 @@ class LocalXBeeFileSystemManager:
                     self.remove_element(element.path)
                     break
 
-        _log.info("Uploading file '%s' to '%s'", source_path, dest_path)
+        _log.info("Uploading file '%s' to '%s'",
+                  source_path if isinstance(source_path, str)
+                  else type(source_path).__name__, dest_path)
         command = _COMMAND_ATFS % (_FilesystemFunction.XPUT.command % dest_path) if secure else \
             _COMMAND_ATFS % (_FilesystemFunction.PUT.command % dest_path)
         answer = self._execute_command(_FilesystemFunction.XPUT, dest_path) if secure else \
@@ -3096,10 +3386,14 @@ class LocalXBeeFileSystemManager:
                                       (command.replace("\r", ""),
                                        "Transfer not ready"))
         # Transfer the file.
+        write_cb = self._xmodem_write_cb if window <= 1 \
+            else functools.partial(self._xmodem_write_cb, purge=False)
         try:
-            xmodem.send_file_ymodem(
-                source_path, self._xmodem_write_cb, self._xmodem_read_cb,
-                progress_cb=progress_callback, log=_log)
+            stats = xmodem.send_file_ymodem(
+                source_path, write_cb, self._xmodem_read_cb,
+                progress_cb=progress_callback, log=_log, window=window,
+                name=None if isinstance(source_path, str) else os.path.basename(dest_path))
+            _log.info("Uploaded %s", stats)
         except XModemException as exc:
             raise FileSystemException(_ERROR_EXECUTE_COMMAND %
                                       (command.replace("\r", ""), str(exc)))
@@ -3158,7 +3452,9 @@ class LocalXBeeFileSystemManager:
 
         Args:
             source_path (String): Path of the XBee device file to download.
-            dest_path (String): Destination path to store the file in.
+            dest_path (String, file-like object or Bytearray): Destination path
+                to store the file in, or writable file-like object or
+                bytearray to append the data to.
             progress_callback (Function, optional): Function to execute to
                 receive progress information. Takes the following arguments:
 
@@ -3171,7 +3467,8 @@ class LocalXBeeFileSystemManager:
         command = _COMMAND_ATFS % (_FilesystemFunction.GET.command % source_path)
         # Sanitize path.
         source_path = source_path.replace('\\', '/')
-        _log.info("Downloading file '%s' to '%s'", source_path, dest_path)
+        _log.info("Downloading file '%s' to '%s'", source_path,
+                  dest_path if isinstance(dest_path, str) else type(dest_path).__name__)
         self._execute_command(_FilesystemFunction.GET, source_path,
                               wait_for_answer=False)
         try:
@@ -3191,8 +3488,9 @@ class LocalXBeeFileSystemManager:
                                       (command.replace("\r", ""), str(exc)))
         # Receive the file.
         try:
-            xmodem.get_file_ymodem(dest_path, self._xmodem_write_cb, self._xmodem_read_cb,
-                                   progress_cb=progress_callback, log=_log)
+            stats = xmodem.get_file_ymodem(dest_path, self._xmodem_write_cb, self._xmodem_read_cb,
+                                           progress_cb=progress_callback, log=_log)
+            _log.info("Downloaded %s", stats)
         except XModemException as exc:
             raise FileSystemException(_ERROR_EXECUTE_COMMAND %
                                       (command.replace("\r", ""), str(exc)))
@@ -3375,13 +3673,9 @@ def get_local_file_hash(local_path):
         Bytearray: SHA256 hash of the given file.
     """
     import hashlib
-    sha256_hash = hashlib.sha256()
-    with open(local_path, "rb") as file:
-        # Read and update hash string value in blocks of 4K
-        for byte_block in iter(lambda: file.read(4096), b""):
-            sha256_hash.update(byte_block)
-
-        return sha256_hash.digest()
+    # Hash the mapped file at once, without reading it in Python blocks
+    with ImageSource.open(local_path) as source:
+        return hashlib.sha256(source.read(0, source.size)).digest()
 
 
 def _raise_exception(status, msg):
@@ -19,9 +19,8 @@ import time
 
 from abc import ABC, abstractmethod
 from enum import Enum, unique
-from itertools import repeat
 from pathlib import Path
-from threading import Event
+from threading import Event, Lock
 from threading import Thread
 from xml.etree import ElementTree
 from xml.etree.ElementTree import ParseError
@@ -49,6 +48,8 @@ from digi.xbee.serial import FlowControl
 from digi.xbee.serial import XBeeSerialPort
 from digi.xbee.util import utils
 from digi.xbee.util import xmodem
+from digi.xbee.util.crc import CRC16_IBM_POLYNOMIAL, crc16, checksum8
+from digi.xbee.util.imagesource import ImageSource
 from digi.xbee.util.xmodem import XModemException, XModemCancelException
 
 
@@ -219,6 +220,7 @@ _NOTIFY_PACKET_DEFAULT_QUERY_JITTER = 0x64
 
 _OTA_FILE_IDENTIFIER = 0x0BEEF11E
 _OTA_DEFAULT_BLOCK_SIZE = 64
+_OTA_MAX_BLOCK_SIZE = 255
 _OTA_GBL_SIZE_BYTE_COUNT = 6
 
 _PACKET_DEFAULT_SEQ_NUMBER = 0x01
@@ -237,12 +239,16 @@ _REGION_ALL = 0
 
 _REMOTE_FW_UPDATE_DEFAULT_TIMEOUT = 20  # Seconds
 
+FLEET_DEFAULT_SESSIONS = 4
+FLEET_MAX_SESSIONS = 16
+
 _SEND_BLOCK_RETRIES = 5
 
 _TIME_DAYS_1970TO_2000 = 10957
 _TIME_SECONDS_1970_TO_2000 = _TIME_DAYS_1970TO_2000 * 24 * 60 * 60
 
-_IMAGE_BLOCK_RESPONSE_PAYLOAD_DECREMENT = 1
+# ZCL header (3) and image block response fields before the data (14)
+_IMAGE_BLOCK_RESPONSE_OVERHEAD = 17
 _UPGRADE_END_REQUEST_PACKET_PAYLOAD_SIZE = 12
 
 _VALUE_API_OUTPUT_MODE_EXPLICIT = 0x01
@@ -297,7 +303,7 @@ _XB3_PROTOCOL_FROM_FW_VERSION = {
     0x3: XBeeProtocol.DIGI_MESH
 }
 
-_POLYNOMINAL_DIGI_BL = 0x8005
+_POLYNOMINAL_DIGI_BL = CRC16_IBM_POLYNOMIAL
 
 S2C_HW_VERSIONS = (HardwareVersion.XBP24C.code,
                    HardwareVersion.XB24C.code,
@@ -345,29 +351,16 @@ class _EbinFile:
         Returns the next memory page of this file.
 
         Returns:
-            Bytearray: Next memory page of the file as byte array.
+            memoryview or Bytearray: Next memory page of the file.
         """
-        with open(self._file_path, "rb") as file:
-            while True:
-                read_bytes = file.read(self._page_size)
-                if not read_bytes:
-                    break
+        with ImageSource.open(self._file_path) as source:
+            for index in range(self._num_pages):
                 # Protocol states that empty pages (pages filled with 0xFF)
-                # must not be sent. Check if this page is empty.
-                page_is_empty = True
-                for byte in read_bytes:
-                    if byte != 0xFF:
-                        page_is_empty = False
-                        break
-                # Skip empty page. Still increase page index.
-                if not page_is_empty:
+                # must not be sent. Skip empty page. Still increase page index.
+                if not source.is_blank(index, self._page_size):
                     # Page must have always full size.
                     # If not, extend with 0xFF until it is complete.
-                    if len(read_bytes) < self._page_size:
-                        padded_array = bytearray(read_bytes)
-                        padded_array.extend(repeat(0xFF, self._page_size - len(read_bytes)))
-                        read_bytes = bytes(padded_array)
-                    yield read_bytes
+                    yield source.get_block(index, self._page_size, pad=0xFF)
                 self._page_index += 1
 
     @property
@@ -427,20 +420,13 @@ class _EBLFile:
         Returns the next memory page of this file.
 
         Returns:
-            Bytearray: Next memory page of the file as byte array.
+            memoryview or Bytearray: Next memory page of the file.
         """
-        with open(self._file_path, "rb") as file:
-            while True:
-                read_bytes = file.read(self._page_size)
-                if not read_bytes:
-                    break
+        with ImageSource.open(self._file_path) as source:
+            for index in range(self._num_pages):
                 # Page must have always full size.
                 # If not, extend with 0xFF until it is complete.
-                if len(read_bytes) < self._page_size:
-                    padded_array = bytearray(read_bytes)
-                    padded_array.extend(repeat(0xFF, self._page_size - len(read_bytes)))
-                    read_bytes = bytes(padded_array)
-                yield read_bytes
+                yield source.get_block(index, self._page_size, pad=0xFF)
                 self._page_index += 1
 
     @property
@@ -500,7 +486,7 @@ class _OTAFile:
         self._total_size = None
         self._ota_size = None
         self._discard_size = 0
-        self._file = None
+        self._source = None
         self._min_hw_version = 0
         self._max_hw_version = 0xFFFF
 
@@ -593,24 +579,24 @@ class _OTAFile:
 
     def get_next_data_chunk(self, offset, size):
         """
-        Returns the next data chunk of this file.
+        Returns the next data chunk of this file. The file is mapped in memory
+        the first time and shared with other updates of the same file.
 
         Args:
             offset (Integer): Starting offset to read.
             size (Integer): The number of bytes to read.
 
         Returns:
-            Bytearray: Next data chunk of the file as byte array.
+            memoryview: Next data chunk of the file (not copied).
 
         Raises:
             _ParsingOTAException: If there is any error reading the OTA file.
         """
         try:
-            if self._file is None:
-                self._file = open(self._file_path, "rb")
-            self._file.seek(offset)
-            return self._file.read(size)
-        except IOError as exc:
+            if self._source is None:
+                self._source = ImageSource.open(self._file_path)
+            return self._source.read(offset, size)
+        except (OSError, ValueError) as exc:
             self.close_file()
             raise _ParsingOTAException(str(exc))
 
@@ -618,8 +604,9 @@ class _OTAFile:
         """
         Closes the file.
         """
-        if self._file:
-            self._file.close()
+        if self._source:
+            self._source.close()
+            self._source = None
 
     @property
     def file_path(self):
@@ -763,6 +750,171 @@ class _OTAFile:
         return self._max_hw_version
 
 
+class _OTABlockSizer:
+    """
+    Helper class used to choose the size of the OTA image blocks sent to a
+    remote XBee.
+
+    The first size is the maximum payload of the local XBee ('NP') minus the
+    image block response overhead. If a block is rejected as too large, the
+    maximum size is searched with a binary search between the largest size
+    already transmitted and the rejected one. Both limits are cached per node
+    and number of route hops, so the next updates of the node (firmware or
+    filesystem) start with the right size.
+
+    The block size is halved when the link fails to deliver a block, and
+    grows again up to the maximum after several blocks delivered at the first
+    attempt.
+    """
+
+    __GROW_AFTER = 8
+    __MIN_LINK_SIZE = 16
+
+    # Key: (64-bit address, route hops), value: (largest transmitted size,
+    # smallest size rejected as too large)
+    __cache = {}
+    __cache_lock = Lock()
+
+    def __init__(self, local, remote):
+        """
+        Class constructor. Instantiates a new :class:`._OTABlockSizer` with
+        the given parameters.
+
+        Args:
+            local (:class:`.XBeeDevice`): Local XBee that sends the blocks.
+            remote (:class:`.RemoteXBeeDevice`): Remote XBee being updated.
+        """
+        self._key = (remote.get_64bit_addr(), self._get_route_hops(local, remote))
+        with self.__cache_lock:
+            cached = self.__cache.get(self._key)
+        if cached:
+            self._max_ok, self._too_large = cached
+            self._size = self._max_ok
+        else:
+            max_size = self._get_max_size(local)
+            self._max_ok = 0
+            self._too_large = max_size + 1
+            self._size = max_size
+        self._successes = 0
+        _log.debug("OTA block size for %s (hops %s): %d (max. %d)", remote,
+                   self._key[1], self._size, self._too_large - 1)
+
+    def get_size(self, limit):
+        """
+        Returns the size of the next block.
+
+        Args:
+            limit (Integer): Maximum size of the block.
+
+        Returns:
+            Integer: Size of the next block.
+        """
+        return max(1, min(self._size, limit))
+
+    def too_large(self, size):
+        """
+        Notifies that a block was rejected as too large, and returns the size
+        to retry with.
+
+        Args:
+            size (Integer): Size of the rejected block.
+
+        Returns:
+            Integer: Size to retry with.
+        """
+        self._too_large = min(self._too_large, size)
+        # The route may have changed
+        self._max_ok = min(self._max_ok, size - 1)
+        self._size = max(1, (self._max_ok + self._too_large) // 2)
+        self._successes = 0
+        self._store()
+        return self._size
+
+    def link_error(self):
+        """
+        Notifies that the link failed to deliver a block.
+        """
+        self._size = max(min(self._size, self.__MIN_LINK_SIZE), self._size // 2)
+        self._successes = 0
+
+    def sent(self, size, first_attempt=True):
+        """
+        Notifies that a block was delivered.
+
+        Args:
+            size (Integer): Size of the delivered block.
+            first_attempt (Boolean, optional, default=`True`): `True` if it
+                was delivered at the first attempt, `False` otherwise.
+        """
+        if size > self._max_ok:
+            self._max_ok = size
+            self._store()
+        if not first_attempt:
+            self._successes = 0
+            return
+        self._successes += 1
+        if self._successes < self.__GROW_AFTER or self._size >= self._too_large - 1:
+            return
+        self._successes = 0
+        if self._size < self._max_ok:
+            # Recover the size reduced by link errors
+            self._size = min(self._max_ok, self._size * 2)
+        else:
+            # Continue the search of the maximum size
+            self._size = (self._size + self._too_large) // 2
+
+    def _store(self):
+        """
+        Stores the current size limits of the node in the cache.
+        """
+        if self._max_ok:
+            with self.__cache_lock:
+                self.__cache[self._key] = (self._max_ok, self._too_large)
+
+    @staticmethod
+    def _get_max_size(local):
+        """
+        Returns the maximum size of a block calculated from the maximum
+        payload of the local XBee.
+
+        Args:
+            local (:class:`.XBeeDevice`): Local XBee that sends the blocks.
+
+        Returns:
+            Integer: Maximum size of a block.
+        """
+        np_val = _get_parameter_with_retries(local, ATStringCommand.NP)
+        if not np_val:
+            return _OTA_MAX_BLOCK_SIZE
+        return max(1, min(utils.bytes_to_int(np_val) - _IMAGE_BLOCK_RESPONSE_OVERHEAD,
+                          _OTA_MAX_BLOCK_SIZE))
+
+    @staticmethod
+    def _get_route_hops(local, remote):
+        """
+        Returns the number of hops of the route to the remote XBee, using the
+        known network connections.
+
+        Args:
+            local (:class:`.XBeeDevice`): Local XBee.
+            remote (:class:`.RemoteXBeeDevice`): Remote XBee.
+
+        Returns:
+            Integer: Number of hops, `None` if the route is unknown.
+        """
+        try:
+            network = local._get_existing_network()
+        except XBeeException as exc:
+            _log.debug("Could not get the network of %s: %s", local, str(exc))
+            return None
+        if network is None:
+            return None
+
+        path = network.get_shortest_path(local, remote)
+
+        return len(path) - 1 if path else None
+
+
 class _ParsingOTAException(Exception):
     """
     This exception will be thrown when any problem related with the parsing of
@@ -817,11 +969,7 @@ class _XBee3OTAStatus(Enum):
             :class:`._XBee3OTAStatus`: _XBee3OTAStatus with the given
                 identifier, `None` if there is not found.
         """
-        for value in _XBee3OTAStatus:
-            if value.identifier == identifier:
-                return value
-
-        return None
+        return cls.lookupTable.get(identifier)
 
     @property
     def identifier(self):
@@ -844,6 +992,9 @@ class _XBee3OTAStatus(Enum):
         return self.__desc
 
 
+_XBee3OTAStatus.lookupTable = utils.enum_lookup_table(_XBee3OTAStatus, "identifier")
+
+
 class _BreakThread(Thread):
     """
     Helper class used to manage serial port break line in a parallel thread.
@@ -935,11 +1086,7 @@ class _BootloaderType(Enum):
             :class:`._BootloaderType`: _BootloaderType with the given
                 identifier, `None` if not found.
         """
-        for value in _BootloaderType:
-            if value.identifier == identifier:
-                return value
-
-        return None
+        return cls.lookupTable.get(identifier)
 
     @classmethod
     def determine_bootloader_type(cls, hw_version):
@@ -983,6 +1130,9 @@ class _BootloaderType(Enum):
         return self.__desc
 
 
+_BootloaderType.lookupTable = utils.enum_lookup_table(_BootloaderType, "identifier")
+
+
 @unique
 class _Gen3BootloaderCmd(Enum):
     """
@@ -1118,11 +1268,7 @@ class _GPMCmd(Enum):
             :class:`._GPMCommand`: _GPMCommand with the given identifier,
                 `None` if not found.
         """
-        for value in _GPMCmd:
-            if value.identifier == identifier:
-                return value
-
-        return None
+        return cls.lookupTable.get(identifier)
 
     @property
     def identifier(self):
@@ -1175,6 +1321,9 @@ class _GPMCmd(Enum):
         return self.__exec_error
 
 
+_GPMCmd.lookupTable = utils.enum_lookup_table(_GPMCmd, "identifier")
+
+
 class _LoopbackTest:
     """
     Helper class used to perform a loopback test between a local and a remote
@@ -3881,22 +4030,10 @@ class _LocalXBeeGEN3FirmwareUpdater(_LocalFirmwareUpdater):
             Bytearray: Calculated verification sequence for the given memory page.
         """
         if self._protocol_version == _GEN3_BOOTLOADER_PROTOCOL_VERSION_0:
-            value = 0x00
-            for byte in page:
-                value += byte
-            value = value & 0xFF
+            value = checksum8(page)
             return bytearray([((~value & 0xFF) - len(page)) & 0xFF])
 
-        crc = 0x0000
-        for i in range(0, len(page)):
-            crc ^= page[i] << 8
-            for _ in range(0, 8):
-                if (crc & 0x8000) > 0:
-                    crc = (crc << 1) ^ _POLYNOMINAL_DIGI_BL
-                else:
-                    crc = crc << 1
-                crc &= 0xFFFF
-        return (crc & 0xFFFF).to_bytes(2, byteorder='little')
+        return crc16(page, _POLYNOMINAL_DIGI_BL).to_bytes(2, byteorder='little')
 
     def _finish_firmware_update(self):
         """
@@ -3959,6 +4096,8 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
         self._requested_offset = -1
         self._max_chunk_size = _OTA_DEFAULT_BLOCK_SIZE
         self._seq_number = 1
+        self._notify_frame_id = None
+        self._block_sizer = None
         self._cfg_max_block_size = max_block_size
         self._update_task = _PROGRESS_TASK_UPDATE_REMOTE_XBEE
         if not self._cfg_max_block_size:
@@ -4335,7 +4474,8 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
             frame (:class:`.XBeeAPIPacket`): Received packet
         """
         f_type = frame.get_frame_type()
-        if f_type == ApiFrameType.TRANSMIT_STATUS:
+        if (f_type == ApiFrameType.TRANSMIT_STATUS
+                and frame.frame_id == self._notify_frame_id):
             _log.debug("Received 'Image notify' status frame: %s",
                        frame.transmit_status.description)
             if frame.transmit_status == TransmitStatus.SUCCESS:
@@ -4433,6 +4573,27 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
         # Notify transfer thread to continue.
         self._transfer_lock.set()
 
+    def _add_frame_callback(self, callback):
+        """
+        Registers the given callback to be notified of the frames received by
+        the local XBee during the update process.
+
+        Args:
+            callback (Function): The callback. Receives the received
+                :class:`.XBeeAPIPacket`.
+        """
+        self._local.add_packet_received_callback(callback)
+
+    def _del_frame_callback(self, callback):
+        """
+        Unregisters the given callback, previously registered with
+        :meth:`._add_frame_callback`.
+
+        Args:
+            callback (Function): The callback to unregister.
+        """
+        self._local.del_packet_received_callback(callback)
+
     def _check_img_data(self, payload):
         """
         Checks if the manufacturer code, image type, and firmware version in the
@@ -4735,17 +4896,20 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
             # Use 15s as a maximum value to wait for transmit status frames
             # If 'self._timeout' is too big we can lose any optimization waiting
             # waiting for a transmit status, that could be received but
-            self._local.set_sync_ops_timeout(min(self._timeout, 15))
             try:
                 status_frame = self._local.send_packet_sync_and_get_response(
-                    next_ota_block_frame)
+                    next_ota_block_frame, timeout=min(self._timeout, 15))
                 if not isinstance(status_frame, TransmitStatusPacket):
                     retries -= 1
                     continue
                 if status_frame.transmit_status == TransmitStatus.PAYLOAD_TOO_LARGE:
                     # Do not decrease 'retries' here, as we are calculating the
                     # maximum payload
-                    size -= _IMAGE_BLOCK_RESPONSE_PAYLOAD_DECREMENT
+                    if size <= 1:
+                        raise FirmwareUpdateException(
+                            _ERROR_SEND_OTA_BLOCK
+                            % (file_offset, status_frame.transmit_status.description))
+                    size = self._block_sizer.too_large(size)
                     _log.debug(
                         "'%s' status for offset %s: size too large, retrying with size %d",
                         name, file_offset, size)
@@ -4753,6 +4917,8 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
                 if status_frame.transmit_status not in [TransmitStatus.SUCCESS,
                                                         TransmitStatus.SELF_ADDRESSED]:
                     retries -= 1
+                    self._block_sizer.link_error()
+                    size = self._block_sizer.get_size(size)
                     _log.debug(
                         "Received '%s' status frame for offset %s: %s, retrying (%d/%d)",
                         name, file_offset, status_frame.transmit_status.description,
@@ -4760,24 +4926,26 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
                     continue
                 _log.debug("Received '%s' status frame for offset %s: %s",
                            name, file_offset, status_frame.transmit_status.description)
+                # The last block may be shorter than the requested size
+                self._block_sizer.sent(min(size, self._get_ota_size() - file_offset),
+                                       first_attempt=retries == _SEND_BLOCK_RETRIES)
                 return size
             except TimeoutException:
                 # If the transmit status is not received, let's try again
                 retries -= 1
+                self._block_sizer.link_error()
                 _log.debug("Not received '%s' status frame for offset %s, %s",
                            name, file_offset, "aborting" if retries == 0 else
                            "retrying (%d/%d)" % (_SEND_BLOCK_RETRIES - retries + 1,
                                                  _SEND_BLOCK_RETRIES))
                 if not retries:
                     return size
+                size = self._block_sizer.get_size(size)
             except XBeeException as exc:
                 retries -= 1
                 if not retries:
                     raise FirmwareUpdateException(_ERROR_SEND_OTA_BLOCK
                                                   % (file_offset, str(exc)))
-            finally:
-                # Restore the configured timeout
-                self._local.set_sync_ops_timeout(self._timeout)
 
         raise FirmwareUpdateException(_ERROR_SEND_OTA_BLOCK
                                       % (file_offset, "Timeout sending frame"))
@@ -4791,7 +4959,8 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
         """
         name = "Image notify"
         image_notify_request_frame = self._create_image_notify_request_frame()
-        self._local.add_packet_received_callback(self._image_request_frame_cb)
+        self._notify_frame_id = image_notify_request_frame.frame_id
+        self._add_frame_callback(self._image_request_frame_cb)
         retries = _SEND_BLOCK_RETRIES
         error = None
         while retries > 0:
@@ -4822,7 +4991,7 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
             else:
                 break
 
-        self._local.del_packet_received_callback(self._image_request_frame_cb)
+        self._del_frame_callback(self._image_request_frame_cb)
 
         if error:
             self._exit_with_error(error)
@@ -4839,19 +5008,19 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
         self._requested_offset = -1
         self._progress_task = self._update_task
         last_offset_sent = self._requested_offset
-        # Dictionary to store block size used for each provided maximum size
-        last_size_sent = {self._max_chunk_size: self._max_chunk_size}
+        last_size_sent = 0
+        self._block_sizer = _OTABlockSizer(self._local, self._remote)
         previous_percent = None
         retries = self._get_block_response_max_retries()
 
         self._transfer_lock.clear()
 
         # Add a packet listener to wait for block request packets and send them.
-        self._local.add_packet_received_callback(self._fw_receive_frame_cb)
+        self._add_frame_callback(self._fw_receive_frame_cb)
         try:
             self._send_query_next_img_response()
         except FirmwareUpdateException as exc:
-            self._local.del_packet_received_callback(self._fw_receive_frame_cb)
+            self._del_frame_callback(self._fw_receive_frame_cb)
             self._exit_with_error(str(exc))
         # Wait for answer.
         if self._requested_offset == -1:  # If offset is different from -1 it means callback was executed.
@@ -4865,7 +5034,7 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
             previous_seq_number = self._seq_number
             # Check that the requested offset is valid.
             if self._requested_offset >= self._get_ota_size():
-                self._local.del_packet_received_callback(self._fw_receive_frame_cb)
+                self._del_frame_callback(self._fw_receive_frame_cb)
                 self._exit_with_error(_ERROR_INVALID_BLOCK % self._requested_offset)
             # Calculate percentage and notify.
             percent = (self._requested_offset * 100) // self._get_ota_size()
@@ -4875,14 +5044,12 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
 
             # Send the data block.
             try:
-                size_sent = self._send_ota_block(
+                last_size_sent = self._send_ota_block(
                     self._requested_offset,
-                    min(last_size_sent.get(self._max_chunk_size, self._max_chunk_size),
-                        self._max_chunk_size),
+                    self._block_sizer.get_size(self._max_chunk_size),
                     previous_seq_number)
-                last_size_sent[self._max_chunk_size] = size_sent
             except FirmwareUpdateException as exc:
-                self._local.del_packet_received_callback(self._fw_receive_frame_cb)
+                self._del_frame_callback(self._fw_receive_frame_cb)
                 self._exit_with_error(str(exc))
             # Wait for next request.
             if not self._transfer_lock.wait(max(self._timeout, 120)):
@@ -4895,12 +5062,12 @@ class _RemoteXBee3FirmwareUpdater(_RemoteFirmwareUpdater):
                 retries = self._get_block_response_max_retries()
 
         # Transfer finished, remove callback.
-        self._local.del_packet_received_callback(self._fw_receive_frame_cb)
+        self._del_frame_callback(self._fw_receive_frame_cb)
         # Close OTA file.
         self._ota_file.close_file()
         # Check if there was a transfer timeout.
         if self._transfer_status is None and self._response_str is None:
-            if last_offset_sent + last_size_sent[self._max_chunk_size] == self._get_ota_size():
+            if last_offset_sent + last_size_sent >= self._get_ota_size():
                 self._exit_with_error(_ERROR_TRANSFER_OTA_FILE
                                       % "Timeout waiting for 'Upgrade end request' frame")
             else:
@@ -5143,6 +5310,278 @@ class _RemoteFilesystemUpdater(_RemoteXBee3FirmwareUpdater):
         # Remote filesystem update does not require to update target information after the update.
 
 
+class _XBee3OTAServer:
+    """
+    Helper class used to serve OTA images to several remote XBee 3 devices at
+    the same time through the same local XBee.
+
+    The local XBee is configured only once for all the update sessions, and
+    the OTA frames it receives are dispatched to the session of their source
+    node: explicit frames by their 64-bit source address and transmit status
+    frames by their frame ID.
+    """
+
+    def __init__(self, local, timeout=_READ_DATA_TIMEOUT):
+        """
+        Class constructor. Instantiates a new :class:`._XBee3OTAServer` with
+        the given parameters.
+
+        Args:
+            local (:class:`.XBeeDevice`): Local XBee that serves the images.
+            timeout (Integer, optional): Timeout to wait for remote frame requests.
+        """
+        self._local = local
+        self._timeout = timeout
+        self._lock = Lock()
+        # Active callback per 64-bit address, and per frame ID of the
+        # transmit status frames to dispatch
+        self._addr_cbs = {}
+        self._frame_id_cbs = {}
+        self._running = False
+        self._old_sync_ops_timeout = None
+        self._was_connected = False
+        self._ao_val = None
+        self._rr_val = None
+        self._my_val = None
+
+    def is_running(self):
+        """
+        Returns whether the server is configured and dispatching frames.
+
+        Returns:
+            Boolean: `True` if the server is running, `False` otherwise.
+        """
+        return self._running
+
+    def start(self):
+        """
+        Configures the local XBee for the update sessions and starts
+        dispatching received frames.
+
+        Raises:
+            FirmwareUpdateException: If there is any error configuring the
+                local XBee.
+        """
+        # Change sync ops timeout.
+        self._old_sync_ops_timeout = self._local.get_sync_ops_timeout()
+        self._local.set_sync_ops_timeout(self._timeout)
+        # Connect device.
+        self._was_connected = self._local.is_open()
+        if not _connect_device_with_retries(self._local, _DEVICE_CONNECTION_RETRIES):
+            self._exit_with_error(_ERROR_CONNECT_DEVICE % _DEVICE_CONNECTION_RETRIES)
+        # Store AO value and enable explicit mode.
+        success, self._ao_val = _enable_explicit_mode(self._local)
+        if not success:
+            self._exit_with_error(_ERROR_UPDATER_READ_PARAM % ATStringCommand.AO.command)
+        # Specific settings per protocol.
+        protocol = self._local.get_protocol()
+        if protocol == XBeeProtocol.DIGI_MESH:
+            self._rr_val = _get_parameter_with_retries(self._local, ATStringCommand.RR)
+            if self._rr_val is None:
+                self._exit_with_error(_ERROR_UPDATER_READ_PARAM % ATStringCommand.RR.command)
+            if not _set_parameter_with_retries(
+                    self._local, ATStringCommand.RR,
+                    bytearray([_VALUE_UNICAST_RETRIES_MEDIUM]), apply=True):
+                self._exit_with_error(_ERROR_UPDATER_SET_PARAM % ATStringCommand.RR.command)
+        elif protocol == XBeeProtocol.RAW_802_15_4:
+            self._my_val = _get_parameter_with_retries(self._local, ATStringCommand.MY)
+            if self._my_val is None:
+                self._exit_with_error(_ERROR_UPDATER_READ_PARAM % ATStringCommand.MY.command)
+            if not _set_parameter_with_retries(
+                    self._local, ATStringCommand.MY,
+                    XBee16BitAddress.BROADCAST_ADDRESS.address, apply=True):
+                self._exit_with_error(_ERROR_UPDATER_SET_PARAM % ATStringCommand.MY.command)
+
+        self._local.add_packet_received_callback(self._frame_cb)
+        self._running = True
+
+    def stop(self):
+        """
+        Stops dispatching received frames and leaves the local XBee in its
+        original state.
+        """
+        self._running = False
+        with self._lock:
+            self._addr_cbs.clear()
+            self._frame_id_cbs.clear()
+        try:
+            self._local.del_packet_received_callback(self._frame_cb)
+        except ValueError:
+            pass
+        self._restore_local()
+
+    def add_session_callback(self, remote, callback, frame_id=None):
+        """
+        Sets the callback of the update session of the given remote. It
+        replaces the previous callback of the session.
+
+        Args:
+            remote (:class:`.RemoteXBeeDevice`): Remote XBee being updated.
+            callback (Function): The callback. Receives the received
+                :class:`.XBeeAPIPacket`.
+            frame_id (Integer, optional): Frame ID of the transmit status
+                frame to also dispatch to the callback.
+        """
+        with self._lock:
+            self._addr_cbs[remote.get_64bit_addr()] = callback
+            if frame_id is not None:
+                self._frame_id_cbs[frame_id] = callback
+
+    def del_session_callback(self, remote, callback):
+        """
+        Removes the callback of the update session of the given remote.
+
+        Args:
+            remote (:class:`.RemoteXBeeDevice`): Remote XBee being updated.
+            callback (Function): The callback to remove.
+        """
+        with self._lock:
+            if self._addr_cbs.get(remote.get_64bit_addr()) == callback:
+                self._addr_cbs.pop(remote.get_64bit_addr())
+            for frame_id in [f_id for f_id, f_cb in self._frame_id_cbs.items()
+                             if f_cb == callback]:
+                self._frame_id_cbs.pop(frame_id)
+
+    def _frame_cb(self, frame):
+        """
+        Callback used to dispatch the frames received by the local XBee to
+        the corresponding update session.
+
+        Args:
+            frame (:class:`.XBeeAPIPacket`): Received packet
+        """
+        f_type = frame.get_frame_type()
+        if f_type == ApiFrameType.TRANSMIT_STATUS:
+            callback = self._frame_id_cbs.get(frame.frame_id)
+        elif (f_type == ApiFrameType.EXPLICIT_RX_INDICATOR
+              and frame.cluster_id == _EXPL_PACKET_CLUSTER_ID
+              and frame.profile_id == _EXPL_PACKET_PROFILE_DIGI):
+            callback = self._addr_cbs.get(frame.x64bit_source_addr)
+        else:
+            return
+
+        if callback:
+            callback(frame)
+
+    def _restore_local(self):
+        """
+        Restores the original configuration of the local XBee.
+        """
+        if self._old_sync_ops_timeout is not None:
+            self._local.set_sync_ops_timeout(self._old_sync_ops_timeout)
+        try:
+            if not self._local.is_open():
+                self._local.open()
+            if self._ao_val is not None:
+                _set_parameter_with_retries(self._local, ATStringCommand.AO,
+                                            self._ao_val, apply=True)
+            if self._rr_val is not None:
+                _set_parameter_with_retries(self._local, ATStringCommand.RR,
+                                            self._rr_val, apply=True)
+            if self._my_val is not None:
+                _set_parameter_with_retries(self._local, ATStringCommand.MY,
+                                            self._my_val, apply=True)
+        except XBeeException as exc:
+            _log.error("ERROR: %s", _ERROR_RESTORE_UPDATER_DEVICE % str(exc))
+        if self._was_connected and not self._local.is_open():
+            self._local.open()
+        elif not self._was_connected and self._local.is_open():
+            self._local.close()
+
+    def _exit_with_error(self, msg):
+        """
+        Restores the local XBee and raises a :class`.FirmwareUpdateException`.
+
+        Args:
+            msg (String): Error message of the exception to raise.
+
+        Raises:
+            FirmwareUpdateException: Exception is always thrown in this method.
+        """
+        self._restore_local()
+        _log.error("ERROR: %s", msg)
+        raise FirmwareUpdateException(msg)
+
+
+class _FleetXBee3FirmwareUpdater(_RemoteXBee3FirmwareUpdater):
+    """
+    Helper class used to handle the remote firmware update process of an
+    XBee 3 device served by an :class:`._XBee3OTAServer`, concurrently with
+    other devices.
+    """
+
+    def __init__(self, server, remote, xml_fw_file, ota_fw_file=None,
+                 otb_fw_file=None, timeout=_READ_DATA_TIMEOUT, max_block_size=0,
+                 progress_cb=None):
+        """
+        Class constructor. Instantiates a new
+        :class:`._FleetXBee3FirmwareUpdater` with the given parameters.
+
+        Args:
+            server (:class:`._XBee3OTAServer`): Server of the local XBee.
+            remote (:class:`.RemoteXBeeDevice`): Remote XBee to upload its firmware.
+            xml_fw_file (String): Path of the XML file that describes the firmware.
+            ota_fw_file (String, optional): Path of the OTA firmware file to upload.
+            otb_fw_file (String, optional): Path of the OTB firmware file to
+                upload (bootloader bundle).
+            timeout (Integer, optional): Timeout to wait for remote frame requests.
+            max_block_size (Integer, optional): Maximum size in bytes of the
+                ota block to send.
+            progress_cb (Function, optional): Function to receive progress
+                information. Receives two arguments:
+
+                * The current update task as a String
+                * The current update task percentage as an Integer
+        """
+        super().__init__(remote, xml_fw_file, ota_fw_file=ota_fw_file,
+                         otb_fw_file=otb_fw_file, timeout=timeout,
+                         max_block_size=max_block_size, progress_cb=progress_cb)
+        self._server = server
+
+    def _configure_updater(self):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`._XBeeFirmwareUpdater._configure_updater`
+        """
+        # The server already configured the local XBee for all the sessions.
+        if not self._server.is_running():
+            self._exit_with_error(_ERROR_INITIALIZE_PROCESS, restore_updater=False)
+
+    def _restore_updater(self, raise_exception=False):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`._RemoteFirmwareUpdater._restore_updater`
+        """
+        # The server restores the local XBee when all the sessions finish.
+        if self._ota_file:
+            self._ota_file.close_file()
+
+    def _add_frame_callback(self, callback):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`._RemoteXBee3FirmwareUpdater._add_frame_callback`
+        """
+        self._server.add_session_callback(
+            self._remote, callback,
+            frame_id=(self._notify_frame_id
+                      if callback == self._image_request_frame_cb else None))
+
+    def _del_frame_callback(self, callback):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`._RemoteXBee3FirmwareUpdater._del_frame_callback`
+        """
+        self._server.del_session_callback(self._remote, callback)
+
+
 class _RemoteGPMFirmwareUpdater(_RemoteFirmwareUpdater):
     """
     Helper class used to handle the remote firmware update process of general
@@ -6505,6 +6944,202 @@ def update_remote_firmware(remote, xml_fw_file, firmware_file=None, bootloader_f
             restore_settings=not update_process.check_protocol_changed_by_fw(orig_protocol))
 
 
+def update_remote_firmwares(remotes, xml_fw_file, firmware_file=None, bootloader_file=None,
+                            max_block_size=0, timeout=None,
+                            max_sessions=FLEET_DEFAULT_SESSIONS, progress_callback=None):
+    """
+    Performs a remote firmware update operation in several remote nodes of
+    the same local XBee at the same time.
+
+    XBee 3 nodes are updated concurrently, up to `max_sessions` at a time:
+    the local XBee is configured once and serves the OTA image blocks
+    requested by all of them. Other nodes are updated one by one after them.
+    A failure in a node does not stop the update of the rest.
+
+    Args:
+        remotes (List): List of remote XBee (:class:`.RemoteXBeeDevice`) to
+            update. All of them must belong to the same local XBee.
+        xml_fw_file (String): Path of the XML file that describes the firmware.
+        firmware_file (String, optional): Path of the binary firmware file.
+        bootloader_file (String, optional): Path of the bootloader firmware file.
+        max_block_size (Integer, optional): Maximum size of the ota block to send.
+        timeout (Integer, optional): Timeout to wait for remote frame requests.
+        max_sessions (Integer, optional, default=`FLEET_DEFAULT_SESSIONS`):
+            Maximum number of nodes to update at the same time. It must be
+            between 1 and :const:`FLEET_MAX_SESSIONS` inclusive.
+        progress_callback (Function, optional): Function to receive progress
+            information. Receives three arguments:
+
+                * The remote XBee being updated as a :class:`.RemoteXBeeDevice`
+                * The current update task as a String
+                * The current update task percentage as an Integer
+
+    Returns:
+        Dictionary: Result of the update per remote XBee: `None` if it was
+            successfully updated, or the raised exception otherwise.
+
+    Raises:
+        FirmwareUpdateException: If the list of remotes or the firmware files
+            are not valid, or if the local XBee cannot be configured.
+        ValueError: If `max_block_size` or `max_sessions` are not valid.
+
+    .. seealso::
+       | :meth:`.update_remote_firmware`
+    """
+    # Sanity checks.
+    if not remotes or not all(isinstance(rem, RemoteXBeeDevice) for rem in remotes):
+        _log.error("ERROR: %s", _ERROR_REMOTE_DEVICE_INVALID)
+        raise FirmwareUpdateException(_ERROR_TARGET_INVALID)
+    local = remotes[0].get_local_xbee_device()
+    if any(rem.get_local_xbee_device() != local for rem in remotes):
+        _log.error("ERROR: %s", _ERROR_REMOTE_DEVICE_INVALID)
+        raise FirmwareUpdateException(_ERROR_TARGET_INVALID)
+    if xml_fw_file is None:
+        _log.error("ERROR: %s", _ERROR_FILE_XML_FW_NOT_SPECIFIED)
+        raise FirmwareUpdateException(_ERROR_FILE_XML_FW_NOT_SPECIFIED)
+    if not _file_exists(xml_fw_file):
+        _log.error("ERROR: %s", _ERROR_FILE_XML_FW_NOT_FOUND)
+        raise FirmwareUpdateException(_ERROR_FILE_XML_FW_NOT_FOUND)
+    if firmware_file is not None and not _file_exists(firmware_file):
+        _log.error("ERROR: %s", _ERROR_FILE_XBEE_FW_NOT_FOUND % firmware_file)
+        raise FirmwareUpdateException(_ERROR_FILE_XBEE_FW_NOT_FOUND % firmware_file)
+    if bootloader_file is not None and not _file_exists(bootloader_file):
+        _log.error("ERROR: %s", _ERROR_FILE_XBEE_FW_NOT_FOUND % bootloader_file)
+        raise FirmwareUpdateException(_ERROR_FILE_XBEE_FW_NOT_FOUND % bootloader_file)
+    if not isinstance(max_block_size, int):
+        raise ValueError("Maximum block size must be an integer")
+    if max_block_size < 0 or max_block_size > 255:
+        raise ValueError("Maximum block size must be between 0 and 255")
+    if not isinstance(max_sessions, int) or not 1 <= max_sessions <= FLEET_MAX_SESSIONS:
+        raise ValueError("Maximum sessions must be between 1 and %d" % FLEET_MAX_SESSIONS)
+
+    if not timeout:
+        timeout = _REMOTE_FW_UPDATE_DEFAULT_TIMEOUT
+
+    def node_progress_cb(node):
+        if not progress_callback:
+            return None
+        return lambda task, percent: progress_callback(node, task, percent)
+
+    # Classify the nodes: XBee 3 nodes are served concurrently, the rest are
+    # updated sequentially with the single node process.
+    results = {}
+    concurrent = []
+    sequential = []
+    for remote in remotes:
+        hw_version = remote.get_hardware_version()
+        if hw_version and hw_version.code not in REMOTE_SUPPORTED_HW_VERSIONS:
+            results[remote] = OperationNotSupportedException(
+                "Firmware update only supported in XBee 3, XBee SX 868/900, and XBee S2C devices")
+            continue
+        comm_iface = remote.get_comm_iface()
+        if comm_iface and comm_iface.supports_update_firmware():
+            sequential.append(remote)
+            continue
+        try:
+            bootloader_type = _determine_bootloader_type(remote)
+        except FirmwareUpdateException as exc:
+            results[remote] = exc
+            continue
+        if bootloader_type == _BootloaderType.GECKO_BOOTLOADER:
+            concurrent.append(remote)
+        else:
+            sequential.append(remote)
+
+    if concurrent:
+        _log.info("Updating %d nodes concurrently (%d at a time)",
+                  len(concurrent), max_sessions)
+        # DigiMesh sync sleep networks are prepared once for all the nodes.
+        net_configurer = UpdateConfigurer(concurrent[0], timeout=timeout)
+        net_configurer.prepare_for_update(prepare_node=False, restore_later=False)
+        server = _XBee3OTAServer(local, timeout=timeout)
+        try:
+            server.start()
+            _update_remote_firmwares_concurrently(
+                server, concurrent, results, xml_fw_file, firmware_file,
+                bootloader_file, max_block_size, timeout, max_sessions,
+                node_progress_cb)
+        finally:
+            if server.is_running():
+                server.stop()
+            net_configurer.restore_after_update()
+
+    for remote in sequential:
+        try:
+            update_remote_firmware(remote, xml_fw_file, firmware_file=firmware_file,
+                                   bootloader_file=bootloader_file,
+                                   max_block_size=max_block_size, timeout=timeout,
+                                   progress_callback=node_progress_cb(remote))
+            results[remote] = None
+        except XBeeException as exc:
+            results[remote] = exc
+
+    return results
+
+
+def _update_remote_firmwares_concurrently(server, remotes, results, xml_fw_file,
+                                          firmware_file, bootloader_file,
+                                          max_block_size, timeout, max_sessions,
+                                          node_progress_cb):
+    """
+    Updates the firmware of the given XBee 3 remotes through the given OTA
+    server, keeping up to `max_sessions` updates at the same time.
+
+    Args:
+        server (:class:`._XBee3OTAServer`): Running server of the local XBee.
+        remotes (List): List of remote XBee (:class:`.RemoteXBeeDevice`) to update.
+        results (Dictionary): Dictionary to store the result per remote XBee.
+        xml_fw_file (String): Path of the XML file that describes the firmware.
+        firmware_file (String): Path of the binary firmware file.
+        bootloader_file (String): Path of the bootloader firmware file.
+        max_block_size (Integer): Maximum size of the ota block to send.
+        timeout (Integer): Timeout to wait for remote frame requests.
+        max_sessions (Integer): Maximum number of nodes to update at the same time.
+        node_progress_cb (Function): Returns the progress callback of a node.
+    """
+    pending = list(reversed(remotes))
+    lock = Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                remote = pending.pop()
+            progress_cb = node_progress_cb(remote)
+            update_process = _FleetXBee3FirmwareUpdater(
+                server, remote, xml_fw_file, ota_fw_file=firmware_file,
+                otb_fw_file=bootloader_file, timeout=timeout,
+                max_block_size=max_block_size, progress_cb=progress_cb)
+            orig_protocol = remote.get_protocol()
+            configurer = UpdateConfigurer(remote, timeout=timeout, callback=progress_cb)
+            try:
+                configurer.prepare_for_update(prepare_net=False, restore_later=False)
+                update_process.update_firmware()
+                results[remote] = None
+                _log.info("'%s' - Update process finished successfully", remote)
+            except Exception as exc:
+                _log.error("'%s' - Update process failed: %s", remote, str(exc))
+                results[remote] = exc
+            finally:
+                # If the XML file could not be parsed, the protocol did not change
+                protocol_changed = (update_process._xml_fw_version is not None
+                                    and update_process.check_protocol_changed_by_fw(
+                                        orig_protocol))
+                try:
+                    configurer.restore_after_update(restore_settings=not protocol_changed)
+                except XBeeException as exc:
+                    _log.info("'%s' - %s: %s", remote, UpdateConfigurer.TASK_RESTORE, str(exc))
+
+    workers = [Thread(target=worker, daemon=True,
+                      name="FwUpdateSession-%d" % idx)
+               for idx in range(min(max_sessions, len(remotes)))]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+
 def update_remote_filesystem(remote, ota_fs_file, max_block_size=0, timeout=None,
                              progress_callback=None, _prepare=True):
     """
@@ -11,6 +11,8 @@
 # WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+import time
+from array import array
 from enum import Enum, unique
 
 from digi.xbee.util import utils
@@ -612,6 +614,671 @@ class IOSample:
         return None
 
 
+class IOSampleBatch:
+    """
+    This class represents a batch of IO data samples decoded at once into
+    columns, with one entry per sample.
+
+    Columns are NumPy arrays if NumPy is available (see the `NumPy` extra of
+    the package), or :class:`array.array` objects otherwise:
+
+      * `timestamp`: Reception time of each sample in seconds since the epoch.
+      * `source`: Source address of each sample as integer.
+      * `digital_mask`: Mask of the digital lines included in each sample.
+      * `digital`: Values of the digital lines included in each sample, one
+        bit per line.
+      * `analog_mask`: Mask of the analog values included in each sample. Bit
+        `n` corresponds to the ADC line `n` and bit 7 to the power supply
+        voltage.
+      * `analog`: One column per ADC line with its value, 0 if the sample does
+        not include it.
+      * `supply_voltage`: Power supply voltage, 0 if the sample does not
+        include it.
+
+    Payloads with the same configuration share their layout, so they are
+    decoded together. Indexing a batch returns :class:`.IOSampleView` objects
+    that read the values of a sample from these columns only when requested.
+    """
+
+    __ANALOG_LINES = 6
+    __MAX_LAYOUTS = 256
+    __LAYOUTS = {}
+
+    def __init__(self, payloads, sources=None, timestamps=None, use_numpy=None):
+        """
+        Class constructor. Instantiates a new :class:`.IOSampleBatch` object
+        decoding the provided IO sample payloads.
+
+        Args:
+            payloads (List): List of IO sample payloads (Bytearray) to decode.
+            sources (List, optional, default=`None`): Source address of each
+                payload as integer. `None` to use 0 for every sample.
+            timestamps (List, optional, default=`None`): Reception time of each
+                payload in seconds since the epoch. `None` to use the current
+                time for every sample.
+            use_numpy (Boolean, optional, default=`None`): `True` to decode
+                into NumPy arrays, `False` to decode into
+                :class:`array.array` objects, `None` to use NumPy only if it
+                is available.
+
+        Raises:
+            ValueError: If any payload length is less than 5, or if the length
+                of `sources` or `timestamps` does not match the number of
+                payloads.
+            ImportError: If `use_numpy` is `True` and NumPy is not available.
+        """
+        payloads = [bytes(payload) if payload else b"" for payload in payloads]
+        count = len(payloads)
+        for i, payload in enumerate(payloads):
+            if len(payload) < IOSample.min_io_sample_payload():
+                raise ValueError("IO sample payload %d must be longer than 4." % i)
+
+        sources = [0] * count if sources is None else list(sources)
+        if len(sources) != count:
+            raise ValueError("Number of sources must match number of payloads")
+        timestamps = [time.time()] * count if timestamps is None else list(timestamps)
+        if len(timestamps) != count:
+            raise ValueError("Number of timestamps must match number of payloads")
+
+        numpy = self.__import_numpy(use_numpy)
+        if numpy:
+            self.__decode_numpy(numpy, payloads, sources, timestamps)
+        else:
+            self.__decode(payloads, sources, timestamps)
+        self.__count = count
+        self.__numpy = numpy is not None
+
+    @classmethod
+    def from_packets(cls, packets, timestamps=None, use_numpy=None):
+        """
+        Decodes the IO samples of the provided packets.
+
+        Packets must contain an IO sample, such as
+        :class:`.IODataSampleRxIndicatorPacket`, :class:`.RX64IOPacket` or
+        :class:`.RX16IOPacket`. The source of each sample is its 64-bit source
+        address, its 16-bit one if the packet does not have a 64-bit address,
+        or its IP address.
+
+        Args:
+            packets (List): List of packets to decode.
+            timestamps (List, optional, default=`None`): Reception time of each
+                packet in seconds since the epoch. `None` to use the current
+                time for every sample.
+            use_numpy (Boolean, optional, default=`None`): `True` to decode
+                into NumPy arrays, `False` to decode into
+                :class:`array.array` objects, `None` to use NumPy only if it
+                is available.
+
+        Returns:
+            :class:`.IOSampleBatch`: The decoded IO samples.
+
+        Raises:
+            ValueError: If any packet does not contain a valid IO sample, or
+                if the length of `timestamps` does not match the number of
+                packets.
+            ImportError: If `use_numpy` is `True` and NumPy is not available.
+        """
+        payloads = []
+        sources = []
+        for packet in packets:
+            payloads.append(packet.rf_data)
+            sources.append(cls.__get_source(packet))
+
+        return cls(payloads, sources=sources, timestamps=timestamps,
+                   use_numpy=use_numpy)
+
+    def __len__(self):
+        return self.__count
+
+    def __getitem__(self, index):
+        """
+        Operator []
+
+        Args:
+            index (Integer): Index of the sample to get.
+
+        Returns:
+            :class:`.IOSampleView`: The sample at the given index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("IO sample index out of range")
+        return IOSampleView(self, index)
+
+    def __iter__(self):
+        """
+        Gets an iterator over the samples of this batch.
+
+        Returns:
+            Iterator: Iterator of :class:`.IOSampleView`.
+        """
+        return (IOSampleView(self, i) for i in range(self.__count))
+
+    @property
+    def uses_numpy(self):
+        """
+        Returns whether the columns of this batch are NumPy arrays.
+
+        Returns:
+            Boolean: `True` for NumPy arrays, `False` for
+                :class:`array.array` objects.
+        """
+        return self.__numpy
+
+    @property
+    def timestamp(self):
+        """
+        Returns the column with the reception time of each sample.
+
+        Returns:
+            Array: Reception time of each sample in seconds since the epoch.
+        """
+        return self.__timestamp
+
+    @property
+    def source(self):
+        """
+        Returns the column with the source address of each sample.
+
+        Returns:
+            Array: Source address of each sample as integer.
+        """
+        return self.__source
+
+    @property
+    def digital_mask(self):
+        """
+        Returns the column with the digital mask of each sample.
+
+        Returns:
+            Array: Digital mask of each sample.
+        """
+        return self.__digital_mask
+
+    @property
+    def digital(self):
+        """
+        Returns the column with the digital values of each sample. Bit `n`
+        is the value of the digital line `n`, only valid if it is enabled in
+        the digital mask.
+
+        Returns:
+            Array: Digital values of each sample.
+        """
+        return self.__digital
+
+    @property
+    def analog_mask(self):
+        """
+        Returns the column with the mask of the analog values included in each
+        sample. Bit `n` corresponds to the ADC line `n` and bit 7 to the power
+        supply voltage.
+
+        Returns:
+            Array: Analog mask of each sample.
+        """
+        return self.__analog_mask
+
+    @property
+    def analog(self):
+        """
+        Returns the analog columns, one per ADC line.
+
+        Returns:
+            Tuple: Analog value columns, indexed by ADC line.
+        """
+        return self.__analog
+
+    @property
+    def supply_voltage(self):
+        """
+        Returns the column with the power supply voltage of each sample.
+
+        Returns:
+            Array: Power supply voltage of each sample.
+        """
+        return self.__supply_voltage
+
+    def get_analog(self, io_line):
+        """
+        Returns the column with the analog values of the provided IO line.
+
+        Args:
+            io_line (:class:`.IOLine`): The IO line to get its analog values.
+
+        Returns:
+            Array: Analog value of the line in each sample, `None` if the line
+                cannot be configured as ADC.
+
+        .. seealso::
+           | :class:`.IOLine`
+        """
+        if io_line.index >= self.__ANALOG_LINES:
+            return None
+        return self.__analog[io_line.index]
+
+    def __decode(self, payloads, sources, timestamps):
+        """
+        Decodes the provided payloads into :class:`array.array` columns.
+
+        Args:
+            payloads (List): List of IO sample payloads (Bytes).
+            sources (List): Source address of each payload.
+            timestamps (List): Reception time of each payload.
+        """
+        count = len(payloads)
+        self.__timestamp = array("d", timestamps)
+        self.__source = array("Q", sources)
+        self.__digital_mask = array("H", [0]) * count
+        self.__digital = array("H", [0]) * count
+        self.__analog_mask = array("B", [0]) * count
+        self.__analog = tuple(array("H", [0]) * count
+                              for _ in range(self.__ANALOG_LINES))
+        self.__supply_voltage = array("H", [0]) * count
+
+        for i, payload in enumerate(payloads):
+            dig_mask, dig_offset, an_mask, an_offsets, supply_offset = \
+                self.__get_layout(payload)
+            self.__digital_mask[i] = dig_mask
+            if dig_offset is not None:
+                self.__digital[i] = dig_mask & (
+                    ((payload[dig_offset] & 0x7F) << 8) + payload[dig_offset + 1])
+            self.__analog_mask[i] = an_mask
+            for line, offset in an_offsets:
+                self.__analog[line][i] = (payload[offset] << 8) + payload[offset + 1]
+            if supply_offset is not None:
+                self.__supply_voltage[i] = \
+                    (payload[supply_offset] << 8) + payload[supply_offset + 1]
+
+    def __decode_numpy(self, numpy, payloads, sources, timestamps):
+        """
+        Decodes the provided payloads into NumPy columns. Payloads sharing
+        layout and length are decoded together.
+
+        Args:
+            numpy (Module): The NumPy module.
+            payloads (List): List of IO sample payloads (Bytes).
+            sources (List): Source address of each payload.
+            timestamps (List): Reception time of each payload.
+        """
+        count = len(payloads)
+        self.__timestamp = numpy.array(timestamps, dtype=numpy.float64)
+        self.__source = numpy.array(sources, dtype=numpy.uint64)
+        self.__digital_mask = numpy.zeros(count, dtype=numpy.uint16)
+        self.__digital = numpy.zeros(count, dtype=numpy.uint16)
+        self.__analog_mask = numpy.zeros(count, dtype=numpy.uint8)
+        self.__analog = tuple(numpy.zeros(count, dtype=numpy.uint16)
+                              for _ in range(self.__ANALOG_LINES))
+        self.__supply_voltage = numpy.zeros(count, dtype=numpy.uint16)
+
+        groups = {}
+        for i, payload in enumerate(payloads):
+            groups.setdefault((self.__get_layout(payload), len(payload)), []).append(i)
+
+        for (layout, length), rows in groups.items():
+            dig_mask, dig_offset, an_mask, an_offsets, supply_offset = layout
+            data = numpy.frombuffer(
+                b"".join(payloads[i] for i in rows),
+                dtype=numpy.uint8).reshape(-1, length).astype(numpy.uint16)
+            rows = numpy.array(rows)
+
+            self.__digital_mask[rows] = dig_mask
+            if dig_offset is not None:
+                self.__digital[rows] = dig_mask & (
+                    ((data[:, dig_offset] & 0x7F) << 8) | data[:, dig_offset + 1])
+            self.__analog_mask[rows] = an_mask
+            for line, offset in an_offsets:
+                self.__analog[line][rows] = (data[:, offset] << 8) | data[:, offset + 1]
+            if supply_offset is not None:
+                self.__supply_voltage[rows] = \
+                    (data[:, supply_offset] << 8) | data[:, supply_offset + 1]
+
+    @classmethod
+    def __get_layout(cls, payload):
+        """
+        Returns the layout of the provided IO sample payload. Layouts are
+        cached by configuration bytes and payload length.
+
+        Args:
+            payload (Bytes): The IO sample payload.
+
+        Returns:
+            Tuple: Digital mask, offset of the digital values (`None` if there
+                are no digital values), analog mask, tuple of
+                (ADC line, offset) pairs, and offset of the power supply
+                voltage (`None` if not included).
+        """
+        length = len(payload)
+        key = (payload[1:3] if length % 2 else payload[1:4], length)
+        layout = cls.__LAYOUTS.get(key)
+        if layout is None:
+            if len(cls.__LAYOUTS) >= cls.__MAX_LAYOUTS:
+                cls.__LAYOUTS.clear()
+            layout = cls.__compute_layout(payload)
+            cls.__LAYOUTS[key] = layout
+        return layout
+
+    @staticmethod
+    def __compute_layout(payload):
+        """
+        Computes the layout of the provided IO sample payload, the same way
+        :class:`.IOSample` parses it.
+
+        Args:
+            payload (Bytes): The IO sample payload.
+
+        Returns:
+            Tuple: The layout of the payload.
+        """
+        if len(payload) % 2:
+            # 802.15.4 sample: digital and analog masks merged in 2 bytes.
+            dig_mask = ((payload[1] & 0x01) << 8) + payload[2]
+            an_bits = ((((payload[1] << 8) + payload[2]) & 0x7E00) >> 9)
+            index = 3
+        else:
+            dig_mask = ((payload[1] & 0x7F) << 8) + payload[2]
+            an_bits = payload[3] & 0xBF
+            index = 4
+
+        dig_offset = None
+        if dig_mask > 0:
+            dig_offset = index
+            index += 2
+
+        an_mask = 0
+        an_offsets = []
+        supply_offset = None
+        for line in range(8):
+            if len(payload) - index <= 1:
+                break
+            if not utils.is_bit_enabled(an_bits, line):
+                continue
+            if line == 7:
+                supply_offset = index
+            else:
+                an_offsets.append((line, index))
+            an_mask |= 1 << line
+            index += 2
+
+        return dig_mask, dig_offset, an_mask, tuple(an_offsets), supply_offset
+
+    @staticmethod
+    def __get_source(packet):
+        """
+        Returns the source address of the provided packet as integer.
+
+        Args:
+            packet (:class:`.XBeeAPIPacket`): The packet to get its source.
+
+        Returns:
+            Integer: The source address, 0 if the packet does not have one.
+        """
+        for attr in ("x64bit_source_addr", "x16bit_source_addr"):
+            addr = getattr(packet, attr, None)
+            if addr is not None:
+                return int.from_bytes(addr.address, "big")
+        addr = getattr(packet, "source_address", None)
+        return int(addr) if addr is not None else 0
+
+    @staticmethod
+    def __import_numpy(use_numpy):
+        """
+        Imports NumPy if requested and available.
+
+        Args:
+            use_numpy (Boolean): `True` to require NumPy, `False` to not use
+                it, `None` to use it only if available.
+
+        Returns:
+            Module: The NumPy module, `None` if it is not used.
+
+        Raises:
+            ImportError: If `use_numpy` is `True` and NumPy is not available.
+        """
+        if use_numpy is False:
+            return None
+        try:
+            import numpy
+        except ImportError:
+            if use_numpy:
+                raise
+            return None
+        return numpy
+
+
+class IOSampleView:
+    """
+    This class represents a single IO data sample of an
+    :class:`.IOSampleBatch`.
+
+    A view only keeps its batch and index, and reads the values of the sample
+    from the batch columns when they are requested. It provides the same
+    accessors as :class:`.IOSample`.
+    """
+
+    __slots__ = ("__batch", "__index")
+
+    def __init__(self, batch, index):
+        """
+        Class constructor. Instantiates a new :class:`.IOSampleView` object
+        with the provided parameters.
+
+        Args:
+            batch (:class:`.IOSampleBatch`): The batch containing the sample.
+            index (Integer): Index of the sample in the batch.
+        """
+        self.__batch = batch
+        self.__index = index
+
+    def __str__(self):
+        values = ["[%s: %s]" % (line, value)
+                  for line, value in self.digital_values.items()]
+        values.extend("[%s: %s]" % (line, value)
+                      for line, value in self.analog_values.items())
+        if self.has_power_supply_value():
+            values.append("[Power supply voltage: %s]" % self.power_supply_value)
+        return "{" + ", ".join(values) + "}"
+
+    @property
+    def batch(self):
+        """
+        Returns the batch containing this sample.
+
+        Returns:
+            :class:`.IOSampleBatch`: The batch of this sample.
+        """
+        return self.__batch
+
+    @property
+    def index(self):
+        """
+        Returns the index of this sample in its batch.
+
+        Returns:
+            Integer: The index of this sample.
+        """
+        return self.__index
+
+    @property
+    def timestamp(self):
+        """
+        Returns the reception time of this sample.
+
+        Returns:
+            Float: Reception time in seconds since the epoch.
+        """
+        return float(self.__batch.timestamp[self.__index])
+
+    @property
+    def source(self):
+        """
+        Returns the source address of this sample.
+
+        Returns:
+            Integer: The source address as integer.
+        """
+        return int(self.__batch.source[self.__index])
+
+    @property
+    def digital_mask(self):
+        """
+        Returns the digital mask of this sample.
+
+        Returns:
+            Integer: The digital mask.
+        """
+        return int(self.__batch.digital_mask[self.__index])
+
+    @property
+    def analog_mask(self):
+        """
+        Returns the mask of the analog values included in this sample. Bit `n`
+        corresponds to the ADC line `n` and bit 7 to the power supply voltage.
+
+        Returns:
+            Integer: The analog mask.
+        """
+        return int(self.__batch.analog_mask[self.__index])
+
+    @property
+    def digital_values(self):
+        """
+        Returns the digital values map.
+
+        Returns:
+            Dictionary: The digital values map.
+        """
+        mask = self.digital_mask
+        values = int(self.__batch.digital[self.__index])
+        return {IOLine.get(i): IOValue.HIGH if utils.is_bit_enabled(values, i) else IOValue.LOW
+                for i in range(16) if utils.is_bit_enabled(mask, i)}
+
+    @property
+    def analog_values(self):
+        """
+        Returns the analog values map.
+
+        Returns:
+            Dictionary: The analog values map.
+        """
+        mask = self.analog_mask
+        return {IOLine.get(i): int(column[self.__index])
+                for i, column in enumerate(self.__batch.analog)
+                if utils.is_bit_enabled(mask, i)}
+
+    @property
+    def power_supply_value(self):
+        """
+        Returns the value of the power supply voltage.
+
+        Returns:
+            Integer: The power supply value, `None` if the sample does not
+                contain power supply value.
+        """
+        if not self.has_power_supply_value():
+            return None
+        return int(self.__batch.supply_voltage[self.__index])
+
+    def has_digital_values(self):
+        """
+        Checks whether the sample has digital values or not.
+
+        Returns:
+            Boolean: `True` if the sample has digital values, `False` otherwise.
+        """
+        return self.digital_mask > 0
+
+    def has_digital_value(self, io_line):
+        """
+        Returns whether the sample contains a digital value for the provided
+        IO line or not.
+
+        Args:
+            io_line (:class:`IOLine`): The IO line to check.
+
+        Returns:
+            Boolean: `True` if the given IO line has a digital value, `False`
+                otherwise.
+        """
+        return io_line.index < 16 and utils.is_bit_enabled(self.digital_mask, io_line.index)
+
+    def has_analog_values(self):
+        """
+        Returns whether the sample has analog values or not.
+
+        Returns:
+            Boolean: `True` if there are analog values, `False` otherwise.
+        """
+        return self.analog_mask & 0x7F > 0
+
+    def has_analog_value(self, io_line):
+        """
+        Returns whether the given IO line has an analog value or not.
+
+        Args:
+            io_line (:class:`IOLine`): The IO line to check.
+
+        Returns:
+            Boolean: `True` if the given IO line has an analog value, `False`
+                otherwise.
+        """
+        return (io_line.index < len(self.__batch.analog)
+                and utils.is_bit_enabled(self.analog_mask, io_line.index))
+
+    def has_power_supply_value(self):
+        """
+        Returns whether the sample has power supply value or not.
+
+        Returns:
+            Boolean: `True` if the sample has a power supply value, `False`
+                otherwise.
+        """
+        return utils.is_bit_enabled(self.analog_mask, 7)
+
+    def get_digital_value(self, io_line):
+        """
+        Returns the digital value of the provided IO line.
+
+        Args:
+            io_line (:class:`.IOLine`): The IO line to get its digital value.
+
+        Returns:
+            :class:`.IOValue`: The :class:`.IOValue` of the given IO line or
+                `None` if the sample does not contain a digital value for it.
+
+        .. seealso::
+           | :class:`.IOLine`
+           | :class:`.IOValue`
+        """
+        if not self.has_digital_value(io_line):
+            return None
+        if utils.is_bit_enabled(int(self.__batch.digital[self.__index]), io_line.index):
+            return IOValue.HIGH
+        return IOValue.LOW
+
+    def get_analog_value(self, io_line):
+        """
+        Returns the analog value of the provided IO line.
+
+        Args:
+            io_line (:class:`.IOLine`): The IO line to get its analog value.
+
+        Returns:
+            Integer: The analog value of the given IO line or `None` if the
+                sample does not contain an analog value for it.
+
+        .. seealso::
+           | :class:`.IOLine`
+        """
+        if not self.has_analog_value(io_line):
+            return None
+        return int(self.__batch.analog[io_line.index][self.__index])
+
+
 class IOMode(Enum):
     """
     Enumerates the different Input/Output modes that an IO line can be
@@ -204,10 +204,8 @@ class WiFiEncryptionType(Enum):
             :class:`.WiFiEncryptionType`: the WiFiEncryptionType with the given
                 code, `None` if not found.
         """
-        for enc_type in cls:
-            if enc_type.code == code:
-                return enc_type
-        return None
+        return cls.lookupTable.get(code)
 
 
+WiFiEncryptionType.lookupTable = utils.enum_lookup_table(WiFiEncryptionType)
 WiFiEncryptionType.__doc__ += utils.doc_enum(WiFiEncryptionType)
@@ -39,8 +39,12 @@ class XBee16BitAddress:
     |     **UNKNOWN_ADDRESS** (XBee16BitAddress): 16-bit unknown address.
     |     **PATTERN** (String): Pattern for the 16-bit address string: `(0[xX])?[0-9a-fA-F]{1,4}`
 
+    Instances are immutable. The coordinator, broadcast and unknown addresses
+    are interned, so building any of them returns the shared instance.
     """
 
+    __slots__ = ("__address", "__hash")
+
     PATTERN = "^(0[xX])?[0-9a-fA-F]{1,4}$"
     """
     16-bit address string pattern.
@@ -62,8 +66,9 @@ class XBee16BitAddress:
     """
 
     __REGEXP = re.compile(PATTERN)
+    __INTERNED = dict.fromkeys((b"\x00\x00", b"\xFF\xFF", b"\xFF\xFE"))
 
-    def __init__(self, address):
+    def __new__(cls, address):
         """
         Class constructor. Instantiates a new :class:`.XBee16BitAddress` object with the provided parameters.
 
@@ -79,9 +84,26 @@ class XBee16BitAddress:
         if len(address) > 2:
             raise ValueError("Address can't contain more than 2 bytes")
 
-        if len(address) == 1:
-            address.insert(0, 0)
-        self.__address = address
+        address = bytes(address).rjust(2, b"\x00")
+        interned = cls.__INTERNED.get(address)
+        if type(interned) is cls:
+            return interned
+
+        instance = super().__new__(cls)
+        instance.__address = address
+        instance.__hash = hash(address)
+        if cls is XBee16BitAddress and address in cls.__INTERNED:
+            cls.__INTERNED[address] = instance
+        return instance
+
+    def __reduce__(self):
+        """
+        Returns the data needed to pickle or copy this address.
+
+        Returns:
+            Tuple: the class and the arguments to rebuild this address.
+        """
+        return self.__class__, (self.__address,)
 
     @classmethod
     def from_hex_string(cls, address):
@@ -184,7 +206,7 @@ class XBee16BitAddress:
         Returns:
             Integer. 'index' component of the address bytearray.
         """
-        return self.__address.__get_item__(index)
+        return self.__address[index]
 
     def __str__(self):
         """
@@ -195,7 +217,7 @@ class XBee16BitAddress:
         Returns:
             String: "informal" representation of this XBee16BitAddress.
         """
-        return utils.hex_to_string(self.__address, pretty=False)
+        return self.__address.hex().upper()
 
     def __hash__(self):
         """
@@ -204,10 +226,7 @@ class XBee16BitAddress:
         Returns:
             Integer: hash code value for the object.
         """
-        res = 23
-        for byte in self.__address:
-            res = 31 * (res + byte)
-        return res
+        return self.__hash
 
     def __eq__(self, other):
         """
@@ -219,10 +238,12 @@ class XBee16BitAddress:
         Returns:
             Boolean: `True` if self and other have the same value and type, `False` in other case.
         """
+        if self is other:
+            return True
         if not isinstance(other, XBee16BitAddress):
             return False
 
-        return self.address == other.address
+        return self.__address == other.__address
 
     def __iter__(self):
         """
@@ -273,8 +294,13 @@ class XBee64BitAddress:
 
     The 64-bit address is a unique device address assigned during manufacturing.
     This address is unique to each physical device.
+
+    Instances are immutable. The coordinator, broadcast and unknown addresses
+    are interned, so building any of them returns the shared instance.
     """
 
+    __slots__ = ("__address", "__hash")
+
     PATTERN = "^(0[xX])?[0-9a-fA-F]{1,16}$"
     """
     64-bit address string pattern.
@@ -298,8 +324,9 @@ class XBee64BitAddress:
     __REGEXP = re.compile(PATTERN)
     __DEVICE_ID_SEPARATOR = "-"
     __DEVICE_ID_MAC_SEPARATOR = "FF"
+    __INTERNED = dict.fromkeys((bytes(8), bytes(6) + b"\xFF\xFF", b"\xFF" * 8))
 
-    def __init__(self, address):
+    def __new__(cls, address):
         """
         Class constructor. Instantiates a new :class:`.XBee64BitAddress` object with the provided parameters.
 
@@ -314,12 +341,26 @@ class XBee64BitAddress:
         if len(address) > 8:
             raise ValueError("Address cannot contain more than 8 bytes")
 
-        self.__address = bytearray(8)
-        diff = 8 - len(address)
-        for i in range(diff):
-            self.__address[i] = 0
-        for i in range(diff, 8):
-            self.__address[i] = address[i - diff]
+        address = bytes(address).rjust(8, b"\x00")
+        interned = cls.__INTERNED.get(address)
+        if type(interned) is cls:
+            return interned
+
+        instance = super().__new__(cls)
+        instance.__address = address
+        instance.__hash = hash(address)
+        if cls is XBee64BitAddress and address in cls.__INTERNED:
+            cls.__INTERNED[address] = instance
+        return instance
+
+    def __reduce__(self):
+        """
+        Returns the data needed to pickle or copy this address.
+
+        Returns:
+            Tuple: the class and the arguments to rebuild this address.
+        """
+        return self.__class__, (self.__address,)
 
     @classmethod
     def from_hex_string(cls, address):
@@ -418,7 +459,7 @@ class XBee64BitAddress:
         Returns:
             String: "informal" representation of this XBee64BitAddress.
         """
-        return "".join(["%02X" % i for i in self.__address])
+        return self.__address.hex().upper()
 
     def __hash__(self):
         """
@@ -427,10 +468,7 @@ class XBee64BitAddress:
         Returns:
             Integer: hash code value for the object.
         """
-        res = 23
-        for byte in self.__address:
-            res = 31 * (res + byte)
-        return res
+        return self.__hash
 
     def __eq__(self, other):
         """
@@ -442,12 +480,12 @@ class XBee64BitAddress:
         Returns:
             Boolean: `True` if self and other have the same value and type, `False` in other case.
         """
-        if other is None:
-            return False
+        if self is other:
+            return True
         if not isinstance(other, XBee64BitAddress):
             return False
 
-        return self.address == other.address
+        return self.__address == other.__address
 
     def __iter__(self):
         """
@@ -213,10 +213,7 @@ class SpecialByte(Enum):
         Returns:
             :class:`.SpecialByte`: SpecialByte with the given value.
         """
-        for special_byte in cls:
-            if special_byte.code == value:
-                return special_byte
-        return None
+        return cls.lookupTable.get(value)
 
     @staticmethod
     def escape(value):
@@ -245,6 +242,7 @@ class SpecialByte(Enum):
         return value in [i.value for i in SpecialByte]
 
 
+SpecialByte.lookupTable = utils.enum_lookup_table(SpecialByte)
 SpecialByte.__doc__ += utils.doc_enum(SpecialByte)
 
 
@@ -81,10 +81,7 @@ class FSCmdType(Enum):
             :class:`.FSCmdType`: The file system command associated to the
                 given code or `None` if not found.
         """
-        for frame_type in cls:
-            if code == frame_type.code:
-                return frame_type
-        return None
+        return cls.lookupTable.get(code)
 
     def __repr__(self):
         return "%s (%d)" % (self.__description, self.__code)
@@ -93,6 +90,7 @@ class FSCmdType(Enum):
         return "%s (%d)" % (self.__description, self.__code)
 
 
+FSCmdType.lookupTable = utils.enum_lookup_table(FSCmdType)
 FSCmdType.__doc__ += utils.doc_enum(FSCmdType)
 
 
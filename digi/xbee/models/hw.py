@@ -130,10 +130,7 @@ class HardwareVersion(Enum):
             :class:`HardwareVersion`: the HardwareVersion with the given code,
                 `None` if not found.
         """
-        for version in cls:
-            if version.code == code:
-                return version
-        return None
+        return cls.lookupTable.get(code)
 
 
 class LegacyHardwareVersion(Enum):
@@ -213,5 +210,6 @@ class LegacyHardwareVersion(Enum):
         return None
 
 
+HardwareVersion.lookupTable = utils.enum_lookup_table(HardwareVersion)
 HardwareVersion.__doc__ += utils.doc_enum(HardwareVersion)
 LegacyHardwareVersion.__doc__ += utils.doc_enum(LegacyHardwareVersion)
@@ -70,12 +70,10 @@ class OperatingMode(Enum):
         Returns:
             :class:`.OperatingMode`: the OperatingMode with the given code.
         """
-        for mode in cls:
-            if mode.code == code:
-                return mode
-        return OperatingMode.UNKNOWN
+        return cls.lookupTable.get(code, OperatingMode.UNKNOWN)
 
 
+OperatingMode.lookupTable = utils.enum_lookup_table(OperatingMode)
 OperatingMode.__doc__ += utils.doc_enum(OperatingMode)
 
 
@@ -130,12 +128,10 @@ class APIOutputMode(Enum):
             :class:`.APIOutputMode`: the APIOutputMode with the given code,
                 `None` if not found.
         """
-        for mode in cls:
-            if mode.code == code:
-                return mode
-        return None
+        return cls.lookupTable.get(code)
 
 
+APIOutputMode.lookupTable = utils.enum_lookup_table(APIOutputMode)
 APIOutputMode.__doc__ += utils.doc_enum(APIOutputMode)
 
 
@@ -199,10 +195,7 @@ class APIOutputModeBit(Enum):
             :class:`.OperatingMode`: the APIOutputModeBit with the given code,
                 `None` if not found.
         """
-        for item in cls:
-            if code == item.code:
-                return item
-        return None
+        return cls.lookupTable.get(code)
 
     @classmethod
     def calculate_api_output_mode_value(cls, protocol, options):
@@ -234,6 +227,7 @@ class APIOutputModeBit(Enum):
         return 0
 
 
+APIOutputModeBit.lookupTable = utils.enum_lookup_table(APIOutputModeBit)
 APIOutputModeBit.__doc__ += utils.doc_enum(APIOutputModeBit)
 
 
@@ -282,12 +276,10 @@ class IPAddressingMode(Enum):
             :class:`.IPAddressingMode`: the IPAddressingMode with the given
                 code, `None` if not found.
         """
-        for mode in cls:
-            if mode.code == code:
-                return mode
-        return None
+        return cls.lookupTable.get(code)
 
 
+IPAddressingMode.lookupTable = utils.enum_lookup_table(IPAddressingMode)
 IPAddressingMode.__doc__ += utils.doc_enum(IPAddressingMode)
 
 
@@ -319,6 +311,18 @@ class NeighborDiscoveryMode(Enum):
     at the same time.
     """
 
+    ADAPTIVE = (2, "Adaptive")
+    """
+    The discovery of node neighbors is requested for several nodes at the same
+    time, closest nodes (in hops) first. The number of simultaneous requests
+    is limited per hop depth, the timeout of each request is calculated from
+    the measured response time of the node and requests are paused when the
+    network reports congestion.
+
+    This mode is recommended for large networks, it is faster than 'Cascade'
+    and generates less traffic than 'Flood'.
+    """
+
     def __init__(self, code, description):
         self.__code = code
         self.__description = description
@@ -355,10 +359,8 @@ class NeighborDiscoveryMode(Enum):
             :class:`.NeighborDiscoveryMode`: the NeighborDiscoveryMode with
                 the given code. `None` if not found.
         """
-        for mode in cls:
-            if mode.code == code:
-                return mode
-        return None
+        return cls.lookupTable.get(code)
 
 
+NeighborDiscoveryMode.lookupTable = utils.enum_lookup_table(NeighborDiscoveryMode)
 NeighborDiscoveryMode.__doc__ += utils.doc_enum(NeighborDiscoveryMode)
@@ -353,12 +353,10 @@ class SendDataRequestOptions(Enum):
             :class:`.FrameError`: the SendDataRequestOptions with the given
                 code, `None` if not found.
         """
-        for option in cls:
-            if option.code == code:
-                return option
-        return None
+        return cls.lookupTable.get(code)
 
 
+SendDataRequestOptions.lookupTable = utils.enum_lookup_table(SendDataRequestOptions)
 SendDataRequestOptions.__doc__ += utils.doc_enum(SendDataRequestOptions)
 
 
@@ -434,10 +432,7 @@ class DiscoveryOptions(Enum):
             :class:`.FrameError`: the `DiscoveryOptions` with the given code,
                 `None` if not found.
         """
-        for option in cls:
-            if option.code == code:
-                return option
-        return None
+        return cls.lookupTable.get(code)
 
     @staticmethod
     def calculate_discovery_value(protocol, options):
@@ -470,6 +465,7 @@ class DiscoveryOptions(Enum):
         return value
 
 
+DiscoveryOptions.lookupTable = utils.enum_lookup_table(DiscoveryOptions)
 DiscoveryOptions.__doc__ += utils.doc_enum(DiscoveryOptions)
 
 
@@ -524,12 +520,10 @@ class XBeeLocalInterface(Enum):
             :class:`.XBeeLocalInterface`: the `XBeeLocalInterface` with the
                 given code, `UNKNOWN` if not found.
         """
-        for interface in cls:
-            if interface.code == code:
-                return interface
-        return XBeeLocalInterface.UNKNOWN
+        return cls.lookupTable.get(code, XBeeLocalInterface.UNKNOWN)
 
 
+XBeeLocalInterface.lookupTable = utils.enum_lookup_table(XBeeLocalInterface)
 XBeeLocalInterface.__doc__ += utils.doc_enum(XBeeLocalInterface)
 
 
@@ -583,12 +577,10 @@ class RegisterKeyOptions(Enum):
             :class:`.RegisterKeyOptions`: the `RegisterKeyOptions` with the
                 given code, `UNKNOWN` if not found.
         """
-        for option in cls:
-            if option.code == code:
-                return option
-        return RegisterKeyOptions.UNKNOWN
+        return cls.lookupTable.get(code, RegisterKeyOptions.UNKNOWN)
 
 
+RegisterKeyOptions.lookupTable = utils.enum_lookup_table(RegisterKeyOptions)
 RegisterKeyOptions.__doc__ += utils.doc_enum(RegisterKeyOptions)
 
 
@@ -636,12 +628,10 @@ class SocketOption(Enum):
             :class:`.SocketOption`: the `SocketOption` with the given code,
                 `SocketOption.UNKNOWN` if not found.
         """
-        for option in cls:
-            if option.code == code:
-                return option
-        return SocketOption.UNKNOWN
+        return cls.lookupTable.get(code, SocketOption.UNKNOWN)
 
 
+SocketOption.lookupTable = utils.enum_lookup_table(SocketOption)
 SocketOption.__doc__ += utils.doc_enum(SocketOption)
 
 
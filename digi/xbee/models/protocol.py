@@ -82,10 +82,7 @@ class XBeeProtocol(Enum):
         Returns:
             XBeeProtocol: XBeeProtocol for the given code.
         """
-        for protocol in cls:
-            if protocol.code == code:
-                return protocol
-        return XBeeProtocol.UNKNOWN
+        return cls.lookupTable.get(code, XBeeProtocol.UNKNOWN)
 
     @staticmethod
     def determine_protocol(hardware_version, firmware_version, br_value=None):
@@ -266,6 +263,7 @@ class XBeeProtocol(Enum):
         return XBeeProtocol.ZIGBEE
 
 
+XBeeProtocol.lookupTable = utils.enum_lookup_table(XBeeProtocol)
 XBeeProtocol.__doc__ += utils.doc_enum(XBeeProtocol)
 
 
@@ -319,10 +317,7 @@ class IPProtocol(Enum):
             :class:`.IPProtocol`: IP protocol for the given code or `None` if
                 there is not any `IPProtocol` with the given code.
         """
-        for protocol in cls:
-            if protocol.code == code:
-                return protocol
-        return None
+        return cls.lookupTable.get(code)
 
     @classmethod
     def get_by_description(cls, description):
@@ -343,6 +338,7 @@ class IPProtocol(Enum):
         return None
 
 
+IPProtocol.lookupTable = utils.enum_lookup_table(IPProtocol)
 IPProtocol.__doc__ += utils.doc_enum(IPProtocol)
 
 
@@ -397,11 +393,8 @@ class Role(Enum):
             :class:`.Role`: the Role with the given identifier. `None` if it
                 does not exist.
         """
-        for item in cls:
-            if identifier == item.id:
-                return item
-
-        return None
+        return cls.lookupTable.get(identifier)
 
 
+Role.lookupTable = utils.enum_lookup_table(Role, "id")
 Role.__doc__ += utils.doc_enum(Role)
@@ -75,12 +75,10 @@ class ATCommandStatus(Enum):
         """
         # For ATCommResponsePacket (0x88) and RemoteATCommandResponsePacket
         # (0x97), use least significant nibble for status
-        for status in cls:
-            if code & 0x0F == status.code:
-                return status
-        return ATCommandStatus.UNKNOWN
+        return cls.lookupTable.get(code & 0x0F, ATCommandStatus.UNKNOWN)
 
 
+ATCommandStatus.lookupTable = utils.enum_lookup_table(ATCommandStatus)
 ATCommandStatus.__doc__ += utils.doc_enum(ATCommandStatus)
 
 
@@ -136,12 +134,10 @@ class DiscoveryStatus(Enum):
         Returns:
             :class:`.DiscoveryStatus`: the discovery status with the given code.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return DiscoveryStatus.UNKNOWN
+        return cls.lookupTable.get(code, DiscoveryStatus.UNKNOWN)
 
 
+DiscoveryStatus.lookupTable = utils.enum_lookup_table(DiscoveryStatus)
 DiscoveryStatus.__doc__ += utils.doc_enum(DiscoveryStatus)
 
 
@@ -252,12 +248,10 @@ class TransmitStatus(Enum):
         Returns:
             :class:`.TransmitStatus`: the transmit status with the given code.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return TransmitStatus.UNKNOWN
+        return cls.lookupTable.get(code, TransmitStatus.UNKNOWN)
 
 
+TransmitStatus.lookupTable = utils.enum_lookup_table(TransmitStatus)
 TransmitStatus.__doc__ += utils.doc_enum(TransmitStatus)
 
 
@@ -354,12 +348,10 @@ class ModemStatus(Enum):
         Returns:
             :class:`.ModemStatus`: the ModemStatus with the given code.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return ModemStatus.UNKNOWN
+        return cls.lookupTable.get(code, ModemStatus.UNKNOWN)
 
 
+ModemStatus.lookupTable = utils.enum_lookup_table(ModemStatus)
 ModemStatus.__doc__ += utils.doc_enum(ModemStatus)
 
 
@@ -411,12 +403,10 @@ class PowerLevel(Enum):
         Returns:
             :class:`.PowerLevel`: the PowerLevel with the given code.
         """
-        for level in cls:
-            if code == level.code:
-                return level
-        return PowerLevel.LEVEL_UNKNOWN
+        return cls.lookupTable.get(code, PowerLevel.LEVEL_UNKNOWN)
 
 
+PowerLevel.lookupTable = utils.enum_lookup_table(PowerLevel)
 PowerLevel.__doc__ += utils.doc_enum(PowerLevel)
 
 
@@ -529,12 +519,10 @@ class AssociationIndicationStatus(Enum):
             :class:`.AssociationIndicationStatus`: the
                 `AssociationIndicationStatus` with the given code.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return None
+        return cls.lookupTable.get(code)
 
 
+AssociationIndicationStatus.lookupTable = utils.enum_lookup_table(AssociationIndicationStatus)
 AssociationIndicationStatus.__doc__ += utils.doc_enum(AssociationIndicationStatus)
 
 
@@ -596,12 +584,10 @@ class CellularAssociationIndicationStatus(Enum):
             :class:`.CellularAssociationIndicationStatus`: the
                 `CellularAssociationIndicationStatus` with the given code.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return None
+        return cls.lookupTable.get(code)
 
 
+CellularAssociationIndicationStatus.lookupTable = utils.enum_lookup_table(CellularAssociationIndicationStatus)
 CellularAssociationIndicationStatus.__doc__ += utils.doc_enum(CellularAssociationIndicationStatus)
 
 
@@ -654,12 +640,10 @@ class DeviceCloudStatus(Enum):
             :class:`.DeviceCloudStatus`: the `DeviceCloudStatus` with the given
                 code, `None` if not found.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return None
+        return cls.lookupTable.get(code)
 
 
+DeviceCloudStatus.lookupTable = utils.enum_lookup_table(DeviceCloudStatus)
 DeviceCloudStatus.__doc__ += utils.doc_enum(DeviceCloudStatus)
 
 
@@ -716,12 +700,10 @@ class FrameError(Enum):
             :class:`.FrameError`: the `FrameError` with the given code, `None`
                 if not found.
         """
-        for error in cls:
-            if code == error.code:
-                return error
-        return None
+        return cls.lookupTable.get(code)
 
 
+FrameError.lookupTable = utils.enum_lookup_table(FrameError)
 FrameError.__doc__ += utils.doc_enum(FrameError)
 
 
@@ -782,12 +764,10 @@ class WiFiAssociationIndicationStatus(Enum):
                 `WiFiAssociationIndicationStatus` with the given code, `None`
                 if not found.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return None
+        return cls.lookupTable.get(code)
 
 
+WiFiAssociationIndicationStatus.lookupTable = utils.enum_lookup_table(WiFiAssociationIndicationStatus)
 WiFiAssociationIndicationStatus.__doc__ += utils.doc_enum(WiFiAssociationIndicationStatus)
 
 
@@ -838,12 +818,10 @@ class NetworkDiscoveryStatus(Enum):
             :class:`.NetworkDiscoveryStatus`: the `NetworkDiscoveryStatus` with
                 the given code, `None` if not found.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return None
+        return cls.lookupTable.get(code)
 
 
+NetworkDiscoveryStatus.lookupTable = utils.enum_lookup_table(NetworkDiscoveryStatus)
 NetworkDiscoveryStatus.__doc__ += utils.doc_enum(NetworkDiscoveryStatus)
 
 
@@ -897,12 +875,10 @@ class ZigbeeRegisterStatus(Enum):
             :class:`.ZigbeeRegisterStatus`: the `ZigbeeRegisterStatus` with the
                 given code, `ZigbeeRegisterStatus.UNKNOWN` if not found.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return ZigbeeRegisterStatus.UNKNOWN
+        return cls.lookupTable.get(code, ZigbeeRegisterStatus.UNKNOWN)
 
 
+ZigbeeRegisterStatus.lookupTable = utils.enum_lookup_table(ZigbeeRegisterStatus)
 ZigbeeRegisterStatus.__doc__ += utils.doc_enum(ZigbeeRegisterStatus)
 
 
@@ -954,12 +930,10 @@ class EmberBootloaderMessageType(Enum):
             :class:`.EmberBootloaderMessageType`: the `EmberBootloaderMessageType` with the
                 given code, `EmberBootloaderMessageType.UNKNOWN` if not found.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return EmberBootloaderMessageType.UNKNOWN
+        return cls.lookupTable.get(code, EmberBootloaderMessageType.UNKNOWN)
 
 
+EmberBootloaderMessageType.lookupTable = utils.enum_lookup_table(EmberBootloaderMessageType)
 EmberBootloaderMessageType.__doc__ += utils.doc_enum(EmberBootloaderMessageType)
 
 
@@ -1017,12 +991,10 @@ class SocketStatus(Enum):
             :class:`.SocketStatus`: the `SocketStatus` with the given code,
                 `SocketStatus.UNKNOWN` if there not found.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return SocketStatus.UNKNOWN
+        return cls.lookupTable.get(code, SocketStatus.UNKNOWN)
 
 
+SocketStatus.lookupTable = utils.enum_lookup_table(SocketStatus)
 SocketStatus.__doc__ += utils.doc_enum(SocketStatus)
 
 
@@ -1081,12 +1053,10 @@ class SocketState(Enum):
             :class:`.SocketState`: the `SocketState` with the given code,
                 `SocketState.UNKNOWN` if not found.
         """
-        for state in cls:
-            if code == state.code:
-                return state
-        return SocketState.UNKNOWN
+        return cls.lookupTable.get(code, SocketState.UNKNOWN)
 
 
+SocketState.lookupTable = utils.enum_lookup_table(SocketState)
 SocketState.__doc__ += utils.doc_enum(SocketState)
 
 
@@ -1139,10 +1109,7 @@ class SocketInfoState(Enum):
             :class:`.SocketInfoState`: the `SocketInfoState` with the given
                 code, `SocketInfoState.UNKNOWN` if not found.
         """
-        for state in cls:
-            if code == state.code:
-                return state
-        return SocketInfoState.UNKNOWN
+        return cls.lookupTable.get(code, SocketInfoState.UNKNOWN)
 
     @classmethod
     def get_by_description(cls, description):
@@ -1162,6 +1129,7 @@ class SocketInfoState(Enum):
         return SocketInfoState.UNKNOWN
 
 
+SocketInfoState.lookupTable = utils.enum_lookup_table(SocketInfoState)
 SocketInfoState.__doc__ += utils.doc_enum(SocketInfoState)
 
 
@@ -1230,10 +1198,7 @@ class FSCommandStatus(Enum):
             :class:`.FSCommandStatus`: File system command status with the
                 given code, `None` if not found.
         """
-        for status in cls:
-            if code == status.code:
-                return status
-        return None
+        return cls.lookupTable.get(code)
 
     def __repr__(self):
         return "%s (0x%0.2X)" % (self.__description, self.__code)
@@ -1242,4 +1207,5 @@ class FSCommandStatus(Enum):
         return "%s (0x%0.2X)" % (self.__description, self.__code)
 
 
+FSCommandStatus.lookupTable = utils.enum_lookup_table(FSCommandStatus)
 FSCommandStatus.__doc__ += utils.doc_enum(FSCommandStatus)
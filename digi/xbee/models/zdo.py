@@ -970,11 +970,10 @@ class RouteStatus(Enum):
             :class:`.RouteStatus`: RouteStatus with the given id. `None` if
                 it does not exist.
         """
-        for item in cls:
-            if identifier == item.id:
-                return item
+        return cls.lookupTable.get(identifier)
 
-        return None
+
+RouteStatus.lookupTable = utils.enum_lookup_table(RouteStatus, "id")
 
 
 class Route:
@@ -1378,10 +1377,10 @@ class NeighborRelationship(Enum):
             :class:`.NeighborRelationship`: the NeighborRelationship with the
                 given id. `None` if it does not exist.
         """
-        for item in cls:
-            if identifier == item.id:
-                return item
-        return None
+        return cls.lookupTable.get(identifier)
+
+
+NeighborRelationship.lookupTable = utils.enum_lookup_table(NeighborRelationship, "id")
 
 
 class Neighbor:
@@ -129,10 +129,8 @@ class ApiFrameType(Enum):
             :class:`.ApiFrameType`: the API frame type associated to the given
                 code or `UNKNOWN` if not found.
         """
-        for frame_type in cls:
-            if code == frame_type.code:
-                return frame_type
-        return ApiFrameType.UNKNOWN
+        return cls.lookupTable.get(code, ApiFrameType.UNKNOWN)
 
 
+ApiFrameType.lookupTable = utils.enum_lookup_table(ApiFrameType)
 ApiFrameType.__doc__ += utils.doc_enum(ApiFrameType)
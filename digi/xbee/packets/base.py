@@ -127,20 +127,49 @@ class XBeePacket:
 
     Generic actions like checksum compute or packet length calculation is
     performed here.
+
+    The serialized data of a packet is cached until any of its fields is set.
     """
 
     __HASH_SEED = 23
 
     __metaclass__ = ABCMeta
-    __ESCAPE_BYTES = [i.value for i in SpecialByte]
     __ESCAPE_FACTOR = 0x20
     ESCAPE_BYTE = SpecialByte.ESCAPE_BYTE.code
 
+    # Replacements to escape data: escape byte followed by the byte XOR 0x20.
+    # The escape byte goes first so the escape bytes inserted by the other
+    # replacements are not escaped again.
+    __ESCAPE_SEQUENCES = ((b"\x7D", b"\x7D\x5D"),  # Escape byte
+                          (b"\x7E", b"\x7D\x5E"),  # Header byte
+                          (b"\x11", b"\x7D\x31"),  # XON byte
+                          (b"\x13", b"\x7D\x33"))  # XOFF byte
+    __ESCAPE_SEPARATOR = b"\x7D"
+    # Below this length, unescaping byte by byte is faster than in bulk.
+    __BULK_UNESCAPE_MIN_LENGTH = 48
+
     def __init__(self):
         """
         Class constructor. Instantiates a new :class:`.XBeePacket` object.
         """
 
+    def __setattr__(self, name, value):
+        """
+        Sets the attribute value. Any change of the packet fields discards
+        its cached serialized data.
+
+        Bytearray values are copied, so the cached data does not become stale
+        if the caller modifies the given bytearray later.
+
+        Args:
+            name (String): name of the attribute.
+            value: value of the attribute.
+        """
+        if isinstance(value, bytearray):
+            value = bytearray(value)
+        object.__setattr__(self, name, value)
+        self.__dict__.pop("_XBeePacket__cache", None)
+
     def __len__(self):
         """
         Returns the length value of the XBeePacket. The length is the number of
@@ -152,7 +181,7 @@ class XBeePacket:
         .. seealso::
            | :mod:`.factory`
         """
-        return len(self.get_frame_spec_data())
+        return len(self.__get_cached_spec_data())
 
     def __str__(self):
         """
@@ -175,7 +204,10 @@ class XBeePacket:
         """
         if not isinstance(other, XBeePacket):
             return False
-        return other.output() == self.output()
+        if other is self:
+            return True
+        # Same frame specific data means same length, checksum and output
+        return other.__get_cached_spec_data() == self.__get_cached_spec_data()
 
     def __hash__(self):
         """
@@ -184,10 +216,10 @@ class XBeePacket:
         Returns:
             Integer: hash code value for the object.
         """
-        res = self.__HASH_SEED
-        for byte in self.output():
-            res = 31 * (res + byte)
-        return res
+        cache = self.__get_cache()
+        if "hash" not in cache:
+            cache["hash"] = hash((self.__HASH_SEED, self.__get_cached_spec_data()))
+        return cache["hash"]
 
     def get_checksum(self):
         """
@@ -201,7 +233,7 @@ class XBeePacket:
         .. seealso::
            | :mod:`.factory`
         """
-        return 0xFF - (sum(self.get_frame_spec_data()) & 0xFF)
+        return self.__compute_checksum(self.__get_cached_spec_data())
 
     def output(self, escaped=False):
         """
@@ -214,11 +246,15 @@ class XBeePacket:
         Returns:
             Bytearray: raw bytearray of the XBeePacket.
         """
-        frame = self.__build_complete_frame_without_header(self.get_frame_spec_data())
-        if escaped:
-            frame = self._escape_data(frame)
-        frame.insert(0, SpecialByte.HEADER_BYTE.code)
-        return frame
+        cache = self.__get_cache()
+        key = "escaped" if escaped else "output"
+        if key not in cache:
+            frame = self.__build_complete_frame_without_header(
+                bytearray(self.__get_cached_spec_data()))
+            if escaped:
+                frame = self._escape_data(frame)
+            cache[key] = bytes((SpecialByte.HEADER_BYTE.code,)) + frame
+        return bytearray(cache[key])
 
     def to_dict(self):
         """
@@ -294,13 +330,10 @@ class XBeePacket:
         Returns:
             Bytearray: 'data' escaped.
         """
-        esc_data = bytearray()
-        for i in data:
-            if i in XBeePacket.__ESCAPE_BYTES:
-                esc_data.append(SpecialByte.ESCAPE_BYTE.code)
-                esc_data.append(i ^ XBeePacket.__ESCAPE_FACTOR)
-            else:
-                esc_data.append(i)
+        esc_data = bytearray(data)
+        for byte, sequence in XBeePacket.__ESCAPE_SEQUENCES:
+            if byte in esc_data:
+                esc_data = esc_data.replace(byte, sequence)
         return esc_data
 
     @staticmethod
@@ -314,16 +347,71 @@ class XBeePacket:
         Returns:
             Bytearray: `data` unescaped.
         """
-        new_data = bytearray(0)
-        des_escape = False
-        for byte in data:
-            if byte == XBeePacket.ESCAPE_BYTE:
-                des_escape = True
-            else:
-                new_data.append(byte ^ 0x20 if des_escape else byte)
-                des_escape = False
+        if XBeePacket.ESCAPE_BYTE not in data:
+            return bytearray(data)
+
+        if len(data) < XBeePacket.__BULK_UNESCAPE_MIN_LENGTH:
+            esc_byte = XBeePacket.ESCAPE_BYTE
+            esc_factor = XBeePacket.__ESCAPE_FACTOR
+            new_data = bytearray()
+            des_escape = False
+            for byte in data:
+                if byte == esc_byte:
+                    des_escape = True
+                else:
+                    new_data.append(byte ^ esc_factor if des_escape else byte)
+                    des_escape = False
+            return new_data
+
+        new_data = bytearray(data)
+        esc_count = new_data.count(XBeePacket.__ESCAPE_SEPARATOR)
+
+        # Well formed data: every escape byte starts one of the sequences, so
+        # they can be replaced in bulk (the escape byte sequence the last).
+        if esc_count == sum(new_data.count(sequence)
+                            for _, sequence in XBeePacket.__ESCAPE_SEQUENCES):
+            for byte, sequence in reversed(XBeePacket.__ESCAPE_SEQUENCES):
+                new_data = new_data.replace(sequence, byte)
+            return new_data
+
+        chunks = bytes(data).split(XBeePacket.__ESCAPE_SEPARATOR)
+        new_data = bytearray(chunks[0])
+        # Every chunk after an escape byte starts with an escaped byte. Empty
+        # chunks come from consecutive escape bytes, only the last one counts.
+        for chunk in chunks[1:]:
+            if chunk:
+                new_data.append(chunk[0] ^ XBeePacket.__ESCAPE_FACTOR)
+                new_data += chunk[1:]
         return new_data
 
+    def __get_cache(self):
+        """
+        Returns the dictionary with the cached serialized data of this packet.
+        It is discarded when any attribute of the packet is set.
+
+        Returns:
+            Dictionary: the cache of this packet.
+        """
+        cache = self.__dict__.get("_XBeePacket__cache")
+        if cache is None:
+            cache = {}
+            # Do not use '__setattr__', it discards the cache
+            self.__dict__["_XBeePacket__cache"] = cache
+        return cache
+
+    def __get_cached_spec_data(self):
+        """
+        Returns the frame specific data of this packet, computing it only if
+        any field changed since the last time.
+
+        Returns:
+            Bytes: the frame specific data.
+        """
+        cache = self.__get_cache()
+        if "spec_data" not in cache:
+            cache["spec_data"] = bytes(self.get_frame_spec_data())
+        return cache["spec_data"]
+
     def __build_complete_frame_without_header(self, frame_spec_data):
         """
         Builds a complete non-escaped frame from the given frame specific data.
@@ -337,9 +425,22 @@ class XBeePacket:
             Bytearray: the complete frame as bytearray.
         """
         frame = utils.int_to_length(len(frame_spec_data)) + frame_spec_data
-        frame.append(self.get_checksum())
+        frame.append(self.__compute_checksum(frame_spec_data))
         return frame
 
+    @staticmethod
+    def __compute_checksum(frame_spec_data):
+        """
+        Computes the checksum of the given frame specific data.
+
+        Args:
+            frame_spec_data (Bytearray): the frame specific data.
+
+        Returns:
+            Integer: the checksum value.
+        """
+        return 0xFF - (sum(frame_spec_data) & 0xFF)
+
 
 class XBeeAPIPacket(XBeePacket):
     """
@@ -377,6 +478,23 @@ class XBeeAPIPacket(XBeePacket):
             self._frame_type_value = api_frame_type
         self._frame_id = 0
 
+    def __eq__(self, other):
+        """
+        Override method.
+
+        Packets of different frame types are not equal, this is checked
+        before comparing their serialized data.
+
+        .. seealso::
+           | :meth:`.XBeePacket.__eq__`
+        """
+        if (isinstance(other, XBeeAPIPacket)
+                and other.get_frame_type_value() != self._frame_type_value):
+            return False
+        return super().__eq__(other)
+
+    __hash__ = XBeePacket.__hash__
+
     def get_frame_spec_data(self):
         """
         Override method.
@@ -326,6 +326,8 @@ class TXSMSPacket(XBeeAPIPacket):
         Returns:
             Bytearray: packet's data.
         """
+        if isinstance(self.__data, bytearray):
+            return self.__data.copy()
         return self.__data
 
     @data.setter
@@ -168,6 +168,8 @@ class ATCommPacket(XBeeAPIPacket):
         Returns:
             Bytearray: the parameter of the packet.
         """
+        if isinstance(self.__parameter, bytearray):
+            return self.__parameter.copy()
         return self.__parameter
 
     @parameter.setter
@@ -330,6 +332,8 @@ class ATCommQueuePacket(XBeeAPIPacket):
         Returns:
             Bytearray: the parameter of the packet.
         """
+        if isinstance(self.__parameter, bytearray):
+            return self.__parameter.copy()
         return self.__parameter
 
     @parameter.setter
@@ -512,6 +516,8 @@ class ATCommResponsePacket(XBeeAPIPacket):
         Returns:
             Bytearray: the AT command response value.
         """
+        if isinstance(self.__comm_value, bytearray):
+            return self.__comm_value.copy()
         return self.__comm_value
 
     @command_value.setter
@@ -619,12 +625,21 @@ class ReceivePacket(XBeeAPIPacket):
         self.__x16bit_addr = x16bit_addr
         self.__receive_options = receive_options
         self.__rf_data = rf_data
+        self.__raw = None
 
     @staticmethod
-    def create_packet(raw, operating_mode):
+    def create_packet(raw, operating_mode, lazy=False):
         """
         Override method.
 
+        Args:
+            raw (Bytearray): bytearray with which the frame will be built.
+            operating_mode (:class:`.OperatingMode`): The mode in which the
+                frame was captured.
+            lazy (Boolean, optional, default=`False`): `True` to keep the
+                raw data and decode the source addresses and the RF data
+                on first access, `False` to decode them now.
+
         Returns:
             :class:`.ATCommResponsePacket`
 
@@ -654,11 +669,42 @@ class ReceivePacket(XBeeAPIPacket):
 
         if raw[3] != ApiFrameType.RECEIVE_PACKET.code:
             raise InvalidPacketException(message="This packet is not a receive packet.")
+
+        if lazy:
+            packet = ReceivePacket(None, None, raw[14])
+            packet.__raw = memoryview(raw)
+            return packet
+
         return ReceivePacket(XBee64BitAddress(raw[4:12]),
                              XBee16BitAddress(raw[12:14]),
                              raw[14],
                              rf_data=raw[15:-1] if len(raw) > ReceivePacket.__MIN_PACKET_LENGTH else None)
 
+    def __get_rf_data(self):
+        """
+        Returns the received RF data without copying it, decoding it from the
+        raw data if the packet was lazily built.
+
+        Returns:
+            Bytearray: the received RF data.
+        """
+        if (self.__rf_data is None and self.__raw is not None
+                and len(self.__raw) > ReceivePacket.__MIN_PACKET_LENGTH):
+            self.__rf_data = bytearray(self.__raw[15:-1])
+        return self.__rf_data
+
+    def __decode(self):
+        """
+        Decodes the fields not accessed yet of a lazily built packet and
+        releases its raw data.
+        """
+        if self.__raw is None:
+            return
+        self.__x64bit_addr = self.x64bit_source_addr
+        self.__x16bit_addr = self.x16bit_source_addr
+        self.__get_rf_data()
+        self.__raw = None
+
     def needs_id(self):
         """
         Override method.
@@ -684,11 +730,12 @@ class ReceivePacket(XBeeAPIPacket):
         .. seealso::
            | :meth:`.XBeeAPIPacket._get_api_packet_spec_data`
         """
-        ret = self.__x64bit_addr.address
-        ret += self.__x16bit_addr.address
+        ret = self.x64bit_source_addr.address
+        ret += self.x16bit_source_addr.address
         ret.append(self.__receive_options)
-        if self.__rf_data is not None:
-            return ret + self.__rf_data
+        rf_data = self.__get_rf_data()
+        if rf_data is not None:
+            return ret + rf_data
         return ret
 
     def _get_api_packet_spec_data_dict(self):
@@ -698,10 +745,10 @@ class ReceivePacket(XBeeAPIPacket):
         .. seealso::
            | :meth:`.XBeeAPIPacket._get_api_packet_spec_data_dict`
         """
-        return {DictKeys.X64BIT_ADDR:     self.__x64bit_addr.address,
-                DictKeys.X16BIT_ADDR:     self.__x16bit_addr.address,
+        return {DictKeys.X64BIT_ADDR:     self.x64bit_source_addr.address,
+                DictKeys.X16BIT_ADDR:     self.x16bit_source_addr.address,
                 DictKeys.RECEIVE_OPTIONS: self.__receive_options,
-                DictKeys.RF_DATA:         list(self.__rf_data) if self.__rf_data is not None else None}
+                DictKeys.RF_DATA:         list(self.__get_rf_data()) if self.__get_rf_data() is not None else None}
 
     @property
     def x64bit_source_addr(self):
@@ -714,6 +761,8 @@ class ReceivePacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee64BitAddress`
         """
+        if self.__x64bit_addr is None and self.__raw is not None:
+            self.__x64bit_addr = XBee64BitAddress(self.__raw[4:12])
         return self.__x64bit_addr
 
     @x64bit_source_addr.setter
@@ -727,6 +776,7 @@ class ReceivePacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee64BitAddress`
         """
+        self.__decode()
         self.__x64bit_addr = x64bit_addr
 
     @property
@@ -740,6 +790,8 @@ class ReceivePacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee16BitAddress`
         """
+        if self.__x16bit_addr is None and self.__raw is not None:
+            self.__x16bit_addr = XBee16BitAddress(bytearray(self.__raw[12:14]))
         return self.__x16bit_addr
 
     @x16bit_source_addr.setter
@@ -753,6 +805,7 @@ class ReceivePacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee16BitAddress`
         """
+        self.__decode()
         self.__x16bit_addr = x16bit_addr
 
     @property
@@ -789,9 +842,10 @@ class ReceivePacket(XBeeAPIPacket):
         Returns:
             Bytearray: the received RF data.
         """
-        if self.__rf_data is None:
+        rf_data = self.__get_rf_data()
+        if rf_data is None:
             return None
-        return self.__rf_data.copy()
+        return rf_data.copy()
 
     @rf_data.setter
     def rf_data(self, rf_data):
@@ -801,6 +855,7 @@ class ReceivePacket(XBeeAPIPacket):
         Args:
             rf_data (Bytearray): the new received RF data.
         """
+        self.__decode()
         if rf_data is None:
             self.__rf_data = None
         else:
@@ -1027,6 +1082,8 @@ class RemoteATCommandPacket(XBeeAPIPacket):
         Returns:
             Bytearray: the AT command parameter.
         """
+        if isinstance(self.__parameter, bytearray):
+            return self.__parameter.copy()
         return self.__parameter
 
     @parameter.setter
@@ -1234,6 +1291,8 @@ class RemoteATCommandResponsePacket(XBeeAPIPacket):
         Returns:
             Bytearray: the AT command response value.
         """
+        if isinstance(self.__comm_value, bytearray):
+            return self.__comm_value.copy()
         return self.__comm_value
 
     @command_value.setter
@@ -2018,12 +2077,21 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         self.__receive_options = receive_options
         self.__rf_data = rf_data
         self.__io_sample = IOSample(rf_data) if rf_data is not None and len(rf_data) >= 5 else None
+        self.__raw = None
 
     @staticmethod
-    def create_packet(raw, operating_mode):
+    def create_packet(raw, operating_mode, lazy=False):
         """
         Override method.
 
+        Args:
+            raw (Bytearray): bytearray with which the frame will be built.
+            operating_mode (:class:`.OperatingMode`): The mode in which the
+                frame was captured.
+            lazy (Boolean, optional, default=`False`): `True` to keep the
+                raw data and decode the source addresses and the RF data
+                on first access, `False` to decode them now.
+
         Returns:
             :class:`.IODataSampleRxIndicatorPacket`.
 
@@ -2054,10 +2122,41 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         if raw[3] != ApiFrameType.IO_DATA_SAMPLE_RX_INDICATOR.code:
             raise InvalidPacketException(message="This packet is not an IO data sample RX indicator packet.")
 
+        if lazy:
+            packet = IODataSampleRxIndicatorPacket(None, None, raw[14])
+            packet.__raw = memoryview(raw)
+            return packet
+
         return IODataSampleRxIndicatorPacket(
             XBee64BitAddress(raw[4:12]), XBee16BitAddress(raw[12:14]),
             raw[14], rf_data=raw[15:-1])
 
+    def __get_rf_data(self):
+        """
+        Returns the received RF data without copying it, decoding it from the
+        raw data if the packet was lazily built.
+
+        Returns:
+            Bytearray: the received RF data.
+        """
+        if (self.__rf_data is None and self.__raw is not None
+                and len(self.__raw) > IODataSampleRxIndicatorPacket.__MIN_PACKET_LENGTH - 1):
+            self.__rf_data = bytearray(self.__raw[15:-1])
+        return self.__rf_data
+
+    def __decode(self):
+        """
+        Decodes the fields not accessed yet of a lazily built packet and
+        releases its raw data.
+        """
+        if self.__raw is None:
+            return
+        self.__x64bit_addr = self.x64bit_source_addr
+        self.__x16bit_addr = self.x16bit_source_addr
+        self.__get_rf_data()
+        self.__io_sample = self.io_sample
+        self.__raw = None
+
     def needs_id(self):
         """
         Override method.
@@ -2074,11 +2173,12 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :meth:`.XBeeAPIPacket._get_api_packet_spec_data`
         """
-        ret = self.__x64bit_addr.address
-        ret += self.__x16bit_addr.address
+        ret = self.x64bit_source_addr.address
+        ret += self.x16bit_source_addr.address
         ret.append(self.__receive_options)
-        if self.__rf_data is not None:
-            ret += self.__rf_data
+        rf_data = self.__get_rf_data()
+        if rf_data is not None:
+            ret += rf_data
         return ret
 
     def _get_api_packet_spec_data_dict(self):
@@ -2088,33 +2188,34 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :meth:`.XBeeAPIPacket._get_api_packet_spec_data_dict`
         """
-        base = {DictKeys.X64BIT_ADDR: self.__x64bit_addr.address,
-                DictKeys.X16BIT_ADDR: self.__x16bit_addr.address,
+        base = {DictKeys.X64BIT_ADDR: self.x64bit_source_addr.address,
+                DictKeys.X16BIT_ADDR: self.x16bit_source_addr.address,
                 DictKeys.RECEIVE_OPTIONS: self.__receive_options}
+        io_sample = self.io_sample
 
-        if self.__io_sample is not None:
+        if io_sample is not None:
             base[DictKeys.NUM_SAMPLES] = 1
-            base[DictKeys.DIGITAL_MASK] = self.__io_sample.digital_mask
-            base[DictKeys.ANALOG_MASK] = self.__io_sample.analog_mask
+            base[DictKeys.DIGITAL_MASK] = io_sample.digital_mask
+            base[DictKeys.ANALOG_MASK] = io_sample.analog_mask
 
             # Digital values
             for i in range(16):
-                if self.__io_sample.has_digital_value(IOLine.get(i)):
+                if io_sample.has_digital_value(IOLine.get(i)):
                     base[IOLine.get(i).description + " digital value"] = \
-                        self.__io_sample.get_digital_value(IOLine.get(i)).name
+                        io_sample.get_digital_value(IOLine.get(i)).name
 
             # Analog values
             for i in range(6):
-                if self.__io_sample.has_analog_value(IOLine.get(i)):
+                if io_sample.has_analog_value(IOLine.get(i)):
                     base[IOLine.get(i).description + " analog value"] = \
-                        self.__io_sample.get_analog_value(IOLine.get(i))
+                        io_sample.get_analog_value(IOLine.get(i))
 
             # Power supply
-            if self.__io_sample.has_power_supply_value():
-                base["Power supply value "] = "%02X" % self.__io_sample.power_supply_value
+            if io_sample.has_power_supply_value():
+                base["Power supply value "] = "%02X" % io_sample.power_supply_value
 
-        elif self.__rf_data is not None:
-            base[DictKeys.RF_DATA] = utils.hex_to_string(self.__rf_data)
+        elif self.__get_rf_data() is not None:
+            base[DictKeys.RF_DATA] = utils.hex_to_string(self.__get_rf_data())
 
         return base
 
@@ -2138,6 +2239,8 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee64BitAddress`
         """
+        if self.__x64bit_addr is None and self.__raw is not None:
+            self.__x64bit_addr = XBee64BitAddress(self.__raw[4:12])
         return self.__x64bit_addr
 
     @x64bit_source_addr.setter
@@ -2151,6 +2254,7 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee64BitAddress`
         """
+        self.__decode()
         self.__x64bit_addr = x64bit_addr
 
     @property
@@ -2164,6 +2268,8 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee16BitAddress`
         """
+        if self.__x16bit_addr is None and self.__raw is not None:
+            self.__x16bit_addr = XBee16BitAddress(bytearray(self.__raw[12:14]))
         return self.__x16bit_addr
 
     @x16bit_source_addr.setter
@@ -2177,6 +2283,7 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee16BitAddress`
         """
+        self.__decode()
         self.__x16bit_addr = x16bit_addr
 
     @property
@@ -2213,9 +2320,10 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         Returns:
             Bytearray: the received RF data.
         """
-        if self.__rf_data is None:
+        rf_data = self.__get_rf_data()
+        if rf_data is None:
             return None
-        return self.__rf_data.copy()
+        return rf_data.copy()
 
     @rf_data.setter
     def rf_data(self, rf_data):
@@ -2225,6 +2333,7 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         Args:
             rf_data (Bytearray): the new received RF data.
         """
+        self.__decode()
         if rf_data is None:
             self.__rf_data = None
         else:
@@ -2249,6 +2358,10 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.IOSample`
         """
+        if self.__io_sample is None and self.__raw is not None:
+            rf_data = self.__get_rf_data()
+            if rf_data is not None and len(rf_data) >= 5:
+                self.__io_sample = IOSample(rf_data)
         return self.__io_sample
 
     @io_sample.setter
@@ -2262,6 +2375,7 @@ class IODataSampleRxIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.IOSample`
         """
+        self.__decode()
         self.__io_sample = io_sample
 
 
@@ -2729,12 +2843,21 @@ class ExplicitRXIndicatorPacket(XBeeAPIPacket):
         self.__profile_id = profile_id
         self.__receive_options = receive_options
         self.__rf_data = rf_data
+        self.__raw = None
 
     @staticmethod
-    def create_packet(raw, operating_mode):
+    def create_packet(raw, operating_mode, lazy=False):
         """
         Override method.
 
+        Args:
+            raw (Bytearray): bytearray with which the frame will be built.
+            operating_mode (:class:`.OperatingMode`): The mode in which the
+                frame was captured.
+            lazy (Boolean, optional, default=`False`): `True` to keep the
+                raw data and decode the source addresses and the RF data
+                on first access, `False` to decode them now.
+
         Returns:
             :class:`.ExplicitRXIndicatorPacket`.
 
@@ -2767,11 +2890,43 @@ class ExplicitRXIndicatorPacket(XBeeAPIPacket):
         if raw[3] != ApiFrameType.EXPLICIT_RX_INDICATOR.code:
             raise InvalidPacketException(message="This packet is not an explicit RX indicator packet.")
 
+        if lazy:
+            packet = ExplicitRXIndicatorPacket(
+                None, None, raw[14], raw[15], utils.bytes_to_int(raw[16:18]),
+                utils.bytes_to_int(raw[18:20]), raw[20])
+            packet.__raw = memoryview(raw)
+            return packet
+
         return ExplicitRXIndicatorPacket(
             XBee64BitAddress(raw[4:12]), XBee16BitAddress(raw[12:14]), raw[14], raw[15],
             utils.bytes_to_int(raw[16:18]), utils.bytes_to_int(raw[18:20]), raw[20],
             rf_data=raw[21:-1] if len(raw) > ExplicitRXIndicatorPacket.__MIN_PACKET_LENGTH else None)
 
+    def __get_rf_data(self):
+        """
+        Returns the received RF data without copying it, decoding it from the
+        raw data if the packet was lazily built.
+
+        Returns:
+            Bytearray: the received RF data.
+        """
+        if (self.__rf_data is None and self.__raw is not None
+                and len(self.__raw) > ExplicitRXIndicatorPacket.__MIN_PACKET_LENGTH):
+            self.__rf_data = bytearray(self.__raw[21:-1])
+        return self.__rf_data
+
+    def __decode(self):
+        """
+        Decodes the fields not accessed yet of a lazily built packet and
+        releases its raw data.
+        """
+        if self.__raw is None:
+            return
+        self.__x64bit_addr = self.x64bit_source_addr
+        self.__x16bit_addr = self.x16bit_source_addr
+        self.__get_rf_data()
+        self.__raw = None
+
     def needs_id(self):
         """
         Override method.
@@ -2797,15 +2952,16 @@ class ExplicitRXIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :meth:`.XBeeAPIPacket._get_api_packet_spec_data`
         """
-        raw = self.__x64bit_addr.address
-        raw += self.__x16bit_addr.address
+        raw = self.x64bit_source_addr.address
+        raw += self.x16bit_source_addr.address
         raw.append(self.__source_endpoint)
         raw.append(self.__dest_endpoint)
         raw += utils.int_to_bytes(self.__cluster_id, num_bytes=2)
         raw += utils.int_to_bytes(self.__profile_id, num_bytes=2)
         raw.append(self.__receive_options)
-        if self.__rf_data is not None:
-            raw += self.__rf_data
+        rf_data = self.__get_rf_data()
+        if rf_data is not None:
+            raw += rf_data
         return raw
 
     def _get_api_packet_spec_data_dict(self):
@@ -2815,14 +2971,14 @@ class ExplicitRXIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :meth:`.XBeeAPIPacket._get_api_packet_spec_data_dict`
         """
-        return {DictKeys.X64BIT_ADDR:     self.__x64bit_addr.address,
-                DictKeys.X16BIT_ADDR:     self.__x16bit_addr.address,
+        return {DictKeys.X64BIT_ADDR:     self.x64bit_source_addr.address,
+                DictKeys.X16BIT_ADDR:     self.x16bit_source_addr.address,
                 DictKeys.SOURCE_ENDPOINT: self.__source_endpoint,
                 DictKeys.DEST_ENDPOINT:   self.__dest_endpoint,
                 DictKeys.CLUSTER_ID:      self.__cluster_id,
                 DictKeys.PROFILE_ID:      self.__profile_id,
                 DictKeys.RECEIVE_OPTIONS: self.__receive_options,
-                DictKeys.RF_DATA:         self.__rf_data}
+                DictKeys.RF_DATA:         self.__get_rf_data()}
 
     @property
     def x64bit_source_addr(self):
@@ -2835,6 +2991,8 @@ class ExplicitRXIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee64BitAddress`
         """
+        if self.__x64bit_addr is None and self.__raw is not None:
+            self.__x64bit_addr = XBee64BitAddress(self.__raw[4:12])
         return self.__x64bit_addr
 
     @x64bit_source_addr.setter
@@ -2848,6 +3006,7 @@ class ExplicitRXIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee64BitAddress`
         """
+        self.__decode()
         self.__x64bit_addr = x64bit_addr
 
     @property
@@ -2861,6 +3020,8 @@ class ExplicitRXIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee16BitAddress`
         """
+        if self.__x16bit_addr is None and self.__raw is not None:
+            self.__x16bit_addr = XBee16BitAddress(bytearray(self.__raw[12:14]))
         return self.__x16bit_addr
 
     @x16bit_source_addr.setter
@@ -2874,6 +3035,7 @@ class ExplicitRXIndicatorPacket(XBeeAPIPacket):
         .. seealso::
            | :class:`.XBee16BitAddress`
         """
+        self.__decode()
         self.__x16bit_addr = x16bit_addr
 
     @property
@@ -2990,9 +3152,10 @@ class ExplicitRXIndicatorPacket(XBeeAPIPacket):
         Returns:
             Bytearray: the received RF data.
         """
-        if self.__rf_data is None:
+        rf_data = self.__get_rf_data()
+        if rf_data is None:
             return None
-        return self.__rf_data.copy()
+        return rf_data.copy()
 
     @rf_data.setter
     def rf_data(self, rf_data):
@@ -3002,6 +3165,7 @@ class ExplicitRXIndicatorPacket(XBeeAPIPacket):
         Args:
             rf_data (Bytearray): the new received RF data.
         """
+        self.__decode()
         if rf_data is None:
             self.__rf_data = None
         else:
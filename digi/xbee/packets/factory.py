@@ -124,199 +124,180 @@ from digi.xbee.packets.zigbee import RegisterJoiningDevicePacket,\
     RegisterDeviceStatusPacket, RouteRecordIndicatorPacket, OTAFirmwareUpdateStatusPacket
 
 
-def build_frame(packet_bytearray, operating_mode=OperatingMode.API_MODE):
-    """
-    Creates a packet from raw data.
-
-    Args:
-        packet_bytearray (Bytearray): the raw data of the packet to build.
-        operating_mode (:class:`.OperatingMode`): the operating mode in which
-            the raw data has been captured.
-
-    .. seealso::
-       | :class:`.OperatingMode`
-    """
-    if len(packet_bytearray) < 5:
-        raise InvalidPacketException(
-            message="Bytearray must have, at least, 5 bytes (header, length, "
-                    "frameType, checksum)")
-
-    frame_type = ApiFrameType.get(packet_bytearray[3])
-
-    if frame_type == ApiFrameType.GENERIC:
-        return GenericXBeePacket.create_packet(packet_bytearray,
-                                               operating_mode=operating_mode)
-
-    if frame_type == ApiFrameType.AT_COMMAND:
-        return ATCommPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.AT_COMMAND_QUEUE:
-        return ATCommQueuePacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.AT_COMMAND_RESPONSE:
-        return ATCommResponsePacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.RECEIVE_PACKET:
-        return ReceivePacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.RX_64:
-        return RX64Packet.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.RX_16:
-        return RX16Packet.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.REMOTE_AT_COMMAND_REQUEST:
-        return RemoteATCommandPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.REMOTE_AT_COMMAND_RESPONSE:
-        return RemoteATCommandResponsePacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.TRANSMIT_REQUEST:
-        return TransmitPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.TRANSMIT_STATUS:
-        return TransmitStatusPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.MODEM_STATUS:
-        return ModemStatusPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.TX_STATUS:
-        return TXStatusPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.RX_IO_16:
-        return RX16IOPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.RX_IO_64:
-        return RX64IOPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.IO_DATA_SAMPLE_RX_INDICATOR:
-        return IODataSampleRxIndicatorPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.EXPLICIT_ADDRESSING:
-        return ExplicitAddressingPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.EXPLICIT_RX_INDICATOR:
-        return ExplicitRXIndicatorPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.TX_SMS:
-        return TXSMSPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.TX_IPV4:
-        return TXIPv4Packet.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.RX_SMS:
-        return RXSMSPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.USER_DATA_RELAY_OUTPUT:
-        return UserDataRelayOutputPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.RX_IPV4:
-        return RXIPv4Packet.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.REMOTE_AT_COMMAND_REQUEST_WIFI:
-        return RemoteATCommandWifiPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.SEND_DATA_REQUEST:
-        return SendDataRequestPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.DEVICE_RESPONSE:
-        return DeviceResponsePacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.USER_DATA_RELAY_REQUEST:
-        return UserDataRelayPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.REMOTE_AT_COMMAND_RESPONSE_WIFI:
-        return RemoteATCommandResponseWifiPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.IO_DATA_SAMPLE_RX_INDICATOR_WIFI:
-        return IODataSampleRxIndicatorWifiPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.SEND_DATA_RESPONSE:
-        return SendDataResponsePacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.DEVICE_REQUEST:
-        return DeviceRequestPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.DEVICE_RESPONSE_STATUS:
-        return DeviceResponseStatusPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.FRAME_ERROR:
-        return FrameErrorPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.REGISTER_JOINING_DEVICE:
-        return RegisterJoiningDevicePacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.REGISTER_JOINING_DEVICE_STATUS:
-        return RegisterDeviceStatusPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.ROUTE_RECORD_INDICATOR:
-        return RouteRecordIndicatorPacket.create_packet(packet_bytearray, operating_mode)
-
-    if frame_type == ApiFrameType.SOCKET_CREATE:
-        return SocketCreatePacket.create_packet(packet_bytearray, operating_mode)
+_FRAME_PARSERS = {
+    ApiFrameType.GENERIC.code: GenericXBeePacket.create_packet,
+    ApiFrameType.AT_COMMAND.code: ATCommPacket.create_packet,
+    ApiFrameType.AT_COMMAND_QUEUE.code: ATCommQueuePacket.create_packet,
+    ApiFrameType.AT_COMMAND_RESPONSE.code: ATCommResponsePacket.create_packet,
+    ApiFrameType.RECEIVE_PACKET.code: ReceivePacket.create_packet,
+    ApiFrameType.RX_64.code: RX64Packet.create_packet,
+    ApiFrameType.RX_16.code: RX16Packet.create_packet,
+    ApiFrameType.REMOTE_AT_COMMAND_REQUEST.code: RemoteATCommandPacket.create_packet,
+    ApiFrameType.REMOTE_AT_COMMAND_RESPONSE.code: RemoteATCommandResponsePacket.create_packet,
+    ApiFrameType.TRANSMIT_REQUEST.code: TransmitPacket.create_packet,
+    ApiFrameType.TRANSMIT_STATUS.code: TransmitStatusPacket.create_packet,
+    ApiFrameType.MODEM_STATUS.code: ModemStatusPacket.create_packet,
+    ApiFrameType.TX_STATUS.code: TXStatusPacket.create_packet,
+    ApiFrameType.RX_IO_16.code: RX16IOPacket.create_packet,
+    ApiFrameType.RX_IO_64.code: RX64IOPacket.create_packet,
+    ApiFrameType.IO_DATA_SAMPLE_RX_INDICATOR.code: IODataSampleRxIndicatorPacket.create_packet,
+    ApiFrameType.EXPLICIT_ADDRESSING.code: ExplicitAddressingPacket.create_packet,
+    ApiFrameType.EXPLICIT_RX_INDICATOR.code: ExplicitRXIndicatorPacket.create_packet,
+    ApiFrameType.TX_SMS.code: TXSMSPacket.create_packet,
+    ApiFrameType.TX_IPV4.code: TXIPv4Packet.create_packet,
+    ApiFrameType.RX_SMS.code: RXSMSPacket.create_packet,
+    ApiFrameType.USER_DATA_RELAY_OUTPUT.code: UserDataRelayOutputPacket.create_packet,
+    ApiFrameType.RX_IPV4.code: RXIPv4Packet.create_packet,
+    ApiFrameType.REMOTE_AT_COMMAND_REQUEST_WIFI.code: RemoteATCommandWifiPacket.create_packet,
+    ApiFrameType.SEND_DATA_REQUEST.code: SendDataRequestPacket.create_packet,
+    ApiFrameType.DEVICE_RESPONSE.code: DeviceResponsePacket.create_packet,
+    ApiFrameType.USER_DATA_RELAY_REQUEST.code: UserDataRelayPacket.create_packet,
+    ApiFrameType.REMOTE_AT_COMMAND_RESPONSE_WIFI.code: RemoteATCommandResponseWifiPacket.create_packet,
+    ApiFrameType.IO_DATA_SAMPLE_RX_INDICATOR_WIFI.code: IODataSampleRxIndicatorWifiPacket.create_packet,
+    ApiFrameType.SEND_DATA_RESPONSE.code: SendDataResponsePacket.create_packet,
+    ApiFrameType.DEVICE_REQUEST.code: DeviceRequestPacket.create_packet,
+    ApiFrameType.DEVICE_RESPONSE_STATUS.code: DeviceResponseStatusPacket.create_packet,
+    ApiFrameType.FRAME_ERROR.code: FrameErrorPacket.create_packet,
+    ApiFrameType.REGISTER_JOINING_DEVICE.code: RegisterJoiningDevicePacket.create_packet,
+    ApiFrameType.REGISTER_JOINING_DEVICE_STATUS.code: RegisterDeviceStatusPacket.create_packet,
+    ApiFrameType.ROUTE_RECORD_INDICATOR.code: RouteRecordIndicatorPacket.create_packet,
+    ApiFrameType.SOCKET_CREATE.code: SocketCreatePacket.create_packet,
+    ApiFrameType.SOCKET_CREATE_RESPONSE.code: SocketCreateResponsePacket.create_packet,
+    ApiFrameType.SOCKET_OPTION_REQUEST.code: SocketOptionRequestPacket.create_packet,
+    ApiFrameType.SOCKET_OPTION_RESPONSE.code: SocketOptionResponsePacket.create_packet,
+    ApiFrameType.SOCKET_CONNECT.code: SocketConnectPacket.create_packet,
+    ApiFrameType.SOCKET_CONNECT_RESPONSE.code: SocketConnectResponsePacket.create_packet,
+    ApiFrameType.SOCKET_CLOSE.code: SocketClosePacket.create_packet,
+    ApiFrameType.SOCKET_CLOSE_RESPONSE.code: SocketCloseResponsePacket.create_packet,
+    ApiFrameType.SOCKET_SEND.code: SocketSendPacket.create_packet,
+    ApiFrameType.SOCKET_SENDTO.code: SocketSendToPacket.create_packet,
+    ApiFrameType.SOCKET_BIND.code: SocketBindListenPacket.create_packet,
+    ApiFrameType.SOCKET_LISTEN_RESPONSE.code: SocketListenResponsePacket.create_packet,
+    ApiFrameType.SOCKET_NEW_IPV4_CLIENT.code: SocketNewIPv4ClientPacket.create_packet,
+    ApiFrameType.SOCKET_RECEIVE.code: SocketReceivePacket.create_packet,
+    ApiFrameType.SOCKET_RECEIVE_FROM.code: SocketReceiveFromPacket.create_packet,
+    ApiFrameType.SOCKET_STATE.code: SocketStatePacket.create_packet,
+    ApiFrameType.DIGIMESH_ROUTE_INFORMATION.code: RouteInformationPacket.create_packet,
+    ApiFrameType.FILE_SYSTEM_REQUEST.code: FSRequestPacket.create_packet,
+    ApiFrameType.FILE_SYSTEM_RESPONSE.code: FSResponsePacket.create_packet,
+    ApiFrameType.REMOTE_FILE_SYSTEM_REQUEST.code: RemoteFSRequestPacket.create_packet,
+    ApiFrameType.REMOTE_FILE_SYSTEM_RESPONSE.code: RemoteFSResponsePacket.create_packet,
+    ApiFrameType.OTA_FIRMWARE_UPDATE_STATUS.code: OTAFirmwareUpdateStatusPacket.create_packet,
+}
+"""
+Parsers indexed by frame type code. Each parser is a callable that receives
+the raw frame and the operating mode and returns the built packet.
+"""
 
-    if frame_type == ApiFrameType.SOCKET_CREATE_RESPONSE:
-        return SocketCreateResponsePacket.create_packet(packet_bytearray, operating_mode)
+_LAZY_FRAME_PARSERS = {
+    ApiFrameType.RECEIVE_PACKET.code: ReceivePacket.create_packet,
+    ApiFrameType.IO_DATA_SAMPLE_RX_INDICATOR.code: IODataSampleRxIndicatorPacket.create_packet,
+    ApiFrameType.EXPLICIT_RX_INDICATOR.code: ExplicitRXIndicatorPacket.create_packet,
+}
+"""
+Parsers, indexed by frame type code, able to build packets that decode their
+fields on first access. They receive the `lazy` keyword argument.
+"""
 
-    if frame_type == ApiFrameType.SOCKET_OPTION_REQUEST:
-        return SocketOptionRequestPacket.create_packet(packet_bytearray, operating_mode)
 
-    if frame_type == ApiFrameType.SOCKET_OPTION_RESPONSE:
-        return SocketOptionResponsePacket.create_packet(packet_bytearray, operating_mode)
+def register_frame_parser(frame_type, parser):
+    """
+    Registers the parser to use to build packets of the given frame type. If
+    there is already a parser for that frame type, it is replaced.
 
-    if frame_type == ApiFrameType.SOCKET_CONNECT:
-        return SocketConnectPacket.create_packet(packet_bytearray, operating_mode)
+    Args:
+        frame_type (:class:`.ApiFrameType` or Integer): The frame type or its
+            code.
+        parser (Function): Callable that receives the raw data of the packet
+            (Bytearray) and the operating mode (:class:`.OperatingMode`) in
+            which it was captured, and returns an :class:`.XBeePacket`. For
+            example, the `create_packet` method of an :class:`.XBeePacket`
+            subclass.
+
+    Raises:
+        ValueError: If `frame_type` is not a valid frame type code or `parser`
+            is not callable.
+    """
+    code = frame_type.code if isinstance(frame_type, ApiFrameType) else frame_type
+    if not isinstance(code, int) or not 0 <= code <= 0xFF:
+        raise ValueError("Frame type must be a value between 0 and 255")
+    if not callable(parser):
+        raise ValueError("Parser must be callable")
 
-    if frame_type == ApiFrameType.SOCKET_CONNECT_RESPONSE:
-        return SocketConnectResponsePacket.create_packet(packet_bytearray, operating_mode)
+    _FRAME_PARSERS[code] = parser
+    _LAZY_FRAME_PARSERS.pop(code, None)
 
-    if frame_type == ApiFrameType.SOCKET_CLOSE:
-        return SocketClosePacket.create_packet(packet_bytearray, operating_mode)
 
-    if frame_type == ApiFrameType.SOCKET_CLOSE_RESPONSE:
-        return SocketCloseResponsePacket.create_packet(packet_bytearray, operating_mode)
+def unregister_frame_parser(frame_type):
+    """
+    Removes the parser of the given frame type. Packets of that type are built
+    as :class:`.UnknownXBeePacket` from then on.
 
-    if frame_type == ApiFrameType.SOCKET_SEND:
-        return SocketSendPacket.create_packet(packet_bytearray, operating_mode)
+    Args:
+        frame_type (:class:`.ApiFrameType` or Integer): The frame type or its
+            code.
 
-    if frame_type == ApiFrameType.SOCKET_SENDTO:
-        return SocketSendToPacket.create_packet(packet_bytearray, operating_mode)
+    Returns:
+        Function: The removed parser, `None` if there was no parser for the
+            given frame type.
+    """
+    code = frame_type.code if isinstance(frame_type, ApiFrameType) else frame_type
+    _LAZY_FRAME_PARSERS.pop(code, None)
+    return _FRAME_PARSERS.pop(code, None)
 
-    if frame_type == ApiFrameType.SOCKET_BIND:
-        return SocketBindListenPacket.create_packet(packet_bytearray, operating_mode)
 
-    if frame_type == ApiFrameType.SOCKET_LISTEN_RESPONSE:
-        return SocketListenResponsePacket.create_packet(packet_bytearray, operating_mode)
+def get_frame_parser(frame_type):
+    """
+    Returns the parser used to build packets of the given frame type.
 
-    if frame_type == ApiFrameType.SOCKET_NEW_IPV4_CLIENT:
-        return SocketNewIPv4ClientPacket.create_packet(packet_bytearray, operating_mode)
+    Args:
+        frame_type (:class:`.ApiFrameType` or Integer): The frame type or its
+            code.
 
-    if frame_type == ApiFrameType.SOCKET_RECEIVE:
-        return SocketReceivePacket.create_packet(packet_bytearray, operating_mode)
+    Returns:
+        Function: The parser, `None` if there is no parser for the given frame
+            type.
+    """
+    code = frame_type.code if isinstance(frame_type, ApiFrameType) else frame_type
+    return _FRAME_PARSERS.get(code)
 
-    if frame_type == ApiFrameType.SOCKET_RECEIVE_FROM:
-        return SocketReceiveFromPacket.create_packet(packet_bytearray, operating_mode)
 
-    if frame_type == ApiFrameType.SOCKET_STATE:
-        return SocketStatePacket.create_packet(packet_bytearray, operating_mode)
+def build_frame(packet_bytearray, operating_mode=OperatingMode.API_MODE, lazy=False):
+    """
+    Creates a packet from raw data.
 
-    if frame_type == ApiFrameType.DIGIMESH_ROUTE_INFORMATION:
-        return RouteInformationPacket.create_packet(packet_bytearray, operating_mode)
+    The packet is built using the parser registered for its frame type (see
+    :meth:`.register_frame_parser`). If there is no parser for the frame type,
+    an :class:`.UnknownXBeePacket` is returned.
 
-    if frame_type == ApiFrameType.FILE_SYSTEM_REQUEST:
-        return FSRequestPacket.create_packet(packet_bytearray, operating_mode)
+    In lazy mode, receive packets (:class:`.ReceivePacket`,
+    :class:`.ExplicitRXIndicatorPacket` and
+    :class:`.IODataSampleRxIndicatorPacket`) keep a view of `packet_bytearray`
+    and decode their addresses, RF data and IO sample on first access, so
+    `packet_bytearray` must not be modified afterwards.
 
-    if frame_type == ApiFrameType.FILE_SYSTEM_RESPONSE:
-        return FSResponsePacket.create_packet(packet_bytearray, operating_mode)
+    Args:
+        packet_bytearray (Bytearray): the raw data of the packet to build.
+        operating_mode (:class:`.OperatingMode`): the operating mode in which
+            the raw data has been captured.
+        lazy (Boolean, optional, default=`False`): `True` to build packets
+            that decode their fields on first access, `False` otherwise.
 
-    if frame_type == ApiFrameType.REMOTE_FILE_SYSTEM_REQUEST:
-        return RemoteFSRequestPacket.create_packet(packet_bytearray, operating_mode)
+    .. seealso::
+       | :class:`.OperatingMode`
+    """
+    if len(packet_bytearray) < 5:
+        raise InvalidPacketException(
+            message="Bytearray must have, at least, 5 bytes (header, length, "
+                    "frameType, checksum)")
 
-    if frame_type == ApiFrameType.REMOTE_FILE_SYSTEM_RESPONSE:
-        return RemoteFSResponsePacket.create_packet(packet_bytearray, operating_mode)
+    if lazy:
+        parser = _LAZY_FRAME_PARSERS.get(packet_bytearray[3])
+        if parser is not None:
+            return parser(packet_bytearray, operating_mode, lazy=True)
 
-    if frame_type == ApiFrameType.OTA_FIRMWARE_UPDATE_STATUS:
-        return OTAFirmwareUpdateStatusPacket.create_packet(packet_bytearray, operating_mode)
+    parser = _FRAME_PARSERS.get(packet_bytearray[3])
+    if parser is not None:
+        return parser(packet_bytearray, operating_mode)
 
     return UnknownXBeePacket.create_packet(packet_bytearray, operating_mode=operating_mode)
-
@@ -997,6 +997,8 @@ class SocketConnectPacket(XBeeAPIPacket):
         Returns:
             Bytearray or String: the destination address.
         """
+        if isinstance(self.__dest_address, bytearray):
+            return self.__dest_address.copy()
         return self.__dest_address
 
     @dest_address.setter
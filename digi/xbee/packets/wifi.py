@@ -516,6 +516,8 @@ class RemoteATCommandWifiPacket(XBeeAPIPacket):
         Returns:
             Bytearray: the AT command parameter.
         """
+        if isinstance(self.__parameter, bytearray):
+            return self.__parameter.copy()
         return self.__parameter
 
     @parameter.setter
@@ -744,6 +746,8 @@ class RemoteATCommandResponseWifiPacket(XBeeAPIPacket):
         Returns:
             Bytearray: the AT command response value.
         """
+        if isinstance(self.__comm_value, bytearray):
+            return self.__comm_value.copy()
         return self.__comm_value
 
     @command_value.setter
@@ -178,11 +178,7 @@ class FirmwareBaudrate(Enum):
         """
         if index is None:
             return FirmwareBaudrate.BD_9600
-        for value in FirmwareBaudrate:
-            if value.index == index:
-                return value
-
-        return None
+        return cls.lookupTable.get(index)
 
     @classmethod
     def get_by_baudrate(cls, baudrate):
@@ -226,6 +222,7 @@ class FirmwareBaudrate(Enum):
         return self.__baudrate
 
 
+FirmwareBaudrate.lookupTable = utils.enum_lookup_table(FirmwareBaudrate, "index")
 FirmwareBaudrate.__doc__ += utils.doc_enum(FirmwareBaudrate)
 
 
@@ -262,11 +259,7 @@ class FirmwareParity(Enum):
         """
         if index is None:
             return FirmwareParity.NONE
-        for value in FirmwareParity:
-            if value.index == index:
-                return value
-
-        return None
+        return cls.lookupTable.get(index)
 
     @classmethod
     def get_by_parity(cls, parity):
@@ -309,6 +302,7 @@ class FirmwareParity(Enum):
         return self.__parity
 
 
+FirmwareParity.lookupTable = utils.enum_lookup_table(FirmwareParity, "index")
 FirmwareParity.__doc__ += utils.doc_enum(FirmwareParity)
 
 
@@ -344,11 +338,7 @@ class FirmwareStopbits(Enum):
         """
         if index is None:
             return FirmwareStopbits.SB_1
-        for value in FirmwareStopbits:
-            if value.index == index:
-                return value
-
-        return None
+        return cls.lookupTable.get(index)
 
     @classmethod
     def get_by_stopbits(cls, stopbits):
@@ -391,6 +381,7 @@ class FirmwareStopbits(Enum):
         return self.__stop_bits
 
 
+FirmwareStopbits.lookupTable = utils.enum_lookup_table(FirmwareStopbits, "index")
 FirmwareStopbits.__doc__ += utils.doc_enum(FirmwareStopbits)
 
 
@@ -424,11 +415,7 @@ class FlashFirmwareOption(Enum):
                 given code, `None` if there is not a `FlashFirmwareOption` with
                 that code.
         """
-        for value in FlashFirmwareOption:
-            if value.code == code:
-                return value
-
-        return None
+        return cls.lookupTable.get(code)
 
     @property
     def code(self):
@@ -451,6 +438,7 @@ class FlashFirmwareOption(Enum):
         return self.__description
 
 
+FlashFirmwareOption.lookupTable = utils.enum_lookup_table(FlashFirmwareOption)
 FlashFirmwareOption.__doc__ += utils.doc_enum(FlashFirmwareOption)
 
 
@@ -485,11 +473,7 @@ class XBeeSettingType(Enum):
             :class:`.XBeeSettingType`: `XBeeSettingType` with the given tag,
                 `None` if there is not a `XBeeSettingType` with that tag.
         """
-        for value in XBeeSettingType:
-            if value.tag == tag:
-                return value
-
-        return None
+        return cls.lookupTable.get(tag)
 
     @property
     def tag(self):
@@ -512,6 +496,7 @@ class XBeeSettingType(Enum):
         return self.__description
 
 
+XBeeSettingType.lookupTable = utils.enum_lookup_table(XBeeSettingType, "tag")
 XBeeSettingType.__doc__ += utils.doc_enum(XBeeSettingType)
 
 
@@ -547,11 +532,7 @@ class XBeeSettingFormat(Enum):
             :class:`.XBeeSettingFormat`: `XBeeSettingFormat` with the given
                 tag, `None` if there is not a `XBeeSettingFormat` with that tag.
         """
-        for value in XBeeSettingFormat:
-            if value.tag == tag:
-                return value
-
-        return None
+        return cls.lookupTable.get(tag)
 
     @property
     def tag(self):
@@ -574,6 +555,7 @@ class XBeeSettingFormat(Enum):
         return self.__description
 
 
+XBeeSettingFormat.lookupTable = utils.enum_lookup_table(XBeeSettingFormat, "tag")
 XBeeSettingFormat.__doc__ += utils.doc_enum(XBeeSettingFormat)
 
 
@@ -12,6 +12,8 @@
 # ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from queue import Queue, Empty
 from threading import Event
@@ -31,6 +33,7 @@ from digi.xbee.models.protocol import XBeeProtocol
 from digi.xbee.models.status import ATCommandStatus
 from digi.xbee.packets import factory
 from digi.xbee.packets.aft import ApiFrameType
+from digi.xbee.packets.base import XBeeAPIPacket
 from digi.xbee.packets.common import ReceivePacket, IODataSampleRxIndicatorPacket
 from digi.xbee.packets.raw import RX64Packet, RX16Packet
 from digi.xbee.util import utils
@@ -44,6 +47,200 @@ MAX_PARALLEL_CALLBACKS = 50
 EXECUTOR = ThreadPoolExecutor(max_workers=MAX_PARALLEL_CALLBACKS)
 
 
+class CallbackDispatcher(metaclass=ABCMeta):
+    """
+    This class represents the strategy used by an :class:`.XBeeEvent` to
+    execute its callbacks when it is fired.
+    """
+
+    _log = logging.getLogger(__name__)
+    """
+    Logger.
+    """
+
+    @abstractmethod
+    def dispatch(self, func, *args, **kwargs):
+        """
+        Schedules the execution of the given callback with the provided
+        arguments.
+
+        Args:
+            func (Function): The callback to execute.
+            *args: Positional arguments of the callback.
+            **kwargs: Keyword arguments of the callback.
+
+        Returns:
+            Boolean: `True` if the callback was scheduled, `False` if it was
+                discarded.
+        """
+
+    def shutdown(self, wait=True):
+        """
+        Releases the resources of this dispatcher. Callbacks cannot be
+        dispatched after calling this method.
+
+        Args:
+            wait (Boolean, optional, default=`True`): `True` to wait for the
+                already scheduled callbacks to finish, `False` otherwise.
+        """
+
+    def _execution_failed(self, func, exc):
+        """
+        Reports an exception raised by a callback.
+
+        Args:
+            func (Function): The callback that failed.
+            exc (Exception): The raised exception.
+        """
+        self._log.error("Error executing callback %s: %s",
+                        getattr(func, "__name__", repr(func)), repr(exc),
+                        exc_info=exc)
+
+
+class InlineDispatcher(CallbackDispatcher):
+    """
+    This dispatcher executes callbacks in the thread that fires the event,
+    that is, the packet listener thread for received packets.
+
+    Callbacks are executed in the order packets are received and no memory
+    is used to queue them, but a callback must not block: packets are not
+    read while it is running, so it must not wait for the response of any
+    request sent to the XBee.
+    """
+
+    def dispatch(self, func, *args, **kwargs):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`.CallbackDispatcher.dispatch`
+        """
+        try:
+            func(*args, **kwargs)
+        except Exception as exc:
+            self._execution_failed(func, exc)
+
+        return True
+
+
+class PoolDispatcher(CallbackDispatcher):
+    """
+    This dispatcher executes callbacks in a pool of threads.
+
+    The number of callbacks waiting or running in the pool can be limited.
+    When the limit is reached, new callbacks wait for a free slot (blocking
+    the thread that fires the event) or are discarded.
+    """
+
+    def __init__(self, max_workers=MAX_PARALLEL_CALLBACKS, max_pending=None,
+                 block=True, executor=None):
+        """
+        Class constructor. Instantiates a new :class:`.PoolDispatcher` with
+        the provided parameters.
+
+        Args:
+            max_workers (Integer, optional, default=50): Number of threads of
+                the pool. Ignored if `executor` is provided.
+            max_pending (Integer, optional, default=`None`): Maximum number of
+                callbacks waiting or running in the pool. `None` for no limit.
+            block (Boolean, optional, default=`True`): `True` to wait for a
+                free slot when `max_pending` is reached, `False` to discard
+                the callback.
+            executor (:class:`concurrent.futures.Executor`, optional,
+                default=`None`): Executor to use. `None` to create one.
+
+        Raises:
+            ValueError: If `max_workers` or `max_pending` is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("Number of workers must be greater than 0")
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("Maximum pending callbacks must be greater than 0")
+
+        self._executor = (executor if executor is not None
+                          else ThreadPoolExecutor(max_workers=max_workers))
+        self.__slots = (threading.BoundedSemaphore(max_pending)
+                        if max_pending is not None else None)
+        self.__block = block
+
+    def dispatch(self, func, *args, **kwargs):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`.CallbackDispatcher.dispatch`
+        """
+        if self.__slots is not None and not self.__slots.acquire(blocking=self.__block):
+            self._log.warning("Callback %s discarded: too many pending callbacks",
+                              getattr(func, "__name__", repr(func)))
+            return False
+
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except Exception:
+            # Not scheduled (for example, the executor is shut down)
+            if self.__slots is not None:
+                self.__slots.release()
+            raise
+        future.add_done_callback(
+            lambda fut: self.__execution_finished(func, fut))
+
+        return True
+
+    def shutdown(self, wait=True):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`.CallbackDispatcher.shutdown`
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __execution_finished(self, func, future):
+        """
+        Called when the execution of the callable has finished.
+
+        Args:
+            func (Function): The executed callable.
+            future (:class:`.Future`): Future associated to the execution of
+                the callable.
+        """
+        if self.__slots is not None:
+            self.__slots.release()
+        if future.exception():
+            self._execution_failed(func, future.exception())
+
+
+class OrderedDispatcher(PoolDispatcher):
+    """
+    This dispatcher executes callbacks one by one in a dedicated thread, in
+    the same order they are dispatched.
+    """
+
+    def __init__(self, max_pending=None, block=True):
+        """
+        Class constructor. Instantiates a new :class:`.OrderedDispatcher` with
+        the provided parameters.
+
+        Args:
+            max_pending (Integer, optional, default=`None`): Maximum number of
+                callbacks waiting or running. `None` for no limit.
+            block (Boolean, optional, default=`True`): `True` to wait for a
+                free slot when `max_pending` is reached, `False` to discard
+                the callback.
+
+        .. seealso::
+           | :class:`.PoolDispatcher`
+        """
+        super().__init__(max_workers=1, max_pending=max_pending, block=block)
+
+
+DEFAULT_DISPATCHER = PoolDispatcher(executor=EXECUTOR)
+"""
+Dispatcher used by events without a configured one.
+"""
+
+
 class XBeeEvent(list):
     """
     This class represents a generic XBee event.
@@ -55,15 +252,32 @@ class XBeeEvent(list):
         def callback_prototype(*args, **kwargs):
             #do something...
 
-    All of them will be executed when the event is fired.
+    All of them will be executed when the event is fired, by the configured
+    :class:`.CallbackDispatcher` or :attr:`.DEFAULT_DISPATCHER` if there is
+    not any. Callbacks defined inside the library (frame waits of file system,
+    firmware update, ZDO or socket operations, for example) are always
+    executed by :attr:`.DEFAULT_DISPATCHER`, so a dispatcher that drops
+    callbacks never discards a protocol response.
 
     .. seealso::
        | list (Python standard class)
+       | :class:`.CallbackDispatcher`
     """
+
+    dispatcher = None
+    """
+    :class:`.CallbackDispatcher` to execute the callbacks of this event,
+    `None` to use :attr:`.DEFAULT_DISPATCHER`.
+    """
+
     def __call__(self, *args, **kwargs):
-        for func in self:
-            future = EXECUTOR.submit(func, *args, **kwargs)
-            future.add_done_callback(self.__execution_finished)
+        dispatcher = self.dispatcher if self.dispatcher is not None \
+            else DEFAULT_DISPATCHER
+        for func in list(self):
+            if _is_internal_callback(func):
+                DEFAULT_DISPATCHER.dispatch(func, *args, **kwargs)
+            else:
+                dispatcher.dispatch(func, *args, **kwargs)
 
     def __repr__(self):
         return "Event(%s)" % list.__repr__(self)
@@ -76,19 +290,20 @@ class XBeeEvent(list):
         self.remove(other)
         return self
 
-    def __execution_finished(self, future):
-        """
-        Called when the execution of the callable has finished.
 
-        Args:
-            future (:class:`.Future`): Future associated to the execution of
-                the callable.
+def _is_internal_callback(func):
+    """
+    Returns whether the given callback is defined inside the library.
 
-        Raises:
-            Exception: If the execution of the callable raised any exception.
-        """
-        if future.exception():
-            raise future.exception()
+    Args:
+        func (Function): The callback to check.
+
+    Returns:
+        Boolean: `True` if the callback belongs to the library, `False`
+            otherwise.
+    """
+    module = getattr(func, "__module__", None) or ""
+    return module == __package__ or module.startswith(__package__ + ".")
 
 
 class PacketReceived(XBeeEvent):
@@ -497,7 +712,8 @@ class PacketListener(threading.Thread):
     Logger.
     """
 
-    def __init__(self, comm_iface, xbee_device, queue_max_size=None):
+    def __init__(self, comm_iface, xbee_device, queue_max_size=None,
+                 lazy_packets=False, callback_dispatcher=None):
         """
         Class constructor. Instantiates a new :class:`.PacketListener` object
         with the provided parameters.
@@ -507,6 +723,16 @@ class PacketListener(threading.Thread):
                 interface to listen to.
             xbee_device (:class:`.XBeeDevice`): XBee that is the listener owner.
             queue_max_size (Integer): Maximum size of the XBee queue.
+            lazy_packets (Boolean, optional, default=`False`): `True` to build
+                received packets that decode their fields on first access.
+            callback_dispatcher (:class:`.CallbackDispatcher`, optional,
+                default=`None`): Dispatcher to execute user callbacks. `None`
+                to use :attr:`.DEFAULT_DISPATCHER`. Callbacks registered by
+                the library itself always use :attr:`.DEFAULT_DISPATCHER`.
+
+        .. seealso::
+           | :meth:`.factory.build_frame`
+           | :class:`.CallbackDispatcher`
         """
         threading.Thread.__init__(self)
 
@@ -531,6 +757,19 @@ class PacketListener(threading.Thread):
         self.__dm_route_information_received_from = RouteInformationReceived()
         self.__fs_frame_received = FileSystemFrameReceived()
 
+        self.__user_events = (
+            self.__packet_received, self.__packet_received_from,
+            self.__data_received, self.__modem_status_received,
+            self.__io_sample_received, self.__explicit_packet_received,
+            self.__ip_data_received, self.__sms_received,
+            self.__relay_data_received, self.__bluetooth_data_received,
+            self.__micropython_data_received, self.__socket_state_received,
+            self.__socket_data_received, self.__socket_data_received_from,
+            self.__route_record_indicator_received_from,
+            self.__dm_route_information_received_from, self.__fs_frame_received)
+        self.__callback_dispatcher = None
+        self.callback_dispatcher = callback_dispatcher
+
         # API internal callbacks:
         self.__packet_received_api = xbee_device.get_xbee_device_callbacks()
 
@@ -538,6 +777,11 @@ class PacketListener(threading.Thread):
         self.__comm_iface = comm_iface
         self.__stop = True
         self.__started = Event()
+        self.__lazy_packets = lazy_packets
+
+        # Synchronous requests waiting for a response, indexed by frame ID.
+        self.__pending_requests = {}
+        self.__pending_lock = threading.Lock()
 
         self.__queue_max_size = (queue_max_size if queue_max_size is not None
                                  else self.__DEFAULT_QUEUE_MAX_SIZE)
@@ -581,7 +825,8 @@ class PacketListener(threading.Thread):
                     # Build the packet.
                     try:
                         read_packet = factory.build_frame(
-                            raw_packet, self.__xbee.operating_mode)
+                            raw_packet, self.__xbee.operating_mode,
+                            lazy=self.__lazy_packets)
                     except InvalidPacketException as exc:
                         if self.__xbee.is_open():
                             self._log.error("Error processing packet '%s': %s",
@@ -604,6 +849,9 @@ class PacketListener(threading.Thread):
                     # Execute API internal callbacks.
                     self.__packet_received_api(read_packet)
 
+                    # Notify the synchronous requests waiting for this frame ID.
+                    self.__notify_pending_requests(read_packet)
+
                     # Execute all user callbacks.
                     self.__execute_user_callbacks(read_packet, remote)
         except Exception as exc:
@@ -624,6 +872,54 @@ class PacketListener(threading.Thread):
         # Wait until thread fully stops.
         self.join()
 
+    @property
+    def lazy_packets(self):
+        """
+        Returns whether received packets decode their fields on first access.
+
+        Returns:
+            Boolean: `True` if packets are lazily decoded, `False` otherwise.
+        """
+        return self.__lazy_packets
+
+    @lazy_packets.setter
+    def lazy_packets(self, lazy_packets):
+        """
+        Sets whether received packets decode their fields on first access.
+
+        Args:
+            lazy_packets (Boolean): `True` to lazily decode packets, `False`
+                otherwise.
+        """
+        self.__lazy_packets = lazy_packets
+
+    @property
+    def callback_dispatcher(self):
+        """
+        Returns the dispatcher that executes user callbacks.
+
+        Returns:
+            :class:`.CallbackDispatcher`: The dispatcher, `None` if
+                :attr:`.DEFAULT_DISPATCHER` is used.
+        """
+        return self.__callback_dispatcher
+
+    @callback_dispatcher.setter
+    def callback_dispatcher(self, dispatcher):
+        """
+        Sets the dispatcher that executes user callbacks. Callbacks
+        registered by the library itself (file system, firmware update, ZDO,
+        socket or IO sample waits) are not affected and are always executed
+        by :attr:`.DEFAULT_DISPATCHER`.
+
+        Args:
+            dispatcher (:class:`.CallbackDispatcher`): The dispatcher, `None`
+                to use :attr:`.DEFAULT_DISPATCHER`.
+        """
+        self.__callback_dispatcher = dispatcher
+        for event in self.__user_events:
+            event.dispatcher = dispatcher
+
     def is_running(self):
         """
         Returns whether this instance is running or not.
@@ -669,6 +965,37 @@ class PacketListener(threading.Thread):
         """
         return self.__ip_xbee_queue
 
+    def add_pending_request(self, frame_id, callback):
+        """
+        Registers a callback for a synchronous request waiting for the
+        response with the given frame ID. The callback is executed from this
+        thread when a packet with that frame ID is received.
+
+        Args:
+            frame_id (Integer): Frame ID of the sent request.
+            callback (Function): The callback. Receives one argument.
+
+                * The received packet as a :class:`.XBeeAPIPacket`
+        """
+        with self.__pending_lock:
+            self.__pending_requests.setdefault(frame_id, []).append(callback)
+
+    def del_pending_request(self, frame_id, callback):
+        """
+        Removes a callback registered for the given frame ID.
+
+        Args:
+            frame_id (Integer): Frame ID of the sent request.
+            callback (Function): The callback to remove.
+        """
+        with self.__pending_lock:
+            callbacks = self.__pending_requests.get(frame_id)
+            if not callbacks or callback not in callbacks:
+                return
+            callbacks.remove(callback)
+            if not callbacks:
+                self.__pending_requests.pop(frame_id)
+
     def add_packet_received_callback(self, callback):
         """
         Adds a callback for the event :class:`.PacketReceived`.
@@ -1353,6 +1680,29 @@ class PacketListener(threading.Thread):
         """
         return self.__fs_frame_received
 
+    def __notify_pending_requests(self, packet):
+        """
+        Executes the callbacks of the synchronous requests waiting for a
+        response with the frame ID of the received packet.
+
+        Args:
+            packet (:class:`.XBeePacket`): The received packet.
+        """
+        if not isinstance(packet, XBeeAPIPacket) or not packet.needs_id():
+            return
+
+        with self.__pending_lock:
+            callbacks = self.__pending_requests.get(packet.frame_id)
+            if not callbacks:
+                return
+            callbacks = list(callbacks)
+
+        for callback in callbacks:
+            try:
+                callback(packet)
+            except Exception as exc:
+                self._log.exception(exc)
+
     def __execute_user_callbacks(self, packet, remote=None):
         """
         Executes callbacks corresponding to the received packet.
@@ -1787,8 +2137,25 @@ class PacketListener(threading.Thread):
 class XBeeQueue(Queue):
     """
     This class represents an XBee queue.
+
+    Queued packets are also indexed by frame ID, source address and source IP
+    address, so filtered gets do not need to traverse the queue, and waiting
+    filtered gets are woken up as soon as a new packet is queued.
     """
 
+    _KEY_FRAME_ID = "id"
+    _KEY_64BIT_ADDR = "x64"
+    _KEY_16BIT_ADDR = "x16"
+    _KEY_IP_ADDR = "ip"
+
+    __X64_SRC_TYPES = (ApiFrameType.RECEIVE_PACKET,
+                       ApiFrameType.REMOTE_AT_COMMAND_RESPONSE,
+                       ApiFrameType.RX_64, ApiFrameType.RX_IO_64,
+                       ApiFrameType.EXPLICIT_RX_INDICATOR)
+    __X16_SRC_TYPES = (ApiFrameType.RECEIVE_PACKET,
+                       ApiFrameType.REMOTE_AT_COMMAND_RESPONSE,
+                       ApiFrameType.RX_16, ApiFrameType.RX_IO_16)
+
     def __init__(self, maxsize=10):
         """
         Class constructor. Instantiates a new :class:`.XBeeQueue` with the
@@ -1799,6 +2166,39 @@ class XBeeQueue(Queue):
         """
         Queue.__init__(self, maxsize)
 
+    def _init(self, maxsize):
+        """
+        Override.
+
+        Queued packets are stored by insertion sequence number, so any of them
+        can be removed without traversing the queue.
+        """
+        self.queue = OrderedDict()
+        self.__seq = 0
+        self.__keys = {}
+        self.__index = {}
+
+    def _put(self, item):
+        """
+        Override.
+        """
+        self.__seq += 1
+        self.queue[self.__seq] = item
+        keys = self.__get_keys(item)
+        self.__keys[self.__seq] = keys
+        for key in keys:
+            self.__index.setdefault(key, OrderedDict())[self.__seq] = item
+
+        # Wake up all filtered gets, not only the first waiting one
+        self.not_empty.notify_all()
+
+    def _get(self):
+        """
+        Override.
+        """
+        seq = next(iter(self.queue))
+        return self.__remove(seq)
+
     def get(self, block=True, timeout=None):
         """
         Returns the first element of the queue if there is some element ready
@@ -1857,23 +2257,14 @@ class XBeeQueue(Queue):
                 packet available that was sent by `remote` before the timeout
                 expires.
         """
-        if timeout is None:
-            with self.mutex:
-                for packet in self.queue:
-                    if self.__remote_device_match(packet, remote):
-                        self.queue.remove(packet)
-                        return packet
-            return None
-
-        packet = self.get_by_remote(remote)
-        dead_line = time.time() + timeout
-        while packet is None and dead_line > time.time():
-            time.sleep(0.1)
-            packet = self.get_by_remote(remote)
-        if packet is None:
-            raise TimeoutException()
+        keys = []
+        if remote.get_64bit_addr() is not None:
+            keys.append((self._KEY_64BIT_ADDR, remote.get_64bit_addr()))
+        if (remote.get_16bit_addr() is not None
+                and remote.get_16bit_addr() != XBee16BitAddress.UNKNOWN_ADDRESS):
+            keys.append((self._KEY_16BIT_ADDR, remote.get_16bit_addr()))
 
-        return packet
+        return self.__get_by_keys(keys, timeout)
 
     def get_by_ip(self, ip_addr, timeout=None):
         """
@@ -1899,23 +2290,7 @@ class XBeeQueue(Queue):
                 packet available that was sent by `ip_addr` before the timeout
                 expires.
         """
-        if timeout is None:
-            with self.mutex:
-                for packet in self.queue:
-                    if self.__ip_addr_match(packet, ip_addr):
-                        self.queue.remove(packet)
-                        return packet
-            return None
-
-        packet = self.get_by_ip(ip_addr)
-        dead_line = time.time() + timeout
-        while packet is None and dead_line > time.time():
-            time.sleep(0.1)
-            packet = self.get_by_ip(ip_addr)
-        if packet is None:
-            raise TimeoutException()
-
-        return packet
+        return self.__get_by_keys([(self._KEY_IP_ADDR, ip_addr)], timeout)
 
     def get_by_id(self, frame_id, timeout=None):
         """
@@ -1941,23 +2316,7 @@ class XBeeQueue(Queue):
                 packet available that matches the provided frame ID before the
                 timeout expires.
         """
-        if timeout is None:
-            with self.mutex:
-                for packet in self.queue:
-                    if packet.needs_id() and packet.frame_id == frame_id:
-                        self.queue.remove(packet)
-                        return packet
-            return None
-
-        packet = self.get_by_id(frame_id)
-        dead_line = time.time() + timeout
-        while packet is None and dead_line > time.time():
-            time.sleep(0.1)
-            packet = self.get_by_id(frame_id)
-        if packet is None:
-            raise TimeoutException()
-
-        return packet
+        return self.__get_by_keys([(self._KEY_FRAME_ID, frame_id)], timeout)
 
     def flush(self):
         """
@@ -1965,64 +2324,116 @@ class XBeeQueue(Queue):
         """
         with self.mutex:
             self.queue.clear()
+            self.__keys.clear()
+            self.__index.clear()
+            self.not_full.notify_all()
 
-    @staticmethod
-    def __remote_device_match(packet, remote):
+    def __get_by_keys(self, keys, timeout=None):
         """
-        Returns whether or not the source address of the provided XBee packet
-        matches the address of the given remote XBee device.
+        Returns the first packet of the queue indexed by any of the given keys.
+
+        If timeout is `None`, this method is non-blocking, otherwise it waits
+        for a matching packet to be queued until the timeout expires.
 
         Args:
-            packet (:class:`.XBeePacket`): XBee packet to get the address to compare.
-            remote (:class:`.RemoteXBeeDevice`): Remote XBee to get the address
-                to compare.
+            keys (List): List of index keys.
+            timeout (Integer, optional, default=`None`): Timeout in seconds.
 
         Returns:
-            Boolean: `True` if the remote device matches, `False` otherwise.
+            :class:`.XBeeAPIPacket`: The first matching packet, `None` if there
+                is not any and timeout is `None`.
+
+        Raises:
+            TimeoutException: If timeout is not `None` and there is not any
+                matching packet before the timeout expires.
+        """
+        dead_line = time.time() + timeout if timeout is not None else None
+        with self.not_empty:
+            seq = self.__first_seq(keys)
+            while seq is None and dead_line is not None:
+                remaining = dead_line - time.time()
+                if remaining <= 0:
+                    raise TimeoutException()
+                self.not_empty.wait(remaining)
+                seq = self.__first_seq(keys)
+
+            if seq is None:
+                return None
+
+            packet = self.__remove(seq)
+            self.not_full.notify()
+
+            return packet
+
+    def __first_seq(self, keys):
         """
-        f_type = packet.get_frame_type()
-        if f_type == ApiFrameType.RECEIVE_PACKET:
-            if packet.x64bit_source_addr == remote.get_64bit_addr():
-                return True
-            return (remote.get_16bit_addr() != XBee16BitAddress.UNKNOWN_ADDRESS
-                    and packet.x16bit_source_addr == remote.get_16bit_addr())
+        Returns the sequence number of the oldest packet indexed by any of the
+        given keys. The queue mutex must be held.
 
-        if f_type == ApiFrameType.REMOTE_AT_COMMAND_RESPONSE:
-            if packet.x64bit_source_addr == remote.get_64bit_addr():
-                return True
-            return (remote.get_16bit_addr() != XBee16BitAddress.UNKNOWN_ADDRESS
-                    and packet.x16bit_source_addr == remote.get_16bit_addr())
+        Args:
+            keys (List): List of index keys.
 
-        if f_type == ApiFrameType.RX_16:
-            return packet.x16bit_source_addr == remote.get_16bit_addr()
+        Returns:
+            Integer: Sequence number of the packet, `None` if not found.
+        """
+        first = None
+        for key in keys:
+            packets = self.__index.get(key)
+            if not packets:
+                continue
+            seq = next(iter(packets))
+            if first is None or seq < first:
+                first = seq
 
-        if f_type == ApiFrameType.RX_64:
-            return packet.x64bit_source_addr == remote.get_64bit_addr()
+        return first
 
-        if f_type == ApiFrameType.RX_IO_16:
-            return packet.x16bit_source_addr == remote.get_16bit_addr()
+    def __remove(self, seq):
+        """
+        Removes the packet with the given sequence number from the queue and
+        from the indexes. The queue mutex must be held.
 
-        if f_type == ApiFrameType.RX_IO_64:
-            return packet.x64bit_source_addr == remote.get_64bit_addr()
+        Args:
+            seq (Integer): Sequence number of the packet.
 
-        if f_type == ApiFrameType.EXPLICIT_RX_INDICATOR:
-            return packet.x64bit_source_addr == remote.get_64bit_addr()
+        Returns:
+            :class:`.XBeeAPIPacket`: The removed packet.
+        """
+        packet = self.queue.pop(seq)
+        for key in self.__keys.pop(seq, ()):
+            packets = self.__index.get(key)
+            if packets is None:
+                continue
+            packets.pop(seq, None)
+            if not packets:
+                del self.__index[key]
 
-        return False
+        return packet
 
-    @staticmethod
-    def __ip_addr_match(packet, ip_addr):
+    def __get_keys(self, packet):
         """
-        Returns whether or not the IP address of the XBee packet matches the
-        provided one.
+        Returns the index keys of the given packet: its frame ID (if it has
+        one), its source 64-bit and 16-bit addresses, or its source IP
+        address, depending on the packet type.
 
         Args:
-            packet (:class:`.XBeePacket`): XBee packet to get the address to compare.
-            ip_addr (:class:`ipaddress.IPv4Address`): IP address to be compared
-                with the XBee packet's one.
+            packet (:class:`.XBeePacket`): XBee packet to get its keys.
 
         Returns:
-            Boolean: `True` if the IP address matches, `False` otherwise.
+            List: List of index keys.
         """
-        return (packet.get_frame_type() == ApiFrameType.RX_IPV4
-                and packet.source_address == ip_addr)
+        keys = []
+        if not isinstance(packet, XBeeAPIPacket):
+            return keys
+
+        if packet.needs_id():
+            keys.append((self._KEY_FRAME_ID, packet.frame_id))
+
+        f_type = packet.get_frame_type()
+        if f_type in self.__X64_SRC_TYPES:
+            keys.append((self._KEY_64BIT_ADDR, packet.x64bit_source_addr))
+        if f_type in self.__X16_SRC_TYPES:
+            keys.append((self._KEY_16BIT_ADDR, packet.x16bit_source_addr))
+        if f_type == ApiFrameType.RX_IPV4:
+            keys.append((self._KEY_IP_ADDR, packet.source_address))
+
+        return keys
@@ -13,6 +13,9 @@
 # OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 import logging
 import threading
+import time
+
+from concurrent.futures import Future
 
 from digi.xbee.exception import TimeoutException
 from digi.xbee.models.address import XBee64BitAddress, XBee16BitAddress
@@ -217,6 +220,7 @@ class PacketSender:
             updated = changed and apply
             if updated:
                 node._node_id = node_id
+                node._update_network_index()
                 node_fut_apply.pop(param, None)
             elif changed:
                 node_fut_apply.update({param: value})
@@ -227,6 +231,7 @@ class PacketSender:
             updated = changed and apply
             if updated:
                 node._16bit_addr = x16bit_addr
+                node._update_network_index()
                 node_fut_apply.pop(param, None)
             elif changed:
                 node_fut_apply.update({param: value})
@@ -355,15 +360,18 @@ class SyncRequestSender:
         .. seealso::
            | :class:`.XBeePacket`
         """
-        # Add the packet received callback.
-        if self._packet.needs_id():
-            self._xbee.add_packet_received_callback(self._packet_received_cb)
+        # Register to receive the response with the frame ID of the packet.
+        wait_response = (isinstance(self._packet, XBeeAPIPacket)
+                         and self._packet.needs_id())
+        if wait_response:
+            self._xbee._add_pending_request(self._packet.frame_id,
+                                            self._packet_received_cb)
 
         try:
             # Send the packet.
             self._xbee.send_packet(self._packet, sync=False)
 
-            if not self._packet.needs_id():
+            if not wait_response:
                 return None
 
             # Wait for response or timeout.
@@ -381,9 +389,10 @@ class SyncRequestSender:
             # Return the received packet.
             return self._response_list[0]
         finally:
-            # Always remove the packet listener from the list.
-            if self._packet.needs_id():
-                self._xbee.del_packet_received_callback(self._packet_received_cb)
+            # Always remove the request from the pending ones.
+            if wait_response:
+                self._xbee._del_pending_request(self._packet.frame_id,
+                                                self._packet_received_cb)
 
     @property
     def xbee(self):
@@ -424,19 +433,37 @@ class SyncRequestSender:
         Args:
             rcv_packet (:class:`.XBeePacket`): Received packet.
         """
+        if self._is_response(rcv_packet):
+            # Add the received packet to the list and notify the lock.
+            self._lock.acquire()
+            self._response_list.append(rcv_packet)
+            self._lock.notify()
+            self._lock.release()
+
+    def _is_response(self, rcv_packet):
+        """
+        Checks if the provided packet is the response to the sent packet.
+
+        Args:
+            rcv_packet (:class:`.XBeePacket`): Received packet.
+
+        Returns:
+            Boolean: `True` if the packet is the response to the sent packet,
+                `False` otherwise.
+        """
         # Verify that the sent packet is not the received one!
         # This can happen when the echo mode is enabled in the serial port.
         if self._packet == rcv_packet:
-            return
+            return False
 
         if (not isinstance(self._packet, XBeeAPIPacket)
                 or not isinstance(rcv_packet, XBeeAPIPacket)):
-            return
+            return False
 
         # Check if it is the packet we are waiting for.
         if (not rcv_packet.needs_id()
                 or rcv_packet.frame_id != self._packet.frame_id):
-            return
+            return False
 
         s_f_type = self._packet.get_frame_type()
         r_f_type = rcv_packet.get_frame_type()
@@ -475,12 +502,7 @@ class SyncRequestSender:
         else:
             received_response = True
 
-        if received_response:
-            # Add the received packet to the list and notify the lock.
-            self._lock.acquire()
-            self._response_list.append(rcv_packet)
-            self._lock.notify()
-            self._lock.release()
+        return received_response
 
     def _is_valid_at_response(self, packet):
         """
@@ -624,3 +646,113 @@ class SyncRequestSender:
         # a Socket Listen Response and their socket IDs match.
         return (packet.get_frame_type() == ApiFrameType.SOCKET_LISTEN_RESPONSE
                 and self._packet.socket_id == packet.socket_id)
+
+
+class FutureRequestSender(SyncRequestSender):
+    """
+    Class to send XBee packets without blocking until their response is
+    received. The response is delivered through a
+    :class:`concurrent.futures.Future`, so several requests can be in flight
+    at the same time, each one waiting for its own frame ID.
+    """
+
+    def __init__(self, xbee, packet_to_send, timeout):
+        """
+        Class constructor. Instantiates a new :class:`.FutureRequestSender`
+        object with the provided parameters.
+
+        Args:
+            xbee (:class:`.XBeeDevice`): The local XBee to send the packet.
+            packet_to_send (:class:`.XBeeAPIPacket`): The packet to transmit.
+                It must require a frame ID.
+            timeout (Integer): Number of seconds to wait for the response.
+        """
+        super().__init__(xbee, packet_to_send, timeout)
+        self._future = Future()
+        self._deadline = None
+
+    def send(self):
+        """
+        Sends the packet and returns without waiting for its response.
+
+        Returns:
+            :class:`concurrent.futures.Future`: Future that is completed with
+                the response packet, or with a :class:`.TimeoutException` if
+                :meth:`.expire` is called before the response is received.
+
+        Raises:
+            ValueError: If the packet does not require a frame ID.
+            InvalidOperatingModeException: If the XBee device's operating mode
+                is not API or ESCAPED API. This method only checks the cached
+                value of the operating mode.
+            XBeeException: If the XBee device's communication interface is closed.
+        """
+        if (not isinstance(self._packet, XBeeAPIPacket)
+                or not self._packet.needs_id()):
+            raise ValueError("Packet must require a frame ID.")
+
+        self._xbee._add_pending_request(self._packet.frame_id,
+                                        self._packet_received_cb)
+        try:
+            self._deadline = time.time() + self._timeout
+            self._xbee.send_packet(self._packet, sync=False)
+        except Exception:
+            self._remove()
+            raise
+
+        return self._future
+
+    @property
+    def future(self):
+        """
+        Returns the future completed with the response.
+
+        Returns:
+            :class:`concurrent.futures.Future`: The response future.
+        """
+        return self._future
+
+    @property
+    def deadline(self):
+        """
+        Returns the time (as returned by `time.time()`) when the response
+        timeout expires, or `None` if the packet was not sent yet.
+
+        Returns:
+            Float: Response deadline.
+        """
+        return self._deadline
+
+    def expire(self):
+        """
+        Stops waiting for the response. If it was not received yet, the future
+        is completed with a :class:`.TimeoutException`.
+        """
+        self._remove()
+        with self._lock:
+            if not self._future.done():
+                self._future.set_exception(TimeoutException(
+                    message="Response not received in the configured timeout."))
+
+    def _packet_received_cb(self, rcv_packet):
+        """
+        Override.
+
+        .. seealso::
+           | :meth:`.SyncRequestSender._packet_received_cb`
+        """
+        if not self._is_response(rcv_packet):
+            return
+
+        with self._lock:
+            if self._future.done():
+                return
+            self._future.set_result(rcv_packet)
+        self._remove()
+
+    def _remove(self):
+        """
+        Removes this request from the pending ones of the local XBee.
+        """
+        self._xbee._del_pending_request(self._packet.frame_id,
+                                        self._packet_received_cb)
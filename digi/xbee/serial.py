@@ -37,6 +37,11 @@ class FlowControl(enum.Enum):
     UNKNOWN = 99
 
 
+_HEADER_BYTE = SpecialByte.HEADER_BYTE.code
+_ESCAPE_BYTE = SpecialByte.ESCAPE_BYTE.code
+_UNESCAPE_TABLE = bytes(i ^ 0x20 for i in range(256))
+
+
 class XBeeSerialPort(Serial, XBeeCommunicationInterface):
     """
     This class extends the functionality of Serial class (PySerial).
@@ -44,6 +49,10 @@ class XBeeSerialPort(Serial, XBeeCommunicationInterface):
     It also introduces a minor change in its behaviour: the serial port is not
     automatically open when instantiated, only when calling open().
 
+    In buffered mode, :meth:`.wait_for_frame` reads all the available bytes
+    at once into an internal buffer and extracts complete frames from it,
+    instead of reading the serial port byte by byte.
+
     .. seealso::
        | _PySerial: https://github.com/pyserial/pyserial
     """
@@ -57,7 +66,7 @@ class XBeeSerialPort(Serial, XBeeCommunicationInterface):
     def __init__(self, baud_rate, port, data_bits=__DEFAULT_DATA_BITS,
                  stop_bits=__DEFAULT_STOP_BITS, parity=__DEFAULT_PARITY,
                  flow_control=__DEFAULT_FLOW_CONTROL,
-                 timeout=__DEFAULT_PORT_TIMEOUT):
+                 timeout=__DEFAULT_PORT_TIMEOUT, buffered=False):
         """
         Class constructor. Instantiates a new `XBeeSerialPort` object with the
         given port parameters.
@@ -70,10 +79,15 @@ class XBeeSerialPort(Serial, XBeeCommunicationInterface):
             parity (Char, optional, default=`N`): Parity. Default to 'N' (None).
             flow_control (Integer, optional, default=`None`): Flow control.
             timeout (Integer, optional, default=0.1): Read timeout (seconds).
+            buffered (Boolean, optional, default=`False`): `True` to read
+                frames using an internal receive buffer, `False` to read them
+                byte by byte.
 
         .. seealso::
            | _PySerial: https://github.com/pyserial/pyserial
         """
+        self._buffered = buffered
+        self._rx_buffer = bytearray()
         if flow_control == FlowControl.SOFTWARE:
             Serial.__init__(self, port=None, baudrate=baud_rate,
                             bytesize=data_bits, stopbits=stop_bits,
@@ -106,6 +120,50 @@ class XBeeSerialPort(Serial, XBeeCommunicationInterface):
         """
         return self.isOpen()
 
+    @property
+    def buffered(self):
+        """
+        Returns whether the frames are read using an internal receive buffer.
+
+        Returns:
+            Boolean: `True` if the buffered mode is enabled, `False` otherwise.
+        """
+        return self._buffered
+
+    def close(self):
+        """
+        Closes the serial port and discards any buffered received data.
+
+        .. seealso::
+           | :meth:`.XBeeCommunicationInterface.close`
+        """
+        self._rx_buffer.clear()
+        Serial.close(self)
+
+    def read(self, size=1):
+        """
+        Synchronous. Reads up to `size` bytes from the serial port. Bytes
+        already stored in the internal receive buffer are returned first.
+
+        Args:
+            size (Integer, optional, default=1): Number of bytes to read.
+
+        Returns:
+            Bytes: The read bytes.
+
+        .. seealso::
+           | _PySerial: https://github.com/pyserial/pyserial
+        """
+        if not self._rx_buffer:
+            return Serial.read(self, size)
+
+        data = bytes(self._rx_buffer[:size])
+        del self._rx_buffer[:size]
+        if len(data) < size:
+            data += Serial.read(self, size - len(data))
+
+        return data
+
     def write_frame(self, frame):
         """
         Writes an XBee frame to the underlying hardware interface.
@@ -215,6 +273,9 @@ class XBeeSerialPort(Serial, XBeeCommunicationInterface):
         """
         self._is_reading = True
 
+        if self._buffered:
+            return self.__wait_for_frame_buffered(operating_mode)
+
         try:
             xbee_packet = bytearray(1)
             # Add packet delimiter.
@@ -254,6 +315,123 @@ class XBeeSerialPort(Serial, XBeeCommunicationInterface):
         except digi.xbee.exception.TimeoutException:
             return None
 
+    def __wait_for_frame_buffered(self, operating_mode):
+        """
+        Reads the next packet using the internal receive buffer.
+
+        All the bytes available in the serial port are read at once. Complete
+        frames are extracted from the buffer and the remaining bytes are kept
+        for the next call.
+
+        Args:
+            operating_mode (:class:`.OperatingMode`): The operating mode in
+                which the packet should be read.
+
+        Returns:
+            Bytearray: The read packet (unescaped) as bytearray if a packet is
+                read, `None` otherwise.
+        """
+        escaped = operating_mode == OperatingMode.ESCAPED_API_MODE
+        while self._is_reading:
+            frame = self.__extract_frame(escaped)
+            if frame is not None:
+                return frame
+
+            data = Serial.read(self, self.in_waiting or 1)
+            if not data:
+                # Timeout: discard the pending start delimiter (if any) so the
+                # next call synchronizes with the following frame.
+                if self._rx_buffer:
+                    del self._rx_buffer[:1]
+                return None
+            self._rx_buffer += data
+
+        return None
+
+    def __extract_frame(self, escaped):
+        """
+        Extracts the first complete frame from the internal receive buffer.
+
+        Bytes before the first start delimiter are discarded.
+
+        Args:
+            escaped (Boolean): `True` if the buffer contains escaped data,
+                `False` otherwise.
+
+        Returns:
+            Bytearray: The unescaped frame, `None` if the buffer does not
+                contain a complete frame yet.
+        """
+        buf = self._rx_buffer
+        start = buf.find(_HEADER_BYTE)
+        if start == -1:
+            buf.clear()
+            return None
+        if start > 0:
+            del buf[:start]
+
+        if not escaped:
+            if len(buf) < 3:
+                return None
+            # Header, length (2 bytes), payload and checksum.
+            end = 4 + utils.length_to_int(buf[1:3])
+            if len(buf) < end:
+                return None
+            frame = buf[:end]
+            del buf[:end]
+            return frame
+
+        length_data, pos = self.__unescape_from(buf, 1, 2)
+        if length_data is None:
+            return None
+        # Payload and checksum.
+        data, end = self.__unescape_from(buf, pos,
+                                         utils.length_to_int(length_data) + 1)
+        if data is None:
+            return None
+
+        frame = bytearray((_HEADER_BYTE,))
+        frame += length_data
+        frame += data
+        del buf[:end]
+        return frame
+
+    @staticmethod
+    def __unescape_from(data, start, count):
+        """
+        Un-escapes `count` bytes of the given escaped data starting at the
+        `start` position. Non escaped runs are copied in bulk.
+
+        Args:
+            data (Bytearray): Escaped data.
+            start (Integer): Position of `data` to start un-escaping from.
+            count (Integer): Number of un-escaped bytes to obtain.
+
+        Returns:
+            Tuple (Bytearray, Integer): The un-escaped bytes (`None` if `data`
+                does not contain enough bytes) and the position of `data`
+                after the last consumed byte.
+        """
+        res = bytearray()
+        pos = start
+        size = len(data)
+        while len(res) < count:
+            end = pos + count - len(res)
+            esc = data.find(_ESCAPE_BYTE, pos, end)
+            if esc == -1:
+                if end > size:
+                    return None, start
+                res += data[pos:end]
+                pos = end
+            else:
+                if esc + 1 >= size:
+                    return None, start
+                res += data[pos:esc]
+                res.append(_UNESCAPE_TABLE[data[esc + 1]])
+                pos = esc + 2
+
+        return res, pos
+
     def read_existing(self):
         """
         Asynchronous. Reads all bytes in the serial port buffer. May read 0 bytes.
@@ -261,7 +439,7 @@ class XBeeSerialPort(Serial, XBeeCommunicationInterface):
         Returns:
             Bytearray: The bytes read.
         """
-        return bytearray(self.read(self.inWaiting()))
+        return bytearray(self.read(len(self._rx_buffer) + self.inWaiting()))
 
     def get_read_timeout(self):
         """
@@ -300,5 +478,6 @@ class XBeeSerialPort(Serial, XBeeCommunicationInterface):
         Purges the serial port by cleaning the input and output buffers.
         """
 
+        self._rx_buffer.clear()
         self.reset_input_buffer()
         self.reset_output_buffer()
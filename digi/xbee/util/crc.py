@@ -0,0 +1,122 @@
+# Copyright 2021, Digi International Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""
+Verification sequences used by the file transfer and firmware update
+processes.
+
+All the functions accept any bytes-like object (`bytes`, `bytearray`,
+`memoryview`...), so data blocks can be verified without copying them.
+"""
+
+import binascii
+
+from threading import Lock
+
+CRC16_CCITT_POLYNOMIAL = 0x1021
+"""
+CRC16 CCITT polynomial (XModem and YModem).
+"""
+
+CRC16_IBM_POLYNOMIAL = 0x8005
+"""
+CRC16 IBM polynomial (Digi Gen3 bootloader).
+"""
+
+_CRC16_TABLES = {}
+_CRC16_TABLES_LOCK = Lock()
+
+
+def crc16_ccitt(data, crc=0x0000):
+    """
+    Calculates the CRC16 CCITT (XModem) of the given data.
+
+    Args:
+        data (Bytearray): Data to calculate its CRC.
+        crc (Integer, optional, default=0x0000): Initial value. Use the CRC
+            of the previous data to calculate it in several steps.
+
+    Returns:
+        Integer: The 16-bit CRC of the data.
+    """
+    return binascii.crc_hqx(data, crc)
+
+
+def crc16(data, polynomial, crc=0x0000):
+    """
+    Calculates the CRC16 of the given data with the given polynomial.
+
+    The CRC is calculated most significant bit first, without reflection nor
+    final XOR. A lookup table is built once per polynomial.
+
+    Args:
+        data (Bytearray): Data to calculate its CRC.
+        polynomial (Integer): 16-bit polynomial.
+        crc (Integer, optional, default=0x0000): Initial value. Use the CRC
+            of the previous data to calculate it in several steps.
+
+    Returns:
+        Integer: The 16-bit CRC of the data.
+    """
+    if polynomial == CRC16_CCITT_POLYNOMIAL:
+        return binascii.crc_hqx(data, crc)
+
+    table = _get_crc16_table(polynomial)
+    for byte in data:
+        crc = ((crc << 8) & 0xFF00) ^ table[(crc >> 8) ^ byte]
+
+    return crc
+
+
+def checksum8(data):
+    """
+    Calculates the 8-bit checksum (sum of all the bytes) of the given data.
+
+    Args:
+        data (Bytearray): Data to calculate its checksum.
+
+    Returns:
+        Integer: The checksum of the data.
+    """
+    return sum(data) & 0xFF
+
+
+def _get_crc16_table(polynomial):
+    """
+    Returns the lookup table of the given CRC16 polynomial.
+
+    Args:
+        polynomial (Integer): 16-bit polynomial.
+
+    Returns:
+        Tuple: CRC of each byte value.
+    """
+    table = _CRC16_TABLES.get(polynomial)
+    if table is not None:
+        return table
+
+    values = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ polynomial) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+        values.append(crc)
+
+    with _CRC16_TABLES_LOCK:
+        table = _CRC16_TABLES.setdefault(polynomial, tuple(values))
+
+    return table
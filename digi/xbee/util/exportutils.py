@@ -22,6 +22,10 @@ import datetime
 from xml.etree.ElementTree import Element, SubElement, ElementTree
 
 from digi.xbee.devices import RemoteZigBeeDevice
+from digi.xbee.models.address import XBee64BitAddress, XBee16BitAddress
+from digi.xbee.models.hw import HardwareVersion
+from digi.xbee.models.protocol import XBeeProtocol, Role
+from digi.xbee.models.zdo import RouteStatus
 from digi.xbee.profile import FirmwareParity
 from digi.xbee.util import utils
 
@@ -218,3 +222,86 @@ def _generate_connections_xml(node, connections, level=0):
         last_conn.tail = "\n" + '\t' * (level - 1)
 
     return connections_node
+
+
+def read_network_xml(source):
+    """
+    Reads the network described by an XML generated with
+    :func:`.generate_network_xml`.
+
+    The first device of the XML is considered the local XBee node. Nodes have
+    no timestamp, since the XML does not store when they were last seen.
+
+    Params:
+        source (String or File): Path or file object of the XML.
+
+    Return:
+        Dictionary: The network, in the format used by
+            :func:`digi.xbee.util.netcache.read_network_cache`.
+
+    Raises:
+        ValueError: If the XML does not describe a valid network.
+    """
+    from xml.etree.ElementTree import parse, ParseError
+
+    try:
+        net_node = parse(source).getroot()
+    except ParseError as exc:
+        raise ValueError("Invalid network XML: %s" % str(exc))
+
+    devices = net_node.findall("./devices/device")
+    if net_node.tag != "network" or not devices:
+        raise ValueError("Invalid network XML: no devices found")
+
+    roles = {role.description: role for role in Role}
+    nodes = []
+    links = {}
+    try:
+        protocol = net_node.findtext("protocol")
+        protocol = XBeeProtocol.get(int(protocol)) if protocol else XBeeProtocol.UNKNOWN
+        for device in devices:
+            x64 = XBee64BitAddress.from_hex_string(device.get("address"))
+            hw_version = device.findtext("hw_version")
+            fw_version = device.findtext("fw_version")
+            parent = device.findtext("parent_address")
+            nodes.append({
+                "x64bit_addr": x64,
+                "x16bit_addr": XBee16BitAddress.from_hex_string(
+                    device.findtext("nwk_address")),
+                "node_id": device.findtext("node_id") or "",
+                "role": roles.get(device.findtext("role"), Role.UNKNOWN),
+                "hw_version": HardwareVersion.get(int(hw_version, 16))
+                              if hw_version else None,
+                "fw_version": utils.hex_string_to_bytes(fw_version)
+                              if fw_version else None,
+                "parent": XBee64BitAddress.from_hex_string(parent) if parent else None,
+                "timestamp": None,
+            })
+            for conn in device.findall("./connections/connection"):
+                strength = conn.findtext("strength")
+                status = RouteStatus.get(int(conn.findtext("status")))
+                links[(x64, XBee64BitAddress.from_hex_string(conn.get("address")))] = (
+                    abs(int(strength)) if strength and strength != "?" else None,
+                    status if status else RouteStatus.UNKNOWN)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid network XML: %s" % str(exc))
+
+    # Each connection is listed by both ends, join both directions
+    connections = []
+    for (node_a, node_b), (lq_a2b, st_a2b) in links.items():
+        if (node_b, node_a) in links and node_b.address < node_a.address:
+            continue
+        lq_b2a, st_b2a = links.get((node_b, node_a), (None, RouteStatus.UNKNOWN))
+        connections.append({
+            "node_a": node_a, "node_b": node_b,
+            "lq_a2b": lq_a2b, "lq_b2a": lq_b2a,
+            "status_a2b": st_a2b, "status_b2a": st_b2a,
+        })
+
+    return {
+        "protocol": protocol,
+        "local": nodes[0]["x64bit_addr"],
+        "timestamp": None,
+        "nodes": nodes,
+        "connections": connections,
+    }
@@ -0,0 +1,254 @@
+# Copyright 2021, Digi International Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""
+Read-only firmware and file system images shared by update processes.
+
+An image file is mapped in memory once and its data is returned as
+`memoryview` slices, so sending a block does not read the file again nor
+copy the data. The images opened with :meth:`.ImageSource.open` are shared:
+several update sessions of the same file (for example, the same firmware
+sent to several remote nodes at the same time) use the same mapping.
+
+Block boundaries are calculated for a block size: block `i` starts at
+`i * block_size`. Blank blocks and block checksums are calculated once per
+block size and cached.
+"""
+
+import mmap
+import os
+
+from threading import Lock
+
+
+class ImageSource:
+    """
+    Read-only image file mapped in memory.
+
+    Use :meth:`.ImageSource.open` to get a shared instance, and
+    :meth:`.ImageSource.close` (or a `with` statement) to release it.
+    """
+
+    __sources = {}
+    __sources_lock = Lock()
+
+    def __init__(self, file_path):
+        """
+        Class constructor. Instantiates a new :class:`.ImageSource` mapping
+        the given file.
+
+        Args:
+            file_path (String): Path of the image file.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        self._file_path = file_path
+        self._key = None
+        self._refs = 1
+        self._lock = Lock()
+        self._blank = {}
+        self._checksums = {}
+        self._mmap = None
+        with open(file_path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            # Empty files cannot be mapped
+            if size:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap if self._mmap is not None else b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self._view)
+
+    @classmethod
+    def open(cls, file_path):
+        """
+        Returns the shared image of the given file. The same instance is
+        returned while the file is not modified and the instance is not
+        completely released.
+
+        Args:
+            file_path (String): Path of the image file.
+
+        Returns:
+            :class:`.ImageSource`: The image of the file.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        stat = os.stat(file_path)
+        key = (os.path.realpath(file_path), stat.st_size, stat.st_mtime_ns)
+        with cls.__sources_lock:
+            source = cls.__sources.get(key)
+            if source is not None:
+                with source._lock:
+                    source._refs += 1
+                return source
+            source = cls(file_path)
+            source._key = key
+            cls.__sources[key] = source
+            return source
+
+    def close(self):
+        """
+        Releases the image. The file is unmapped when all the users of a
+        shared image release it.
+        """
+        with ImageSource.__sources_lock:
+            with self._lock:
+                if self._refs <= 0:
+                    return
+                self._refs -= 1
+                if self._refs:
+                    return
+            if self._key is not None and ImageSource.__sources.get(self._key) is self:
+                ImageSource.__sources.pop(self._key)
+
+        self._blank.clear()
+        self._checksums.clear()
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Some returned slices are still in use, the file is
+                # unmapped when they are released
+                pass
+
+    @property
+    def file_path(self):
+        """
+        Returns the path of the image file.
+
+        Returns:
+            String: Path of the image file.
+        """
+        return self._file_path
+
+    @property
+    def size(self):
+        """
+        Returns the size of the image in bytes.
+
+        Returns:
+            Integer: Size of the image.
+        """
+        return len(self._view)
+
+    def read(self, offset, size):
+        """
+        Returns the image data starting at the given offset, without copying
+        it. The returned data is shorter than `size` at the end of the image.
+
+        Args:
+            offset (Integer): Offset of the data.
+            size (Integer): Number of bytes.
+
+        Returns:
+            memoryview: The image data, empty if `offset` is beyond the end
+                of the image.
+        """
+        if offset < 0 or size < 0:
+            raise ValueError("Offset and size must be positive")
+        return self._view[offset:offset + size]
+
+    def num_blocks(self, block_size):
+        """
+        Returns the number of blocks of the given size of the image.
+
+        Args:
+            block_size (Integer): Size of the blocks.
+
+        Returns:
+            Integer: Number of blocks, the last one may be shorter.
+        """
+        return -(-len(self._view) // block_size)
+
+    def get_block(self, index, block_size, pad=None):
+        """
+        Returns a block of the image.
+
+        Args:
+            index (Integer): Index of the block.
+            block_size (Integer): Size of the blocks.
+            pad (Integer, optional, default=`None`): Byte to complete the last
+                block up to `block_size`. `None` to return it shorter.
+
+        Returns:
+            memoryview or Bytearray: The block data. Only a padded last block
+                is copied.
+        """
+        data = self.read(index * block_size, block_size)
+        if pad is None or len(data) == block_size:
+            return data
+
+        padded = bytearray([pad]) * block_size
+        padded[:len(data)] = data
+        return padded
+
+    def is_blank(self, index, block_size, blank=0xFF):
+        """
+        Returns whether all the bytes of a block are the blank byte. The blank
+        blocks of each block size are calculated once.
+
+        Args:
+            index (Integer): Index of the block.
+            block_size (Integer): Size of the blocks.
+            blank (Integer, optional, default=0xFF): Blank byte.
+
+        Returns:
+            Boolean: `True` if the block is blank, `False` otherwise.
+        """
+        key = (block_size, blank)
+        blanks = self._blank.get(key)
+        if blanks is None:
+            full_block = bytes([blank]) * block_size
+            blanks = frozenset(
+                idx for idx in range(self.num_blocks(block_size))
+                if self.read(idx * block_size, block_size)
+                == full_block[:min(block_size, len(self._view) - idx * block_size)])
+            self._blank[key] = blanks
+
+        return index in blanks
+
+    def get_block_checksum(self, index, block_size, func, pad=None):
+        """
+        Returns the checksum of a block calculated with the given function.
+        Each checksum is calculated once and shared by all the users of the
+        image.
+
+        Args:
+            index (Integer): Index of the block.
+            block_size (Integer): Size of the blocks.
+            func (Function): Function to calculate the checksum. Receives the
+                block data and returns the checksum.
+            pad (Integer, optional, default=`None`): Byte to complete the last
+                block up to `block_size`.
+
+        Returns:
+            The checksum returned by `func`.
+        """
+        checksums = self._checksums.setdefault((func, block_size, pad), {})
+        value = checksums.get(index)
+        if value is None:
+            value = func(self.get_block(index, block_size, pad=pad))
+            checksums[index] = value
+
+        return value
@@ -0,0 +1,242 @@
+# Copyright 2021, Digi International Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""
+Binary snapshot of an XBee network.
+
+A network cache file stores the nodes of a network (addresses, node
+identifier, role, hardware and firmware versions, parent and the time each
+node was last seen) and the connections between them, so a network can be
+restored without running a new discovery.
+
+The network is described with dictionaries:
+
+  * Network: `protocol` (:class:`.XBeeProtocol`), `local`
+    (:class:`.XBee64BitAddress` of the local node), `timestamp` (Float, save
+    time), `nodes` (List) and `connections` (List).
+  * Node: `x64bit_addr` (:class:`.XBee64BitAddress`), `x16bit_addr`
+    (:class:`.XBee16BitAddress`), `node_id` (String), `role` (:class:`.Role`),
+    `hw_version` (:class:`.HardwareVersion` or `None`), `fw_version`
+    (Bytearray or `None`), `parent` (:class:`.XBee64BitAddress` or `None`) and
+    `timestamp` (Float or `None` if unknown).
+  * Connection: `node_a`, `node_b` (:class:`.XBee64BitAddress`), `lq_a2b`,
+    `lq_b2a` (Integer or `None`), `status_a2b` and `status_b2a`
+    (:class:`.RouteStatus`).
+"""
+
+import os
+import struct
+import time
+
+from digi.xbee.models.address import XBee64BitAddress, XBee16BitAddress
+from digi.xbee.models.hw import HardwareVersion
+from digi.xbee.models.protocol import XBeeProtocol, Role
+from digi.xbee.models.zdo import RouteStatus
+
+CACHE_VERSION = 1
+"""
+Version of the network cache format.
+"""
+
+_MAGIC = b"XNC"
+_HEADER = struct.Struct(">3sBB8sdII")
+_NODE = struct.Struct(">8s2sBBBd8s")
+_CONNECTION = struct.Struct(">IIiibb")
+
+_FLAG_HW_VERSION = 0x01
+_FLAG_PARENT = 0x02
+_FLAG_TIMESTAMP = 0x04
+
+# Value stored for an unknown link quality.
+_UNKNOWN_LQ = -9999
+
+
+def write_network_cache(file_path, network):
+    """
+    Writes the provided network to a cache file. The file is replaced
+    atomically, so a reader never finds a partially written cache.
+
+    Params:
+        file_path (String): Path of the cache file.
+        network (Dictionary): The network to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+        ValueError: If a connection references a node that is not in the
+            network.
+    """
+    nodes = network["nodes"]
+    connections = network["connections"]
+    indexes = {node["x64bit_addr"]: i for i, node in enumerate(nodes)}
+
+    data = bytearray(_HEADER.pack(
+        _MAGIC, CACHE_VERSION, network["protocol"].code,
+        bytes(network["local"].address), network.get("timestamp") or time.time(),
+        len(nodes), len(connections)))
+
+    for node in nodes:
+        flags = 0
+        if node["hw_version"] is not None:
+            flags |= _FLAG_HW_VERSION
+        if node["parent"] is not None:
+            flags |= _FLAG_PARENT
+        if node["timestamp"] is not None:
+            flags |= _FLAG_TIMESTAMP
+        data += _NODE.pack(
+            bytes(node["x64bit_addr"].address), bytes(node["x16bit_addr"].address),
+            node["role"].id, flags,
+            node["hw_version"].code if node["hw_version"] is not None else 0,
+            node["timestamp"] or 0,
+            bytes(node["parent"].address) if node["parent"] is not None else bytes(8))
+        data += _pack_bytes(node["fw_version"] or b"")
+        data += _pack_bytes((node["node_id"] or "").encode("utf8"))
+
+    for conn in connections:
+        try:
+            idx_a = indexes[conn["node_a"]]
+            idx_b = indexes[conn["node_b"]]
+        except KeyError as exc:
+            raise ValueError("Connection node %s is not in the network" % exc.args[0])
+        data += _CONNECTION.pack(
+            idx_a, idx_b, _lq_to_int(conn["lq_a2b"]), _lq_to_int(conn["lq_b2a"]),
+            conn["status_a2b"].id, conn["status_b2a"].id)
+
+    tmp_path = "%s.tmp" % file_path
+    with open(tmp_path, "wb") as file:
+        file.write(data)
+    os.replace(tmp_path, file_path)
+
+
+def read_network_cache(file_path):
+    """
+    Reads the network stored in the provided cache file.
+
+    Params:
+        file_path (String): Path of the cache file.
+
+    Returns:
+        Dictionary: The network read from the file.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a valid network cache or its version is
+            not supported.
+    """
+    with open(file_path, "rb") as file:
+        data = file.read()
+
+    try:
+        magic, version, protocol, local, timestamp, n_nodes, n_conns = \
+            _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError("Not a network cache file")
+        if version != CACHE_VERSION:
+            raise ValueError("Unsupported network cache version: %d" % version)
+
+        offset = _HEADER.size
+        nodes = []
+        for _ in range(n_nodes):
+            x64, x16, role, flags, hw_code, node_time, parent = \
+                _NODE.unpack_from(data, offset)
+            offset += _NODE.size
+            fw_version, offset = _unpack_bytes(data, offset)
+            node_id, offset = _unpack_bytes(data, offset)
+            nodes.append({
+                "x64bit_addr": XBee64BitAddress(x64),
+                "x16bit_addr": XBee16BitAddress(x16),
+                "node_id": node_id.decode("utf8", errors="ignore"),
+                "role": Role.get(role),
+                "hw_version": HardwareVersion.get(hw_code)
+                              if flags & _FLAG_HW_VERSION else None,
+                "fw_version": bytearray(fw_version) if fw_version else None,
+                "parent": XBee64BitAddress(parent) if flags & _FLAG_PARENT else None,
+                "timestamp": node_time if flags & _FLAG_TIMESTAMP else None,
+            })
+
+        connections = []
+        for _ in range(n_conns):
+            idx_a, idx_b, lq_a2b, lq_b2a, st_a2b, st_b2a = \
+                _CONNECTION.unpack_from(data, offset)
+            offset += _CONNECTION.size
+            connections.append({
+                "node_a": nodes[idx_a]["x64bit_addr"],
+                "node_b": nodes[idx_b]["x64bit_addr"],
+                "lq_a2b": None if lq_a2b == _UNKNOWN_LQ else lq_a2b,
+                "lq_b2a": None if lq_b2a == _UNKNOWN_LQ else lq_b2a,
+                "status_a2b": RouteStatus.get(st_a2b) or RouteStatus.UNKNOWN,
+                "status_b2a": RouteStatus.get(st_b2a) or RouteStatus.UNKNOWN,
+            })
+    except (struct.error, IndexError) as exc:
+        raise ValueError("Corrupted network cache file: %s" % str(exc))
+
+    return {
+        "protocol": XBeeProtocol.get(protocol),
+        "local": XBee64BitAddress(local),
+        "timestamp": timestamp,
+        "nodes": nodes,
+        "connections": connections,
+    }
+
+
+def _pack_bytes(value):
+    """
+    Returns the provided bytes prefixed with their length.
+
+    Params:
+        value (Bytes): The bytes to pack, 255 at most.
+
+    Returns:
+        Bytes: The packed bytes.
+
+    Raises:
+        ValueError: If `value` is longer than 255 bytes.
+    """
+    if len(value) > 0xFF:
+        raise ValueError("Value cannot be longer than 255 bytes")
+    return bytes((len(value),)) + bytes(value)
+
+
+def _unpack_bytes(data, offset):
+    """
+    Returns the length prefixed bytes at the given offset.
+
+    Params:
+        data (Bytes): The data to read from.
+        offset (Integer): Offset of the length byte.
+
+    Returns:
+        Tuple (Bytes, Integer): The bytes and the offset after them.
+
+    Raises:
+        IndexError: If the data is shorter than expected.
+    """
+    length = data[offset]
+    end = offset + 1 + length
+    if end > len(data):
+        raise IndexError("Unexpected end of data")
+    return data[offset + 1:end], end
+
+
+def _lq_to_int(link_quality):
+    """
+    Returns the integer value to store for the provided link quality.
+
+    Params:
+        link_quality (:class:`.LinkQuality` or Integer): The link quality.
+
+    Returns:
+        Integer: The link quality value.
+    """
+    value = getattr(link_quality, "lq", link_quality)
+    return _UNKNOWN_LQ if value is None else value
@@ -321,6 +321,29 @@ def doc_enum(enum_class, descriptions=None):
     return data + "| \n"
 
 
+def enum_lookup_table(enum_class, attr="code"):
+    """
+    Returns a dictionary to look up the values of an enumeration by one of
+    their attributes.
+
+    If several values share the same attribute value, the first one
+    (in definition order) is the one in the dictionary, as when iterating
+    the enumeration to find it.
+
+    Args:
+        enum_class (Enumeration): the Enumeration to index.
+        attr (String, optional, default="code"): name of the attribute to
+            index the enumeration values by.
+
+    Returns:
+        Dictionary: the enumeration values indexed by the given attribute.
+    """
+    table = {}
+    for item in enum_class:
+        table.setdefault(getattr(item, attr), item)
+    return table
+
+
 def enable_logger(name, level=logging.DEBUG):
     """
     Enables a logger with the given name and level.
@@ -18,9 +18,14 @@ import time
 
 from enum import Enum
 
-_ERROR_VALUE_DEST_PATH = "Destination path must be a non empty String"
+from digi.xbee.util.crc import CRC16_CCITT_POLYNOMIAL, crc16_ccitt, checksum8
+from digi.xbee.util.imagesource import ImageSource
+
+_ERROR_VALUE_DEST_PATH = "Destination must be a non empty path, a writable file-like object, " \
+                         "a bytearray or a callable function"
 _ERROR_VALUE_READ_CB = "Read callback must be a valid callable function"
-_ERROR_VALUE_SRC_PATH = "Source path must be a non empty String"
+_ERROR_VALUE_SRC_PATH = "Source must be a non empty path, a bytes-like object, " \
+                        "a readable file-like object or an iterable of bytes"
 _ERROR_VALUE_WRITE_CB = "Write callback must be a valid callable function"
 _ERROR_XMODEM_BAD_BLOCK_NUMBER = "Bad block number in block #%d (received %d)"
 _ERROR_XMODEM_BAD_DATA = "Data verification failed"
@@ -36,13 +41,15 @@ _ERROR_XMODEM_UNEXPECTED_EOT = "Unexpected end of transmission"
 _ERROR_XMODEM_TRANSFER_NAK = "XModem packet not acknowledged after %s retries"
 _ERROR_XMODEM_WRITE_TO_FILE = "Could not write data to file '%s': %s"
 
+_DEFAULT_FILE_NAME = "file"
+
 _PADDING_BYTE_XMODEM = 0xFF
 _PADDING_BYTE_YMODEM = 0x1A
 
 XMODEM_ACK = 0x06  # Packet acknowledged.
 XMODEM_CAN = 0x18  # Cancel transmission.
 XMODEM_CRC = "C"
-XMODEM_CRC_POLYNOMINAL = 0x1021
+XMODEM_CRC_POLYNOMINAL = CRC16_CCITT_POLYNOMIAL
 XMODEM_EOT = 0x04  # End of transmission.
 XMODEM_NAK = 0x15  # Packet not acknowledged.
 XMODEM_SOH = 0x01  # Start of header (128 data bytes).
@@ -170,53 +177,263 @@ class _XModemVerificationMode(Enum):
         return self.__byte
 
 
+class XModemStats:
+    """
+    This class represents the statistics of a XModem/YModem transfer.
+    """
+
+    def __init__(self):
+        """
+        Class constructor. Instantiates a new :class:`.XModemStats`.
+        """
+        self._bytes = 0
+        self._blocks = 0
+        self._retries = 0
+        self._start_time = None
+        self._end_time = None
+
+    def __str__(self):
+        return "%d bytes in %d blocks, %.2f s (%.0f bytes/s), %d retries" \
+               % (self._bytes, self._blocks, self.elapsed_time,
+                  self.throughput, self._retries)
+
+    @property
+    def transferred_bytes(self):
+        """
+        Returns the number of data bytes transferred, without protocol
+        overheads nor padding.
+
+        Returns:
+            Integer: the number of data bytes transferred.
+        """
+        return self._bytes
+
+    @property
+    def blocks(self):
+        """
+        Returns the number of data blocks transferred.
+
+        Returns:
+            Integer: the number of data blocks transferred.
+        """
+        return self._blocks
+
+    @property
+    def retries(self):
+        """
+        Returns the number of times a block was sent or requested again.
+
+        Returns:
+            Integer: the number of retries.
+        """
+        return self._retries
+
+    @property
+    def elapsed_time(self):
+        """
+        Returns the duration of the transfer.
+
+        Returns:
+            Float: the duration of the transfer in seconds.
+        """
+        if self._start_time is None:
+            return 0.0
+        end_time = self._end_time if self._end_time is not None else time.time()
+        return end_time - self._start_time
+
+    @property
+    def throughput(self):
+        """
+        Returns the data throughput of the transfer.
+
+        Returns:
+            Float: the transferred data bytes per second.
+        """
+        elapsed = self.elapsed_time
+        return self._bytes / elapsed if elapsed > 0 else 0.0
+
+
 class _TransferFile:
     """
-    Helper class used to read and split the file to transfer in data chunks.
+    Helper class used to read and split the data to transfer in data chunks.
+
+    The data can be read from a file, a bytes-like object, a readable
+    file-like object or an iterable of bytes-like objects.
     """
 
-    def __init__(self, file_path, mode):
+    def __init__(self, src, mode, name=None):
         """
         Class constructor. Instantiates a new :class:`._TransferFile` with the
         given parameters.
 
         Args:
-            file_path (String): location of the file.
+            src (String, Bytearray, file-like object or iterable): location of
+                the file or data to transfer.
             mode (:class:`._XModemMode`): the XModem transfer mode.
+            name (String, optional): name of the data to transfer. Defaults to
+                the file name.
         """
-        self._file_path = file_path
+        self._src = src
         self._mode = mode
+        self._source = None
+        self._chunk = None
+        self._data = None
+        self._read_bytes = 0
+        self._mod_time = None
+        if isinstance(src, str):
+            self._size = os.stat(src).st_size
+            self._mod_time = int(os.path.getctime(src))
+            file_name = src
+        else:
+            file_name = getattr(src, "name", None)
+            if isinstance(src, (bytes, bytearray, memoryview)):
+                self._src = memoryview(src).cast("B")
+                self._size = len(self._src)
+            elif hasattr(src, "read"):
+                self._size = _get_stream_size(src)
+            else:
+                self._size = None
+            if self._size is None and mode == _XModemMode.YMODEM:
+                # YModem block 0 includes the size of the data.
+                self._src = memoryview(b"".join(self._read_stream_chunks()))
+                self._size = len(self._src)
+        if name is None:
+            name = os.path.basename(file_name) if isinstance(file_name, str) else ""
+        self._name = name or _DEFAULT_FILE_NAME
         # Calculate the total number of chunks (for percentage purposes later).
-        file_size = os.stat(file_path).st_size
         self._chunk_index = 1
-        self._num_chunks = file_size // mode.block_size
-        if file_size % mode.block_size:
-            self._num_chunks += 1
+        self._num_chunks = None
+        if self._size is not None:
+            self._num_chunks = self._size // mode.block_size
+            if self._size % mode.block_size:
+                self._num_chunks += 1
 
     def get_next_data_chunk(self):
         """
         Returns the next data chunk of this file.
 
         Returns:
-            Bytearray: the next data chunk of the file as byte array.
-        """
-        with open(self._file_path, "rb") as file:
-            while True:
-                read_bytes = file.read(self._mode.block_size)
-                if not read_bytes:
-                    break
-                if len(read_bytes) < self._mode.block_size:
-                    # Since YModem allows for mixed block sizes transmissions,
-                    # optimize the packet size if the last block is < 128 bytes
-                    if len(read_bytes) < _XMODEM_BLOCK_SIZE_128:
-                        data = bytearray([self._mode.eof_pad] * _XMODEM_BLOCK_SIZE_128)
-                    else:
-                        data = bytearray([self._mode.eof_pad] * self._mode.block_size)
-                    data[0:len(read_bytes)] = read_bytes
-                    yield data
+            memoryview or Bytearray: the next data chunk of the file.
+        """
+        block_size = self._mode.block_size
+        for read_bytes in self._read_chunks():
+            self._read_bytes += len(read_bytes)
+            if len(read_bytes) < block_size:
+                # Since YModem allows for mixed block sizes transmissions,
+                # optimize the packet size if the last block is < 128 bytes
+                if len(read_bytes) < _XMODEM_BLOCK_SIZE_128:
+                    data = bytearray([self._mode.eof_pad] * _XMODEM_BLOCK_SIZE_128)
                 else:
-                    yield read_bytes
-                self._chunk_index += 1
+                    data = bytearray([self._mode.eof_pad] * block_size)
+                data[0:len(read_bytes)] = read_bytes
+                self._data = data
+            else:
+                self._data = None
+            self._chunk = read_bytes if self._data is None else self._data
+            yield self._chunk
+            self._chunk_index += 1
+        self._chunk = None
+        self._data = None
+
+    def _read_chunks(self):
+        """
+        Returns the data to transfer split in chunks of the block size. The
+        last chunk may be shorter.
+
+        Returns:
+            memoryview or Bytes: the next chunk of data.
+        """
+        block_size = self._mode.block_size
+        if isinstance(self._src, str):
+            with ImageSource.open(self._src) as self._source:
+                for index in range(self._source.num_blocks(block_size)):
+                    yield self._source.get_block(index, block_size)
+            self._source = None
+        elif isinstance(self._src, memoryview):
+            for offset in range(0, len(self._src), block_size):
+                yield self._src[offset:offset + block_size]
+        else:
+            yield from self._read_stream_chunks()
+
+    def _read_stream_chunks(self):
+        """
+        Returns the data of a file-like object or iterable split in chunks of
+        the block size. The last chunk may be shorter.
+
+        Returns:
+            Bytes: the next chunk of data.
+        """
+        block_size = self._mode.block_size
+        if hasattr(self._src, "read"):
+            chunks = iter(lambda: self._src.read(block_size), b"")
+        else:
+            chunks = iter(self._src)
+        pending = bytearray()
+        for chunk in chunks:
+            pending += chunk
+            while len(pending) >= block_size:
+                yield bytes(pending[:block_size])
+                del pending[:block_size]
+        if pending:
+            yield bytes(pending)
+
+    def get_verification(self, func):
+        """
+        Returns the verification sequence of the current data chunk. The
+        verification of complete file chunks is calculated once per file and
+        shared with other transfers of the same file.
+
+        Args:
+            func (Function): function to calculate the verification sequence.
+
+        Returns:
+            The verification sequence returned by `func`.
+        """
+        if self._source is None or self._data is not None:
+            return func(self._chunk)
+        return self._source.get_block_checksum(
+            self._chunk_index - 1, self._mode.block_size, func)
+
+    @property
+    def name(self):
+        """
+        Returns the name of the data to transfer.
+
+        Returns:
+            String: the name of the data to transfer.
+        """
+        return self._name
+
+    @property
+    def size(self):
+        """
+        Returns the size of the data to transfer.
+
+        Returns:
+            Integer: the size of the data, `None` if it is unknown.
+        """
+        return self._size
+
+    @property
+    def mod_time(self):
+        """
+        Returns the modification time of the file to transfer.
+
+        Returns:
+            Integer: the modification time in seconds since the epoch, `None`
+                if it is unknown.
+        """
+        return self._mod_time
+
+    @property
+    def read_bytes(self):
+        """
+        Returns the number of data bytes read so far, without padding.
+
+        Returns:
+            Integer: the number of data bytes read.
+        """
+        return self._read_bytes
 
     @property
     def num_chunks(self):
@@ -224,7 +441,8 @@ class _TransferFile:
         Returns the total number of data chunks of this file.
 
         Returns:
-            Integer: the total number of data chunks of this file.
+            Integer: the total number of data chunks of this file, `None` if
+                it is unknown.
         """
         return self._num_chunks
 
@@ -244,8 +462,12 @@ class _TransferFile:
         Returns the transfer file progress percent.
 
         Returns:
-            Integer: the transfer file progress percent.
+            Integer: the transfer file progress percent, `None` if the size of
+                the data is unknown.
         """
+        if not self._num_chunks:
+            return None
+
         return (self._chunk_index * 100) // self._num_chunks
 
 
@@ -253,18 +475,22 @@ class _DownloadFile:
     """
     Helper class used to create and write the download file from the given
     data chunks.
+
+    The data can be written to a file, a writable file-like object, a
+    bytearray or a function that receives each data chunk.
     """
 
-    def __init__(self, file_path, mode):
+    def __init__(self, dest, mode):
         """
         Class constructor. Instantiates a new :class:`._DownloadFile` with the
         given parameters.
 
         Args:
-            file_path (String): location of the file.
+            dest (String, file-like object, Bytearray or Function): location
+                of the file or destination of the data.
             mode (:class:`._XModemMode`): the XModem transfer mode.
         """
-        self._file_path = file_path
+        self._dest = dest
         self._mode = mode
         self._size = 0
         self._name = None
@@ -272,6 +498,23 @@ class _DownloadFile:
         self._chunk_index = 1
         self._written_bytes = 0
         self._file = None
+        self._write = None
+
+    def _open(self):
+        """
+        Opens the destination and returns the function to write data to it.
+
+        Returns:
+            Function: the function to write a data chunk.
+        """
+        if isinstance(self._dest, str):
+            self._file = open(self._dest, "wb+")
+            return self._file.write
+        if hasattr(self._dest, "write"):
+            return self._dest.write
+        if isinstance(self._dest, bytearray):
+            return self._dest.extend
+        return self._dest
 
     def write_data_chunk(self, data):
         """
@@ -281,28 +524,42 @@ class _DownloadFile:
             data (Bytearray): the data chunk to write in the file.
         """
         try:
-            if self._file is None:
-                self._file = open(self._file_path, "wb+")
+            if self._write is None:
+                self._write = self._open()
 
             bytes_to_write = len(data)
             # It may happen that the last data block contains padding data.
             # Get rid of it by calculating remaining bytes to write.
             if self._size != 0:
                 bytes_to_write = min(bytes_to_write, self.size - self._written_bytes)
-            self._file.write(data[0:bytes_to_write])
+            self._write(data[0:bytes_to_write])
             self._written_bytes += bytes_to_write
             self._chunk_index += 1
         except Exception as exc:
             self.close_file()
-            raise XModemException(_ERROR_XMODEM_WRITE_TO_FILE % (self._file_path, str(exc)))
+            raise XModemException(_ERROR_XMODEM_WRITE_TO_FILE % (self.dest_name, str(exc)))
 
     def close_file(self):
         """
-        Closes the file.
+        Closes the file. Destinations not opened by this object are not
+        closed.
         """
         if self._file:
             self._file.close()
 
+    @property
+    def dest_name(self):
+        """
+        Returns the name of the destination of the data.
+
+        Returns:
+            String: the name of the destination.
+        """
+        if isinstance(self._dest, str):
+            return self._dest
+        name = getattr(self._dest, "name", None)
+        return name if isinstance(name, str) else type(self._dest).__name__
+
     @property
     def num_chunks(self):
         """
@@ -323,6 +580,16 @@ class _DownloadFile:
         """
         return self._chunk_index
 
+    @property
+    def written_bytes(self):
+        """
+        Returns the number of data bytes written so far.
+
+        Returns:
+            Integer: the number of data bytes written.
+        """
+        return self._written_bytes
+
     @property
     def size(self):
         """
@@ -383,15 +650,26 @@ class _DownloadFile:
 class _XModemTransferSession:
     """
     Helper class used to manage a XModem file transfer session.
+
+    The next blocks are read and built while the remote end acknowledges the
+    previous ones. By default, a block is sent when the previous one is
+    acknowledged (standard XModem). With a window greater than 1, up to that
+    number of blocks are sent before waiting for their acknowledgements. As
+    acknowledgements do not include the block number, if any block fails the
+    answers of the other blocks are discarded and the not acknowledged blocks
+    are sent again one by one. If one of them fails again the next one is
+    sent, as its acknowledgement also confirms the previous blocks.
     """
 
-    def __init__(self, src_path, write_cb, read_cb, mode=_XModemMode.XMODEM, progress_cb=None, log=None):
+    def __init__(self, src_path, write_cb, read_cb, mode=_XModemMode.XMODEM, progress_cb=None, log=None,
+                 window=1, name=None):
         """
         Class constructor. Instantiates a new :class:`._XModemTransferSession`
         with the given parameters.
 
         Args:
-            src_path (String): absolute path of the file to transfer.
+            src_path (String, Bytearray, file-like object or iterable): absolute
+                path of the file to transfer, or data to transfer.
             write_cb (Function): function to execute in order to write data to
                 the remote end. Takes the following arguments:
 
@@ -420,6 +698,10 @@ class _XModemTransferSession:
                     * The progress percentage as integer.
 
             log (:class:`.Logger`, optional): logger used to log transfer debug messages
+            window (Integer, optional): maximum number of blocks sent without
+                being acknowledged. Defaults to 1.
+            name (String, optional): name of the file sent in the YModem block
+                0. Defaults to the name of the source file.
         """
         self._src_path = src_path
         self._write_cb = write_cb
@@ -427,9 +709,23 @@ class _XModemTransferSession:
         self._mode = mode
         self._progress_cb = progress_cb
         self._log = log
+        self._window = max(1, window)
+        self._name = name
         self._seq_index = 0
         self._transfer_file = None
         self._verification_mode = _XModemVerificationMode.CHECKSUM
+        self._percent = None
+        self._stats = XModemStats()
+
+    @property
+    def stats(self):
+        """
+        Returns the statistics of the transfer.
+
+        Returns:
+            :class:`.XModemStats`: the statistics of the transfer.
+        """
+        return self._stats
 
     def _read_verification_mode(self):
         """
@@ -475,17 +771,19 @@ class _XModemTransferSession:
             XModemException: if there is any error transferring the block 0.
         """
         self._seq_index = 0
-        name = str.encode(os.path.basename(self._src_path), encoding='utf-8')
-        size = str.encode(str(os.path.getsize(self._src_path)), encoding='utf-8')
-        mod_time = str.encode(str(oct(int(os.path.getctime(self._src_path)))), encoding='utf-8')
+        name = str.encode(self._transfer_file.name, encoding='utf-8')
+        size = str.encode(str(self._transfer_file.size), encoding='utf-8')
+        mod_time = b""
+        if self._transfer_file.mod_time is not None:
+            mod_time = str.encode(" " + oct(self._transfer_file.mod_time)[2:], encoding='utf-8')
         if (len(name) + len(size) + len(mod_time)) > 110:
             data = bytearray(_XMODEM_BLOCK_SIZE_1K)
         else:
             data = bytearray(_XMODEM_BLOCK_SIZE_128)
         data[0:len(name)] = name
-        data[len(name) + 1:len(name) + 1 + len(size)] = size
-        data[len(name) + len(size) + 1] = str.encode(" ", encoding='utf-8')[0]
-        data[len(name) + len(size) + 2:len(name) + len(size) + len(mod_time)] = mod_time[2:]
+        data[len(name) + 1:len(name) + 1 + len(size) + len(mod_time)] = size + mod_time
+        if self._log:
+            self._log.debug("Sending block 0")
         self._send_next_block(data)
 
     def _send_empty_block_0(self):
@@ -498,20 +796,22 @@ class _XModemTransferSession:
         """
         self._seq_index = 0
         data = bytearray([0] * _XMODEM_BLOCK_SIZE_128)
+        if self._log:
+            self._log.debug("Sending empty header")
         self._send_next_block(data)
 
-    def _send_next_block(self, data):
+    def _build_packet(self, data, verification=None):
         """
-        Sends the next XModem block using the given data chunk.
+        Builds the next XModem packet using the given data chunk.
 
         Args:
             data (Bytearray): data to send in the next block.
+            verification (Bytearray, optional): verification sequence of the
+                data, `None` to calculate it.
 
-        Raises:
-            XModemCancelException: if the transfer is cancelled by the remote end.
-            XModemException: if there is any error transferring the next block.
+        Returns:
+            Bytearray: the XModem packet.
         """
-        # Build XModem packet.
         packet_size = len(data) + 3 + self._verification_mode.length  # Extra 3 bytes for header and seq bytes.
         packet = bytearray(packet_size)
         # Write header, depends on the data block size.
@@ -526,46 +826,182 @@ class _XModemTransferSession:
         # Write data.
         packet[3: 3 + len(data)] = data
         # Write verification byte(s).
+        if verification is None:
+            verification = self._calculate_verification(data)
+        if isinstance(verification, int):
+            # The checksum is a single byte.
+            verification = bytes([verification])
+        packet[packet_size - self._verification_mode.length:packet_size] = verification
+        self._seq_index = (self._seq_index + 1) & 0xFF
+        return packet
+
+    def _calculate_verification(self, data):
+        """
+        Calculates the verification sequence of the given data with the
+        verification mode of the transfer.
+
+        Args:
+            data (Bytearray): data to calculate its verification sequence.
+
+        Returns:
+            Integer or Bytearray: the checksum byte or the CRC bytes.
+        """
         if self._verification_mode == _XModemVerificationMode.CHECKSUM:
-            packet[packet_size - _XModemVerificationMode.CHECKSUM.length:packet_size] = _calculate_checksum(data)
-        elif self._verification_mode == _XModemVerificationMode.CRC_16:
-            packet[packet_size - _XModemVerificationMode.CRC_16.length:packet_size] = _calculate_crc16_ccitt(data)
-        # Send XModem packet.
+            return _calculate_checksum(data)
+        return _calculate_crc16_ccitt(data)
+
+    def _get_data_packets(self):
+        """
+        Returns the packets of the file data. Each packet is built when
+        requested, so it can be prepared while the remote end processes the
+        previous one.
+
+        Returns:
+            Tuple (Integer, Bytearray): the chunk index and the XModem packet.
+        """
+        func = _calculate_checksum \
+            if self._verification_mode == _XModemVerificationMode.CHECKSUM \
+            else _calculate_crc16_ccitt
+        for data_chunk in self._transfer_file.get_next_data_chunk():
+            yield self._transfer_file.chunk_index, self._build_packet(
+                data_chunk, verification=self._transfer_file.get_verification(func))
+
+    def _send_next_block(self, data, verification=None):
+        """
+        Sends the next XModem block using the given data chunk and waits for
+        its acknowledgement.
+
+        Args:
+            data (Bytearray): data to send in the next block.
+            verification (Bytearray, optional): verification sequence of the
+                data, `None` to calculate it.
+
+        Raises:
+            XModemCancelException: if the transfer is cancelled by the remote end.
+            XModemException: if there is any error transferring the next block.
+        """
+        self._send_packets(iter(((0, self._build_packet(data, verification=verification)),)), 1)
+
+    def _send_packets(self, packets, window):
+        """
+        Sends the given XModem packets keeping up to `window` of them not
+        acknowledged. The next packet is requested after writing the current
+        one, so it is built while waiting for the answer of the remote end.
+
+        Args:
+            packets (Iterator): the chunk index and XModem packet of each block.
+                Index 0 is used for header blocks.
+            window (Integer): maximum number of not acknowledged packets.
+
+        Raises:
+            XModemCancelException: if the transfer is cancelled by the remote end.
+            XModemException: if there is any error transferring the packets.
+        """
+        # Blocks written and not acknowledged yet.
+        pending = collections.deque()
+        # After an error, blocks not acknowledged to write again one by one,
+        # and those that failed again.
+        to_resend = collections.deque()
+        failed = collections.deque()
+        next_packet = next(packets, None)
         retries = _XMODEM_WRITE_RETRIES
         answer = None
-        while retries > 0:
-            if self._log:
-                if self._seq_index == 0:
-                    if self._mode == _XModemMode.YMODEM and len(data) == _XModemMode.XMODEM.block_size and data[0] == 0:
-                        self._log.debug("Sending empty header - retry %d" % (_XMODEM_WRITE_RETRIES - retries + 1))
-                    else:
-                        self._log.debug("Sending block 0 - retry %d" % (_XMODEM_WRITE_RETRIES - retries + 1))
+        while next_packet is not None or pending or to_resend:
+            # Fill the window. Blocks to send again are sent one by one.
+            size = 1 if to_resend or failed else window
+            while (to_resend or next_packet is not None) and len(pending) < size:
+                packet = to_resend[0] if to_resend else next_packet
+                if not self._write_packet(packet, retries):
+                    retries -= 1
+                    if retries <= 0:
+                        raise XModemException(_ERROR_XMODEM_TRANSFER_NAK % _XMODEM_WRITE_RETRIES)
+                    continue
+                pending.append(packet)
+                if to_resend:
+                    to_resend.popleft()
                 else:
-                    self._log.debug("Sending chunk %d/%d %d%% - retry %d" % (self._transfer_file.chunk_index,
-                                                                             self._transfer_file.num_chunks,
-                                                                             self._transfer_file.percent,
-                                                                             _XMODEM_WRITE_RETRIES - retries + 1))
-            if not self._write_cb(packet):
-                retries -= 1
-                continue
+                    next_packet = next(packets, None)
             answer = self._read_cb(1, timeout=_XMODEM_READ_DATA_TIMEOUT)
-            if not answer:
-                retries -= 1
-                continue
-            answer = answer[0]
+            answer = answer[0] if answer else None
             if answer == XMODEM_ACK:
-                # Block was sent successfully.
-                break
+                # Block was sent successfully. Blocks are accepted in order,
+                # so the previous ones that failed again were also received
+                # (their acknowledgements were lost).
+                failed.append(pending.popleft())
+                while failed:
+                    index, _packet = failed.popleft()
+                    if index > 0:
+                        self._notify_block_sent(index)
+                retries = _XMODEM_WRITE_RETRIES
+                continue
             if answer == XMODEM_CAN:
                 # Cancel requested from remote device.
                 raise XModemCancelException(_ERROR_XMODEM_CANCELLED)
-            # We got either NAK or something unexpected.
+            # We got either NAK, nothing or something unexpected. Send again
+            # the blocks not acknowledged, one by one.
             retries -= 1
+            if retries <= 0:
+                raise XModemException(_ERROR_XMODEM_TRANSFER_NAK % _XMODEM_WRITE_RETRIES)
+            self._stats._retries += 1
+            if len(pending) + len(to_resend) + len(failed) > 1:
+                # Answers do not include the block number, discard the late
+                # ones so they are not taken as answers of other blocks.
+                self._purge()
+            if to_resend or failed:
+                # Try with the next block, the remote end may already have
+                # this one. Start again from the first one if all failed.
+                failed.extend(pending)
+                if not to_resend:
+                    to_resend.extend(failed)
+                    failed.clear()
+            else:
+                to_resend.extend(pending)
+            pending.clear()
 
-        # Check result.
-        if answer == XMODEM_NAK or retries <= 0:
-            raise XModemException(_ERROR_XMODEM_TRANSFER_NAK % _XMODEM_WRITE_RETRIES)
-        self._seq_index = (self._seq_index + 1) & 0xFF
+    def _write_packet(self, packet, retries):
+        """
+        Writes the given XModem packet to the remote end.
+
+        Args:
+            packet (Tuple): the chunk index and the XModem packet.
+            retries (Integer): remaining retries of the packet.
+
+        Returns:
+            Boolean: `True` if the write succeeded, `False` otherwise.
+        """
+        index, data = packet
+        if self._log and index > 0:
+            self._log.debug("Sending chunk %d/%s - retry %d" % (index,
+                                                                self._transfer_file.num_chunks,
+                                                                _XMODEM_WRITE_RETRIES - retries + 1))
+        return self._write_cb(data)
+
+    def _purge(self):
+        """
+        Purges the remote end by consuming all data until timeout (no data) is
+        received.
+        """
+        if self._log:
+            self._log.debug("Purging remote end...")
+        data = self._read_cb(1, timeout=_XMODEM_READ_DATA_TIMEOUT)
+        while data:
+            data = self._read_cb(1, timeout=_XMODEM_READ_DATA_TIMEOUT)
+
+    def _notify_block_sent(self, index):
+        """
+        Updates the statistics and notifies the progress of the transfer when
+        a data block is acknowledged.
+
+        Args:
+            index (Integer): the chunk index of the acknowledged block.
+        """
+        self._stats._blocks += 1
+        num_chunks = self._transfer_file.num_chunks
+        if self._progress_cb is not None and num_chunks:
+            percent = (index * 100) // num_chunks
+            if percent != self._percent:
+                self._progress_cb(percent)
+                self._percent = percent
 
     def _send_eot(self):
         """
@@ -608,13 +1044,18 @@ class _XModemTransferSession:
         """
         Performs the file transfer operation.
 
+        Returns:
+            :class:`.XModemStats`: the statistics of the transfer.
+
         Raises:
             XModemCancelException: if the transfer is cancelled by the remote end.
             XModemException: if there is any error during the file transfer.
         """
         if self._log:
-            self._log.debug("Sending '%s' file through XModem" % self._src_path)
-        self._transfer_file = _TransferFile(self._src_path, self._mode)
+            self._log.debug("Sending '%s' file through XModem" % (
+                self._src_path if isinstance(self._src_path, str) else type(self._src_path).__name__))
+        self._transfer_file = _TransferFile(self._src_path, self._mode, name=self._name)
+        self._stats._start_time = time.time()
         # Read requested verification mode.
         self._read_verification_mode()
         # Execute special protocol pre-actions.
@@ -623,18 +1064,19 @@ class _XModemTransferSession:
         else:
             self._seq_index = 1
         # Perform file transfer.
-        previous_percent = None
-        for data_chunk in self._transfer_file.get_next_data_chunk():
-            if self._progress_cb is not None and self._transfer_file.percent != previous_percent:
-                self._progress_cb(self._transfer_file.percent)
-                previous_percent = self._transfer_file.percent
-            self._send_next_block(data_chunk)
+        self._send_packets(self._get_data_packets(), self._window)
         # Finish transfer.
         self._send_eot()
         # Execute special protocol post-actions.
         if self._mode == _XModemMode.YMODEM:
             self._read_verification_mode()
             self._send_empty_block_0()
+        self._stats._bytes = self._transfer_file.read_bytes
+        self._stats._end_time = time.time()
+        if self._log:
+            self._log.debug("Transfer finished: %s" % self._stats)
+
+        return self._stats
 
 
 class _XModemReadSession:
@@ -649,7 +1091,10 @@ class _XModemReadSession:
         the given parameters.
 
         Args:
-            dest_path (String): absolute path to store downloaded file in.
+            dest_path (String, file-like object, Bytearray or Function):
+                absolute path to store downloaded file in, writable file-like
+                object or bytearray to append the data to, or function that
+                receives each data chunk.
             write_cb (Function): function to execute in order to write data to
                 the remote end. Takes the following arguments:
 
@@ -689,6 +1134,17 @@ class _XModemReadSession:
         self._log = log
         self._seq_index = 0
         self._download_file = None
+        self._stats = XModemStats()
+
+    @property
+    def stats(self):
+        """
+        Returns the statistics of the transfer.
+
+        Returns:
+            :class:`.XModemStats`: the statistics of the transfer.
+        """
+        return self._stats
 
     def _send_data_with_retries(self, data, retries=_XMODEM_WRITE_RETRIES):
         """
@@ -742,6 +1198,7 @@ class _XModemReadSession:
         """
         if not self._send_data_with_retries(bytes([XMODEM_NAK])):
             raise XModemException(_ERROR_XMODEM_SEND_NAK_BYTE)
+        self._stats._retries += 1
 
     def _purge(self):
         """
@@ -809,38 +1266,29 @@ class _XModemReadSession:
             if header not in (XMODEM_STX, XMODEM_SOH):
                 retries -= 1
                 continue
-            # At this point we have the packet header, SOH/STX. Read the sequence bytes.
-            seq_byte = self._read_cb(1, timeout=_XMODEM_READ_DATA_TIMEOUT)
-            if not seq_byte or len(seq_byte) == 0:
-                raise XModemException(_ERROR_XMODEM_READ_PACKET_TIMEOUT)
-            seq_byte = seq_byte[0]
-            seq_byte_2 = self._read_cb(1, timeout=_XMODEM_READ_DATA_TIMEOUT)
-            if not seq_byte_2 or len(seq_byte_2) == 0:
+            # At this point we have the packet header, SOH/STX. Read the
+            # sequence bytes, data and verification at once.
+            packet_size = 2 + block_size + self._verification_mode.length
+            packet = self._read_cb(packet_size, timeout=_XMODEM_READ_DATA_TIMEOUT)
+            if not packet or len(packet) < 2:
                 raise XModemException(_ERROR_XMODEM_READ_PACKET_TIMEOUT)
+            packet = memoryview(packet)
+            seq_byte = packet[0]
             # Second sequence byte should be the same as first as 1's complement
-            seq_byte_2 = 0xff - seq_byte_2[0]
+            seq_byte_2 = 0xff - packet[1]
             if not (seq_byte == seq_byte_2 == self._seq_index):
                 # Invalid block index.
                 if self._log:
                     self._log.error(_ERROR_XMODEM_BAD_BLOCK_NUMBER % (self._seq_index, seq_byte))
-                # Consume data.
-                self._read_cb(block_size + self._verification_mode.length)
+            elif len(packet) != packet_size:
+                raise XModemException(_ERROR_XMODEM_READ_PACKET_TIMEOUT)
             else:
-                data = self._read_cb(block_size, timeout=_XMODEM_READ_DATA_TIMEOUT)
-                if not data or len(data) != block_size:
-                    raise XModemException(_ERROR_XMODEM_READ_PACKET_TIMEOUT)
-                verification = self._read_cb(self._verification_mode.length, timeout=_XMODEM_READ_DATA_TIMEOUT)
-                if not verification or len(verification) != self._verification_mode.length:
-                    raise XModemException(_ERROR_XMODEM_READ_PACKET_TIMEOUT)
-                data_valid = True
+                data = packet[2:2 + block_size]
+                verification = packet[2 + block_size:]
                 if self._verification_mode == _XModemVerificationMode.CHECKSUM:
-                    checksum = _calculate_checksum(data)
-                    if checksum != verification[0]:
-                        data_valid = False
+                    data_valid = _calculate_checksum(data) == verification[0]
                 else:
-                    crc = _calculate_crc16_ccitt(data)
-                    if crc[0] != verification[0] or crc[1] != verification[1]:
-                        data_valid = False
+                    data_valid = _calculate_crc16_ccitt(data) == verification
                 if data_valid:
                     # ACK packet
                     self._send_ack()
@@ -876,24 +1324,12 @@ class _XModemReadSession:
             self._send_ack()
             return
         # File name is the first data block until a '0' (0x00) is found.
-        index = 0
-        name = bytearray()
-        for byte in data:
-            if byte == 0:
-                break
-            name.append(byte)
-            index += 1
-        name = name.decode(encoding='utf-8')
-        self._download_file.name = name
-        # File size is the next data block until a '0' (0x00) is found.
-        size = bytearray()
-        for byte in data[index + 1:]:
-            if byte == 0:
-                break
-            size.append(byte)
-            index += 1
-        size = int(size.decode(encoding='utf-8'))
-        self._download_file.size = size
+        name, _, info = bytes(data).partition(b"\x00")
+        self._download_file.name = name.decode(encoding='utf-8')
+        # File size is the next field, until a space or a '0' (0x00) is
+        # found. The modification time may follow.
+        size = info.split(b"\x00", 1)[0].split(b" ", 1)[0]
+        self._download_file.size = int(size.decode(encoding='utf-8')) if size else 0
 
         self._send_ack()
         self._seq_index += 1
@@ -902,13 +1338,17 @@ class _XModemReadSession:
         """
         Performs the file read operation.
 
+        Returns:
+            :class:`.XModemStats`: the statistics of the transfer.
+
         Raises:
             XModemCancelException: if the transfer is cancelled by the remote end.
             XModemException: if there is any error during the file read process.
         """
-        if self._log:
-            self._log.debug("Downloading '%s' file through XModem" % self._dest_path)
         self._download_file = _DownloadFile(self._dest_path, self._mode)
+        if self._log:
+            self._log.debug("Downloading '%s' file through XModem" % self._download_file.dest_name)
+        self._stats._start_time = time.time()
         # Notify we are ready to receive data.
         self._send_verification_char()
         # Execute special protocol pre-actions.
@@ -924,12 +1364,19 @@ class _XModemReadSession:
                 self._progress_cb(self._download_file.percent)
                 previous_percent = self._download_file.percent
             self._download_file.write_data_chunk(data)
+            self._stats._blocks += 1
             data = self._read_packet()
         self._download_file.close_file()
         # Execute special protocol post-actions.
         if self._mode == _XModemMode.YMODEM:
             self._send_verification_char()
             self._read_block_0()
+        self._stats._bytes = self._download_file.written_bytes
+        self._stats._end_time = time.time()
+        if self._log:
+            self._log.debug("Download finished: %s" % self._stats)
+
+        return self._stats
 
 
 def _calculate_crc16_ccitt(data):
@@ -943,17 +1390,7 @@ def _calculate_crc16_ccitt(data):
     Returns:
         Bytearray: the CRC16 CCITT verification sequence of the given data as a 2 bytes byte array.
     """
-    crc = 0x0000
-    for val in data:
-        crc ^= val << 8
-        for _ in range(0, 8):
-            if (crc & 0x8000) > 0:
-                crc = (crc << 1) ^ XMODEM_CRC_POLYNOMINAL
-            else:
-                crc = crc << 1
-            crc &= 0xFFFF
-
-    return (crc & 0xFFFF).to_bytes(2, byteorder='big')
+    return crc16_ccitt(data).to_bytes(2, byteorder='big')
 
 
 def _calculate_checksum(data):
@@ -966,12 +1403,60 @@ def _calculate_checksum(data):
     Returns:
         Integer: the checksum verification byte of the given data.
     """
-    checksum = 0
-    for byte in data:
-        char = byte & 0xFF
-        checksum += char
+    return checksum8(data)
+
+
+def _get_stream_size(stream):
+    """
+    Returns the number of bytes from the current position to the end of the
+    given file-like object.
+
+    Args:
+        stream (file-like object): the file-like object.
+
+    Returns:
+        Integer: the remaining size, `None` if the object is not seekable.
+    """
+    try:
+        if not stream.seekable():
+            return None
+        position = stream.tell()
+        end = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+        return end - position
+    except (AttributeError, OSError):
+        return None
+
+
+def _is_valid_source(src):
+    """
+    Returns whether the given object can be the source of a transfer.
+
+    Args:
+        src: the object to check.
+
+    Returns:
+        Boolean: `True` if the object is a valid source, `False` otherwise.
+    """
+    if isinstance(src, str):
+        return len(src) > 0
+    return isinstance(src, (bytes, bytearray, memoryview)) \
+        or hasattr(src, "read") or hasattr(src, "__iter__")
+
+
+def _is_valid_destination(dest):
+    """
+    Returns whether the given object can be the destination of a transfer.
 
-    return checksum & 0xFF
+    Args:
+        dest: the object to check.
+
+    Returns:
+        Boolean: `True` if the object is a valid destination, `False` otherwise.
+    """
+    if isinstance(dest, str):
+        return len(dest) > 0
+    return hasattr(dest, "write") or isinstance(dest, bytearray) or callable(dest)
 
 
 def _get_milliseconds():
@@ -984,12 +1469,15 @@ def _get_milliseconds():
     return int(time.time() * 1000.0)
 
 
-def send_file_xmodem(src_path, write_cb, read_cb, progress_cb=None, log=None):
+def send_file_xmodem(src_path, write_cb, read_cb, progress_cb=None, log=None, window=1):
     """
     Sends a file using the XModem protocol to a remote end.
 
     Args:
-        src_path (String): absolute path of the file to transfer.
+        src_path (String, Bytearray, file-like object or iterable): absolute
+            path of the file to transfer, or data to transfer as a bytes-like
+            object, a readable file-like object or an iterable of bytes-like
+            objects. Data of file-like objects and iterables is streamed.
         write_cb (Function): function to execute in order to write data to the
             remote end. Takes the following arguments:
 
@@ -1015,6 +1503,14 @@ def send_file_xmodem(src_path, write_cb, read_cb, progress_cb=None, log=None):
                 * The progress percentage as integer.
 
         log (:class:`.Logger`, optional): logger used to log transfer debug messages
+        window (Integer, optional): maximum number of blocks sent before
+            waiting for their acknowledgement. Use values greater than 1 only
+            if the remote end reads the next blocks while processing the
+            current one and `write_cb` does not discard received data.
+            Defaults to 1.
+
+    Returns:
+        :class:`.XModemStats`: the statistics of the transfer.
 
     Raises:
         ValueError: if any input value is not valid.
@@ -1022,24 +1518,29 @@ def send_file_xmodem(src_path, write_cb, read_cb, progress_cb=None, log=None):
         XModemException: if there is any error during the file transfer.
     """
     # Sanity checks.
-    if not isinstance(src_path, str) or len(src_path) == 0:
+    if not _is_valid_source(src_path):
         raise ValueError(_ERROR_VALUE_SRC_PATH)
-    if not isinstance(write_cb, collections.Callable):
+    if not callable(write_cb):
         raise ValueError(_ERROR_VALUE_WRITE_CB)
-    if not isinstance(read_cb, collections.Callable):
+    if not callable(read_cb):
         raise ValueError(_ERROR_VALUE_READ_CB)
 
     session = _XModemTransferSession(src_path, write_cb, read_cb, mode=_XModemMode.XMODEM, progress_cb=progress_cb,
-                                     log=log)
-    session.transfer_file()
+                                     log=log, window=window)
+    return session.transfer_file()
 
 
-def send_file_ymodem(src_path, write_cb, read_cb, progress_cb=None, log=None):
+def send_file_ymodem(src_path, write_cb, read_cb, progress_cb=None, log=None, window=1, name=None):
     """
     Sends a file using the YModem protocol to a remote end.
 
     Args:
-        src_path (String): absolute path of the file to transfer.
+        src_path (String, Bytearray, file-like object or iterable): absolute
+            path of the file to transfer, or data to transfer as a bytes-like
+            object, a readable file-like object or an iterable of bytes-like
+            objects. Data of seekable file-like objects is streamed, other
+            file-like objects and iterables are read before the transfer to
+            get their size.
         write_cb (Function): function to execute in order to write data to the
             remote end. Takes the following arguments:
 
@@ -1065,6 +1566,16 @@ def send_file_ymodem(src_path, write_cb, read_cb, progress_cb=None, log=None):
                 * The progress percentage as integer.
 
         log (:class:`.Logger`, optional): logger used to log transfer debug messages
+        window (Integer, optional): maximum number of blocks sent before
+            waiting for their acknowledgement. Use values greater than 1 only
+            if the remote end reads the next blocks while processing the
+            current one and `write_cb` does not discard received data.
+            Defaults to 1.
+        name (String, optional): file name to send in the YModem header.
+            Defaults to the name of the source file.
+
+    Returns:
+        :class:`.XModemStats`: the statistics of the transfer.
 
     Raises:
         ValueError: if any input value is not valid.
@@ -1072,17 +1583,17 @@ def send_file_ymodem(src_path, write_cb, read_cb, progress_cb=None, log=None):
         XModemException: if there is any error during the file transfer.
     """
     # Sanity checks.
-    if not isinstance(src_path, str) or len(src_path) == 0:
+    if not _is_valid_source(src_path):
         raise ValueError(_ERROR_VALUE_SRC_PATH)
-    if not isinstance(write_cb, collections.Callable):
+    if not callable(write_cb):
         raise ValueError(_ERROR_VALUE_WRITE_CB)
-    if not isinstance(read_cb, collections.Callable):
+    if not callable(read_cb):
         raise ValueError(_ERROR_VALUE_READ_CB)
 
     session = _XModemTransferSession(
         src_path, write_cb, read_cb, mode=_XModemMode.YMODEM,
-        progress_cb=progress_cb, log=log)
-    session.transfer_file()
+        progress_cb=progress_cb, log=log, window=window, name=name)
+    return session.transfer_file()
 
 
 def get_file_ymodem(dest_path, write_cb, read_cb, crc=True, progress_cb=None, log=None):
@@ -1090,7 +1601,10 @@ def get_file_ymodem(dest_path, write_cb, read_cb, crc=True, progress_cb=None, lo
     Retrieves a file using the YModem protocol from a remote end.
 
     Args:
-        dest_path (String): absolute path to store downloaded file in.
+        dest_path (String, file-like object, Bytearray or Function): absolute
+            path to store downloaded file in, writable file-like object or
+            bytearray to append the data to, or function that receives each
+            data chunk as a bytes-like object.
         write_cb (Function): function to execute in order to write data to the
             remote end. Takes the following arguments:
 
@@ -1119,17 +1633,20 @@ def get_file_ymodem(dest_path, write_cb, read_cb, crc=True, progress_cb=None, lo
 
         log (:class:`.Logger`, optional): logger used to log download debug messages
 
+    Returns:
+        :class:`.XModemStats`: the statistics of the transfer.
+
     Raises:
         ValueError: if any input value is not valid.
         XModemCancelException: if the file download is cancelled by the remote end.
         XModemException: if there is any error during the file download process.
     """
     # Sanity checks.
-    if not isinstance(dest_path, str) or len(dest_path) == 0:
+    if not _is_valid_destination(dest_path):
         raise ValueError(_ERROR_VALUE_DEST_PATH)
-    if not isinstance(write_cb, collections.Callable):
+    if not callable(write_cb):
         raise ValueError(_ERROR_VALUE_WRITE_CB)
-    if not isinstance(read_cb, collections.Callable):
+    if not callable(read_cb):
         raise ValueError(_ERROR_VALUE_READ_CB)
 
     if crc:
@@ -1140,4 +1657,4 @@ def get_file_ymodem(dest_path, write_cb, read_cb, crc=True, progress_cb=None, lo
         session = _XModemReadSession(dest_path, write_cb, read_cb, mode=_XModemMode.YMODEM,
                                      verification_mode=_XModemVerificationMode.CHECKSUM,
                                      progress_cb=progress_cb, log=log)
-    session.get_file()
+    return session.get_file()
@@ -0,0 +1,96 @@
+# Copyright 2021, Digi International Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import random
+import timeit
+
+from digi.xbee.devices import XBeeDevice  # Resolves package import order.
+from digi.xbee.util import crc
+
+# Number of executions of each measured operation.
+NUMBER = 200
+# Sizes of the blocks to measure (XModem, YModem and bootloader pages).
+BLOCK_SIZES = (128, 1024, 2048)
+
+
+def legacy_crc16(data, polynomial):
+    """
+    Bit by bit CRC16, as done before the shared CRC module.
+    """
+    value = 0x0000
+    for byte in data:
+        value ^= byte << 8
+        for _ in range(0, 8):
+            if (value & 0x8000) > 0:
+                value = (value << 1) ^ polynomial
+            else:
+                value = value << 1
+            value &= 0xFFFF
+    return value & 0xFFFF
+
+
+def legacy_checksum(data):
+    """
+    Byte by byte checksum, as done before the shared CRC module.
+    """
+    checksum = 0
+    for byte in data:
+        checksum += byte & 0xFF
+    return checksum & 0xFF
+
+
+def measure(name, legacy, current):
+    """
+    Prints the time per call of both implementations and the speedup.
+    """
+    t_legacy = timeit.timeit(legacy, number=NUMBER) / NUMBER * 1e6
+    t_current = timeit.timeit(current, number=NUMBER) / NUMBER * 1e6
+    print(" %-28s %9.2f us %9.2f us %7.1fx"
+          % (name, t_legacy, t_current, t_legacy / t_current))
+
+
+def main():
+
+    print(" +----------------------------+")
+    print(" | CRC Benchmark              |")
+    print(" +----------------------------+\n")
+
+    rnd = random.Random(0)
+
+    # Check both implementations are equivalent.
+    for _ in range(200):
+        data = bytearray(rnd.randrange(256) for _ in range(rnd.randrange(300)))
+        assert crc.crc16_ccitt(data) == legacy_crc16(data, crc.CRC16_CCITT_POLYNOMIAL)
+        assert crc.crc16(data, crc.CRC16_IBM_POLYNOMIAL) \
+            == legacy_crc16(data, crc.CRC16_IBM_POLYNOMIAL)
+        assert crc.checksum8(memoryview(data)) == legacy_checksum(data)
+
+    print(" %-28s %12s %12s %8s" % ("Operation", "Legacy", "Current", "Speedup"))
+    for size in BLOCK_SIZES:
+        data = bytes(rnd.randrange(256) for _ in range(size))
+
+        print(" -- %d bytes" % size)
+        measure("CRC16 CCITT (XModem)",
+                lambda: legacy_crc16(data, crc.CRC16_CCITT_POLYNOMIAL),
+                lambda: crc.crc16_ccitt(data))
+        measure("CRC16 0x8005 (bootloader)",
+                lambda: legacy_crc16(data, crc.CRC16_IBM_POLYNOMIAL),
+                lambda: crc.crc16(data, crc.CRC16_IBM_POLYNOMIAL))
+        measure("checksum",
+                lambda: legacy_checksum(data),
+                lambda: crc.checksum8(data))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# Copyright 2021, Digi International Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import random
+import timeit
+
+from digi.xbee.devices import XBeeDevice  # Resolves package import order.
+from digi.xbee.io import IOSample, IOSampleBatch, IOLine
+
+# Number of executions of each measured operation.
+NUMBER = 20
+# Number of samples of each batch.
+BATCH_SIZES = (100, 1000, 10000)
+# Sample configurations: DIO0, DIO3, DIO5, DIO10 and DIO11, AD0 to AD3 and
+# supply voltage; AD0 to AD3 only; and 802.15.4 DIO0 to DIO8 with AD0 and AD1.
+HEADERS = (bytes((1, 0x0C, 0x29, 0x8F)), bytes((1, 0x00, 0x00, 0x0F)),
+           bytes((1, 0x07, 0xFF)))
+
+
+def random_payload(rnd):
+    """
+    Returns a random IO sample payload for one of the configurations.
+    """
+    header = rnd.choice(HEADERS)
+    sample = IOSample(header + bytes(20))
+    length = len(header) + 2 * (len(sample.analog_values)
+                                + sample.has_power_supply_value()
+                                + sample.has_digital_values())
+    return header + bytes(rnd.randrange(256) for _ in range(length - len(header)))
+
+
+def decode_samples(payloads):
+    """
+    Decodes the payloads one by one with IOSample.
+    """
+    return [IOSample(payload) for payload in payloads]
+
+
+def measure(name, func):
+    """
+    Prints the time per call of the given function.
+    """
+    elapsed = timeit.timeit(func, number=NUMBER) / NUMBER * 1e3
+    print(" %-28s %9.2f ms" % (name, elapsed))
+
+
+def main():
+
+    print(" +----------------------------+")
+    print(" | IO Sample Decode Benchmark |")
+    print(" +----------------------------+\n")
+
+    rnd = random.Random(0)
+
+    # Check the batch decoder is equivalent to IOSample.
+    payloads = [random_payload(rnd) for _ in range(500)]
+    for use_numpy in (False, None):
+        for sample, view in zip(decode_samples(payloads),
+                                IOSampleBatch(payloads, use_numpy=use_numpy)):
+            assert sample.digital_values == view.digital_values
+            assert sample.analog_values == view.analog_values
+            assert sample.power_supply_value == view.power_supply_value
+            assert sample.get_analog_value(IOLine.DIO1_AD1) \
+                == view.get_analog_value(IOLine.DIO1_AD1)
+
+    numpy = IOSampleBatch([payloads[0]]).uses_numpy
+    for size in BATCH_SIZES:
+        payloads = [random_payload(rnd) for _ in range(size)]
+        print(" -- %d samples" % size)
+        measure("IOSample", lambda: decode_samples(payloads))
+        measure("IOSampleBatch (array)",
+                lambda: IOSampleBatch(payloads, use_numpy=False))
+        if numpy:
+            measure("IOSampleBatch (NumPy)",
+                    lambda: IOSampleBatch(payloads, use_numpy=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+# Copyright 2021, Digi International Inc.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import random
+import timeit
+
+from digi.xbee.devices import XBeeDevice  # Resolves package import order.
+from digi.xbee.models.address import XBee64BitAddress, XBee16BitAddress
+from digi.xbee.packets.base import XBeePacket
+from digi.xbee.packets.common import TransmitPacket
+from digi.xbee.util import utils
+
+# Number of executions of each measured operation.
+NUMBER = 2000
+# Number of measurements of each operation, the best one is printed.
+REPEAT = 5
+# Sizes of the payloads to measure.
+PAYLOAD_SIZES = (16, 84, 255)
+
+_ESCAPE_BYTES = (0x7E, 0x7D, 0x11, 0x13)
+
+
+def legacy_escape(data):
+    """
+    Byte by byte escaping, as done before the table-driven implementation.
+    """
+    esc_data = bytearray()
+    for i in data:
+        if i in _ESCAPE_BYTES:
+            esc_data.append(0x7D)
+            esc_data.append(i ^ 0x20)
+        else:
+            esc_data.append(i)
+    return esc_data
+
+
+def legacy_unescape(data):
+    """
+    Byte by byte unescaping, as done before the table-driven implementation.
+    """
+    new_data = bytearray(0)
+    des_escape = False
+    for byte in data:
+        if byte == 0x7D:
+            des_escape = True
+        else:
+            new_data.append(byte ^ 0x20 if des_escape else byte)
+            des_escape = False
+    return new_data
+
+
+def legacy_output(packet, escaped=False):
+    """
+    Packet serialization computing the frame specific data twice, as done
+    before the single pass implementation.
+    """
+    spec = packet.get_frame_spec_data()
+    frame = utils.int_to_length(len(spec)) + spec
+    frame.append(0xFF - (sum(packet.get_frame_spec_data()) & 0xFF))
+    if escaped:
+        frame = legacy_escape(frame)
+    frame.insert(0, 0x7E)
+    return frame
+
+
+def uncached_output(packet, escaped=False):
+    """
+    Packet serialization discarding the cached data first (setting any field
+    discards it), so the packet is serialized every time as the legacy one.
+    """
+    packet.frame_id = packet.frame_id
+    return packet.output(escaped=escaped)
+
+
+def measure(name, legacy, current):
+    """
+    Prints the time per call of both implementations and the speedup.
+    """
+    t_legacy = min(timeit.repeat(legacy, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+    t_current = min(timeit.repeat(current, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+    print(" %-28s %9.2f us %9.2f us %7.1fx"
+          % (name, t_legacy, t_current, t_legacy / t_current))
+
+
+def main():
+
+    print(" +----------------------------+")
+    print(" | Packet Codec Benchmark     |")
+    print(" +----------------------------+\n")
+
+    rnd = random.Random(0)
+
+    # Check both implementations are equivalent.
+    for _ in range(2000):
+        data = bytearray(rnd.choice((0x7E, 0x7D, 0x11, 0x13, rnd.randrange(256)))
+                         for _ in range(rnd.randrange(64)))
+        assert XBeePacket._escape_data(data) == legacy_escape(data)
+        assert XBeePacket.unescape_data(data) == legacy_unescape(data)
+        assert XBeePacket.unescape_data(legacy_escape(data)) == data
+        data *= 4  # Above the bulk unescape threshold.
+        assert XBeePacket.unescape_data(data) == legacy_unescape(data)
+        assert XBeePacket.unescape_data(legacy_escape(data)) == data
+
+    print(" %-28s %12s %12s %8s" % ("Operation", "Legacy", "Current", "Speedup"))
+    for size in PAYLOAD_SIZES:
+        plain = bytearray(rnd.randrange(0x20, 0x7D) for _ in range(size))
+        noisy = bytearray(rnd.randrange(256) for _ in range(size))
+        noisy[::8] = bytearray((0x7E,)) * len(noisy[::8])
+        escaped = legacy_escape(noisy)
+        packet = TransmitPacket(
+            0x7D, XBee64BitAddress.from_hex_string("0013A2007D7E1113"),
+            XBee16BitAddress.from_hex_string("7D11"), 0, 0, rf_data=noisy)
+        assert packet.output(escaped=True) == legacy_output(packet, escaped=True)
+
+        print(" -- %d bytes" % size)
+        measure("escape (no special bytes)",
+                lambda: legacy_escape(plain),
+                lambda: XBeePacket._escape_data(plain))
+        measure("escape (1/8 special bytes)",
+                lambda: legacy_escape(noisy),
+                lambda: XBeePacket._escape_data(noisy))
+        measure("unescape",
+                lambda: legacy_unescape(escaped),
+                lambda: XBeePacket.unescape_data(escaped))
+        measure("output (escaped)",
+                lambda: legacy_output(packet, escaped=True),
+                lambda: uncached_output(packet, escaped=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -60,11 +60,20 @@ def main():
         param = local_xbee.get_parameter("NI")
         assert (param.decode() == ni)
 
+        network = local_xbee.get_network()
+        remote_xbee = network.add_remote(remote_xbee)
+        old_ni = remote_xbee.get_node_id()
+
         ni = ''.join(random.choice(string.ascii_letters) for i in range(random.randint(1, 20)))
         remote_xbee.set_parameter("NI", bytearray(ni, "utf8"))
         param = remote_xbee.get_parameter("NI")
         assert (param.decode() == ni)
 
+        # The network lookups follow the new node identifier.
+        assert (network.get_device_by_node_id(ni) == remote_xbee)
+        if old_ni != ni:
+            assert (network.get_device_by_node_id(old_ni) is None)
+
         print("\nTest finished successfully")
 
     finally:
@@ -57,6 +57,7 @@ setup(
     ],
     extras_require={
         "SRP":  ["srp"],
+        "NumPy":  ["numpy"],
     },
     classifiers=[
         'Development Status :: 5 - Production/Stable',